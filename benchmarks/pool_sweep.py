@@ -0,0 +1,120 @@
+"""
+Sweeps connection pool sizes under concurrent load and reports latency and pool waits.
+
+Each run opens an engine with the given pool size, starts `--concurrency` clients that
+check out a connection, run a query holding it for `--query-ms` and release it, and
+reports throughput, request latency percentiles and the pool's checkout statistics.
+Use it to find the smallest pool that keeps checkout waits out of the tail latency.
+
+    python -m benchmarks.pool_sweep --sizes 5,10,20,40 --concurrency 100 --requests 5000
+
+The database is taken from DATABASE_URL (see .env); the query only sleeps on the server.
+"""
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from src.core.config import settings
+from src.core.pool import InstrumentedPool, PoolStats
+from typing import List
+import argparse
+import asyncio
+import time
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    """
+    Return the nearest-rank percentile of a list of values.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def run(pool_size: int, max_overflow: int, timeout: float, concurrency: int, requests: int, query_ms: float) -> dict:
+    """
+    Run one load test with the given pool configuration.
+
+    Returns:
+        dict: Throughput, latency percentiles, errors and pool statistics.
+    """
+    engine = create_async_engine(
+        settings.database_url,
+        poolclass=InstrumentedPool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=timeout,
+        pool_pre_ping=False,
+    )
+    query = text("SELECT SLEEP(:seconds)")
+    latencies: List[float] = []
+    errors = 0
+    remaining = requests
+
+    async def client() -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            try:
+                async with engine.connect() as conn:
+                    await conn.execute(query, {"seconds": query_ms / 1000})
+            except exc.TimeoutError:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+
+    # Open the pool's connections first so connection setup is not measured
+    async def warm_up() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(warm_up() for _ in range(pool_size)))
+    engine.pool.stats = PoolStats()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    status = engine.pool.status_dict()
+    await engine.dispose()
+
+    return {
+        "pool_size": pool_size,
+        "throughput": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": _percentile(latencies, 50) * 1000,
+        "p95_ms": _percentile(latencies, 95) * 1000,
+        "p99_ms": _percentile(latencies, 99) * 1000,
+        "errors": errors,
+        "wait_ms_mean": status["wait_ms_mean"],
+        "wait_ms_max": status["wait_ms_max"],
+        "timeouts": status["timeouts"],
+    }
+
+
+async def main() -> None:
+    """
+    Parse the command line and print one result row per pool size.
+    """
+    parser = argparse.ArgumentParser(description="Sweep connection pool sizes under concurrent load.")
+    parser.add_argument("--sizes", default="5,10,20,40", help="comma-separated pool sizes to test")
+    parser.add_argument("--max-overflow", type=int, default=0, help="overflow connections per pool")
+    parser.add_argument("--timeout", type=float, default=10.0, help="checkout timeout in seconds")
+    parser.add_argument("--concurrency", type=int, default=100, help="concurrent clients")
+    parser.add_argument("--requests", type=int, default=5000, help="total queries per run")
+    parser.add_argument("--query-ms", type=float, default=5.0, help="time each query holds its connection")
+    arguments = parser.parse_args()
+
+    columns = ("pool_size", "throughput", "p50_ms", "p95_ms", "p99_ms", "wait_ms_mean", "wait_ms_max", "timeouts", "errors")
+    print(" ".join(f"{column:>12}" for column in columns))
+    for size in (int(value) for value in arguments.sizes.split(",")):
+        result = await run(
+            size, arguments.max_overflow, arguments.timeout, arguments.concurrency, arguments.requests, arguments.query_ms
+        )
+        print(" ".join(
+            f"{result[column]:>12.2f}" if isinstance(result[column], float) else f"{result[column]:>12}"
+            for column in columns
+        ))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -5,12 +5,23 @@ from alembic import context
 from src.core.config import settings
 from src.models.base import Base
 from src.features.offices.models.offices import Office
+from src.features.offices.models.office_counts import OfficeCount
+from src.features.offices.models.office_code_sequences import OfficeCodeSequence
+from src.features.offices.models.office_history import OfficeHistory
+from src.features.offices.models.office_tile_clusters import OfficeTileCluster
 from src.features.users.models.privileges import Privilege
 from src.features.users.models.roles import Role
 from src.features.users.models.role_privileges import RolePrivilege
 from src.features.users.models.users import User
 from src.features.users.models.refresh_tokens import RefreshToken
+from src.features.users.models.revoked_tokens import RevokedToken
+from src.features.users.models.authz_versions import AuthzVersion
+from src.features.users.models.user_agents import UserAgent
+from src.features.users.models.org_headcounts import OrgHeadcount
+from src.features.users.models.api_keys import ApiKey
 from src.features.users.models.user_activity import UserActivity
+from src.features.analytics.models.activity_rollups import ActivityRollupHourly, ActivityRollupDaily
+from src.features.analytics.models.rollup_watermarks import RollupWatermark
 # Add imports for additional models here as needed
 
 # This is the Alembic Config object, which provides
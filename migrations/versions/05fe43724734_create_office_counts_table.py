@@ -0,0 +1,42 @@
+"""Create office_counts table
+
+Revision ID: 05fe43724734
+Revises: 883edf75f2a1
+Create Date: 2026-10-19 09:12:31.418207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '05fe43724734'
+down_revision: Union[str, None] = '883edf75f2a1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('office_counts',
+    sa.Column('filter_key', sa.String(length=32), nullable=False),
+    sa.Column('total', sa.BigInteger(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('filter_key')
+    )
+    # Seed the tracked counters from the current contents of the offices table
+    op.execute(
+        """
+        INSERT INTO `office_counts` (`filter_key`, `total`, `updated_at`)
+        SELECT 'all', COUNT(*), NOW() FROM `offices`
+        UNION ALL
+        SELECT 'active:1', COUNT(*), NOW() FROM `offices` WHERE `active` = 1
+        UNION ALL
+        SELECT 'active:0', COUNT(*), NOW() FROM `offices` WHERE `active` = 0;
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('office_counts')
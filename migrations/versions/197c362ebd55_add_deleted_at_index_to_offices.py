@@ -0,0 +1,25 @@
+"""Add deleted_at index to offices
+
+Revision ID: 197c362ebd55
+Revises: d650654d4219
+Create Date: 2026-10-19 10:48:17.530662
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '197c362ebd55'
+down_revision: Union[str, None] = 'd650654d4219'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_offices_deleted_at', 'offices', ['deleted_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_offices_deleted_at', table_name='offices')
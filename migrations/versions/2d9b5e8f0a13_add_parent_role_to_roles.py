@@ -0,0 +1,30 @@
+"""Add parent_role to roles
+
+Revision ID: 2d9b5e8f0a13
+Revises: 7c2e94a0d5f1
+Create Date: 2026-10-19 17:31:44.907216
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2d9b5e8f0a13'
+down_revision: Union[str, None] = '7c2e94a0d5f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('roles', sa.Column('parent_role', sa.String(length=24), nullable=True))
+    op.create_index(op.f('ix_roles_parent_role'), 'roles', ['parent_role'], unique=False)
+    op.create_foreign_key('fk_roles_parent_role', 'roles', 'roles', ['parent_role'], ['role'], ondelete='SET NULL')
+
+
+def downgrade() -> None:
+    op.drop_constraint('fk_roles_parent_role', 'roles', type_='foreignkey')
+    op.drop_index(op.f('ix_roles_parent_role'), table_name='roles')
+    op.drop_column('roles', 'parent_role')
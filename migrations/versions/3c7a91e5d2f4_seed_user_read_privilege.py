@@ -0,0 +1,41 @@
+"""Seed user read privilege
+
+Revision ID: 3c7a91e5d2f4
+Revises: a4d9c2e6f813
+Create Date: 2026-10-19 21:02:47.318506
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c7a91e5d2f4'
+down_revision: Union[str, None] = 'a4d9c2e6f813'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Seed the privilege guarding the user directory and grant it to the administrator role
+    op.execute(
+        """
+        INSERT IGNORE INTO `privileges` (`privilege`, `tag`, `description`, `created_at`, `updated_at`) VALUES
+        ('USER_R', 'USER_MANAGEMENT', 'Allows viewing users and their activity', UTC_TIMESTAMP(), UTC_TIMESTAMP());
+        """
+    )
+    op.execute(
+        """
+        INSERT IGNORE INTO `role_privileges` (`role`, `privilege`, `created_at`, `updated_at`) VALUES
+        ('SYSTEM ADMIN', 'USER_R', UTC_TIMESTAMP(), UTC_TIMESTAMP());
+        """
+    )
+    # Make running workers reload their role privileges
+    op.execute("UPDATE `authz_versions` SET `version` = `version` + 1, `updated_at` = UTC_TIMESTAMP() WHERE `id` = 1;")
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM `role_privileges` WHERE `privilege` = 'USER_R';")
+    op.execute("DELETE FROM `privileges` WHERE `privilege` = 'USER_R';")
+    op.execute("UPDATE `authz_versions` SET `version` = `version` + 1, `updated_at` = UTC_TIMESTAMP() WHERE `id` = 1;")
@@ -0,0 +1,53 @@
+"""Create authz_versions table
+
+Revision ID: 4f61c8a2b9d7
+Revises: 2d9b5e8f0a13
+Create Date: 2026-10-19 17:58:12.640381
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f61c8a2b9d7'
+down_revision: Union[str, None] = '2d9b5e8f0a13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('authz_versions',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.execute(
+        """
+        INSERT INTO `authz_versions` (`id`, `version`, `updated_at`) VALUES (1, 0, UTC_TIMESTAMP());
+        """
+    )
+    # Seed the privileges guarding the role administration API
+    op.execute(
+        """
+        INSERT IGNORE INTO `privileges` (`privilege`, `tag`, `description`, `created_at`, `updated_at`) VALUES
+        ('ROLE_R', 'ROLE_MANAGEMENT', 'Allows viewing roles and privileges', UTC_TIMESTAMP(), UTC_TIMESTAMP()),
+        ('ROLE_W', 'ROLE_MANAGEMENT', 'Allows managing roles, privileges and grants', UTC_TIMESTAMP(), UTC_TIMESTAMP());
+        """
+    )
+    # Grant them to the administrator role; SYS_ALL is not a wildcard
+    op.execute(
+        """
+        INSERT IGNORE INTO `role_privileges` (`role`, `privilege`, `created_at`, `updated_at`) VALUES
+        ('SYSTEM ADMIN', 'ROLE_R', UTC_TIMESTAMP(), UTC_TIMESTAMP()),
+        ('SYSTEM ADMIN', 'ROLE_W', UTC_TIMESTAMP(), UTC_TIMESTAMP());
+        """
+    )
+
+def downgrade() -> None:
+    op.execute("DELETE FROM `role_privileges` WHERE `privilege` IN ('ROLE_R', 'ROLE_W');")
+    op.execute("DELETE FROM `privileges` WHERE `privilege` IN ('ROLE_R', 'ROLE_W');")
+    op.drop_table('authz_versions')
@@ -0,0 +1,31 @@
+"""Create office_code_sequences table
+
+Revision ID: 5b7f0c2d8e41
+Revises: 8e3d52a9c610
+Create Date: 2026-10-19 13:14:08.207751
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b7f0c2d8e41'
+down_revision: Union[str, None] = '8e3d52a9c610'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('office_code_sequences',
+    sa.Column('prefix', sa.String(length=12), nullable=False),
+    sa.Column('next_value', sa.BigInteger(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('prefix')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('office_code_sequences')
@@ -0,0 +1,50 @@
+"""Create org_headcounts table
+
+Revision ID: 5b8e0d3f7a62
+Revises: e7b31a6c0d48
+Create Date: 2026-10-19 19:52:16.873504
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b8e0d3f7a62'
+down_revision: Union[str, None] = 'e7b31a6c0d48'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('org_headcounts',
+    sa.Column('office', sa.String(length=16), nullable=False),
+    sa.Column('role', sa.String(length=24), nullable=False),
+    sa.Column('total', sa.BigInteger(), nullable=False),
+    sa.Column('active', sa.BigInteger(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('office', 'role')
+    )
+    # Seed the (office, role) pairs and the '*' totals per office, per role and overall
+    op.execute(
+        """
+        INSERT INTO `org_headcounts` (`office`, `role`, `total`, `active`, `updated_at`)
+        SELECT COALESCE(`office`, ''), COALESCE(`role`, ''), COUNT(*), SUM(`active`), UTC_TIMESTAMP()
+        FROM `users` WHERE `deleted_at` IS NULL GROUP BY COALESCE(`office`, ''), COALESCE(`role`, '')
+        UNION ALL
+        SELECT COALESCE(`office`, ''), '*', COUNT(*), SUM(`active`), UTC_TIMESTAMP()
+        FROM `users` WHERE `deleted_at` IS NULL GROUP BY COALESCE(`office`, '')
+        UNION ALL
+        SELECT '*', COALESCE(`role`, ''), COUNT(*), SUM(`active`), UTC_TIMESTAMP()
+        FROM `users` WHERE `deleted_at` IS NULL GROUP BY COALESCE(`role`, '')
+        UNION ALL
+        SELECT '*', '*', COUNT(*), COALESCE(SUM(`active`), 0), UTC_TIMESTAMP()
+        FROM `users` WHERE `deleted_at` IS NULL;
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('org_headcounts')
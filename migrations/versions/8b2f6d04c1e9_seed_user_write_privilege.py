@@ -0,0 +1,41 @@
+"""Seed user write privilege
+
+Revision ID: 8b2f6d04c1e9
+Revises: 3c7a91e5d2f4
+Create Date: 2026-10-19 21:09:13.874120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2f6d04c1e9'
+down_revision: Union[str, None] = '3c7a91e5d2f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Seed the privilege guarding user provisioning and grant it to the administrator role
+    op.execute(
+        """
+        INSERT IGNORE INTO `privileges` (`privilege`, `tag`, `description`, `created_at`, `updated_at`) VALUES
+        ('USER_W', 'USER_MANAGEMENT', 'Allows creating and importing users', UTC_TIMESTAMP(), UTC_TIMESTAMP());
+        """
+    )
+    op.execute(
+        """
+        INSERT IGNORE INTO `role_privileges` (`role`, `privilege`, `created_at`, `updated_at`) VALUES
+        ('SYSTEM ADMIN', 'USER_W', UTC_TIMESTAMP(), UTC_TIMESTAMP());
+        """
+    )
+    # Make running workers reload their role privileges
+    op.execute("UPDATE `authz_versions` SET `version` = `version` + 1, `updated_at` = UTC_TIMESTAMP() WHERE `id` = 1;")
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM `role_privileges` WHERE `privilege` = 'USER_W';")
+    op.execute("DELETE FROM `privileges` WHERE `privilege` = 'USER_W';")
+    op.execute("UPDATE `authz_versions` SET `version` = `version` + 1, `updated_at` = UTC_TIMESTAMP() WHERE `id` = 1;")
@@ -0,0 +1,61 @@
+"""Add content_hash to offices
+
+Revision ID: 8e3d52a9c610
+Revises: c4a1e9b07f32
+Create Date: 2026-10-19 12:05:12.664019
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import hashlib
+import json
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e3d52a9c610'
+down_revision: Union[str, None] = 'c4a1e9b07f32'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copy of the hashed fields and normalization as of this revision, so that later
+# changes to the application model do not alter what this migration computes
+CONTENT_HASH_FIELDS = (
+    "name", "o_type", "ph_num1", "ph_num2", "email1", "email2", "website", "gst_num",
+    "pincode", "country", "state", "district", "taluka", "place",
+    "address_line1", "address_line2", "address_line3", "o_lat", "o_long", "notes",
+)
+BACKFILL_BATCH_SIZE = 1000
+
+
+def compute_content_hash(values: dict) -> str:
+    normalized = []
+    for field in CONTENT_HASH_FIELDS:
+        value = values.get(field)
+        if value == "":
+            value = None
+        if value is not None and field in ("o_lat", "o_long"):
+            value = f"{float(value):.8f}"
+        normalized.append(value)
+    payload = json.dumps(normalized, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def upgrade() -> None:
+    op.add_column('offices', sa.Column('content_hash', sa.String(length=64), nullable=True))
+
+    # Backfill the hash of existing offices, one executemany per batch of rows
+    bind = op.get_bind()
+    columns = ", ".join(f"`{field}`" for field in CONTENT_HASH_FIELDS)
+    rows = bind.execute(sa.text(f"SELECT `code`, {columns} FROM `offices`")).mappings().all()
+    update = sa.text("UPDATE `offices` SET `content_hash` = :content_hash WHERE `code` = :code")
+    for start in range(0, len(rows), BACKFILL_BATCH_SIZE):
+        bind.execute(update, [
+            {"content_hash": compute_content_hash(dict(row)), "code": row["code"]}
+            for row in rows[start:start + BACKFILL_BATCH_SIZE]
+        ])
+
+
+def downgrade() -> None:
+    op.drop_column('offices', 'content_hash')
@@ -0,0 +1,72 @@
+"""Partition user_activity by month
+
+Revision ID: 9a3f5d1c7e82
+Revises: 4f61c8a2b9d7
+Create Date: 2026-10-19 18:24:37.118042
+
+"""
+from typing import Sequence, Union
+from datetime import datetime
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a3f5d1c7e82'
+down_revision: Union[str, None] = '4f61c8a2b9d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Monthly partitions created ahead of the current month; later ones are added by
+# src.features.users.services.activity_partition_service
+MONTHS_AHEAD = 3
+
+
+def _add_months(month: datetime, count: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + count
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def upgrade() -> None:
+    # Partitioned InnoDB tables cannot have foreign keys, and every unique key must
+    # include the partitioning column
+    op.execute("ALTER TABLE `user_activity` DROP FOREIGN KEY `user_activity_ibfk_1`;")
+    op.execute(
+        """
+        ALTER TABLE `user_activity`
+            DROP PRIMARY KEY,
+            ADD PRIMARY KEY (`id`, `action_time`),
+            DROP INDEX `user_id`,
+            ADD INDEX `ix_user_activity_user_id_action_time` (`user_id`, `action_time`);
+        """
+    )
+
+    current = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    partitions = [f"PARTITION `p_old` VALUES LESS THAN ('{current:%Y-%m-%d}')"]
+    for offset in range(MONTHS_AHEAD + 1):
+        start = _add_months(current, offset)
+        end = _add_months(current, offset + 1)
+        partitions.append(f"PARTITION `p{start:%Y%m}` VALUES LESS THAN ('{end:%Y-%m-%d}')")
+    partitions.append("PARTITION `p_future` VALUES LESS THAN (MAXVALUE)")
+    op.execute(
+        "ALTER TABLE `user_activity` PARTITION BY RANGE COLUMNS (`action_time`) (\n    "
+        + ",\n    ".join(partitions)
+        + "\n);"
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE `user_activity` REMOVE PARTITIONING;")
+    op.execute(
+        """
+        ALTER TABLE `user_activity`
+            DROP INDEX `ix_user_activity_user_id_action_time`,
+            DROP PRIMARY KEY,
+            ADD PRIMARY KEY (`id`),
+            ADD INDEX `user_id` (`user_id`);
+        """
+    )
+    op.execute(
+        "ALTER TABLE `user_activity` ADD CONSTRAINT `user_activity_ibfk_1` "
+        "FOREIGN KEY (`user_id`) REFERENCES `users` (`id`) ON DELETE CASCADE;"
+    )
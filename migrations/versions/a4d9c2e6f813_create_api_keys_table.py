@@ -0,0 +1,58 @@
+"""Create api_keys table
+
+Revision ID: a4d9c2e6f813
+Revises: 5b8e0d3f7a62
+Create Date: 2026-10-19 20:18:39.592047
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d9c2e6f813'
+down_revision: Union[str, None] = '5b8e0d3f7a62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('api_keys',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('name', sa.String(length=48), nullable=False),
+    sa.Column('key_prefix', sa.String(length=12), nullable=False),
+    sa.Column('key_digest', sa.String(length=64), nullable=False),
+    sa.Column('privileges', sa.JSON(), nullable=False),
+    sa.Column('active', sa.Boolean(), nullable=False),
+    sa.Column('expires_at', sa.DateTime(), nullable=True),
+    sa.Column('created_by', sa.BigInteger(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('revoked_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['created_by'], ['users.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('key_digest')
+    )
+    # Seed the privileges guarding the API key administration API
+    op.execute(
+        """
+        INSERT IGNORE INTO `privileges` (`privilege`, `tag`, `description`, `created_at`, `updated_at`) VALUES
+        ('APIKEY_R', 'API_KEY_MANAGEMENT', 'Allows viewing API keys', UTC_TIMESTAMP(), UTC_TIMESTAMP()),
+        ('APIKEY_W', 'API_KEY_MANAGEMENT', 'Allows creating and revoking API keys', UTC_TIMESTAMP(), UTC_TIMESTAMP());
+        """
+    )
+    # Grant them to the administrator role so the first API key can be created
+    op.execute(
+        """
+        INSERT IGNORE INTO `role_privileges` (`role`, `privilege`, `created_at`, `updated_at`) VALUES
+        ('SYSTEM ADMIN', 'APIKEY_R', UTC_TIMESTAMP(), UTC_TIMESTAMP()),
+        ('SYSTEM ADMIN', 'APIKEY_W', UTC_TIMESTAMP(), UTC_TIMESTAMP());
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM `role_privileges` WHERE `privilege` IN ('APIKEY_R', 'APIKEY_W');")
+    op.execute("DELETE FROM `privileges` WHERE `privilege` IN ('APIKEY_R', 'APIKEY_W');")
+    op.drop_table('api_keys')
@@ -0,0 +1,38 @@
+"""Create office_tile_clusters table
+
+Revision ID: a93c1d7e4b28
+Revises: e21f6a83b5c9
+Create Date: 2026-10-19 15:21:09.742813
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a93c1d7e4b28'
+down_revision: Union[str, None] = 'e21f6a83b5c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Populate after upgrading with POST /api/v1/offices/tiles/rebuild
+    op.create_table('office_tile_clusters',
+    sa.Column('z', sa.SmallInteger(), nullable=False),
+    sa.Column('tile_x', sa.Integer(), nullable=False),
+    sa.Column('tile_y', sa.Integer(), nullable=False),
+    sa.Column('cell', sa.SmallInteger(), nullable=False),
+    sa.Column('office_count', sa.Integer(), nullable=False),
+    sa.Column('lat_sum', sa.Float(precision=53), nullable=False),
+    sa.Column('long_sum', sa.Float(precision=53), nullable=False),
+    sa.Column('sample_codes', sa.JSON(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('z', 'tile_x', 'tile_y', 'cell', name='pk_office_tile_clusters')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('office_tile_clusters')
@@ -0,0 +1,27 @@
+"""Add directory indexes to users
+
+Revision ID: b6d48f1e2a07
+Revises: a93c1d7e4b28
+Create Date: 2026-10-19 16:10:27.519804
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6d48f1e2a07'
+down_revision: Union[str, None] = 'a93c1d7e4b28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_users_office_active', 'users', ['office', 'active'], unique=False)
+    op.create_index('ix_users_role_active', 'users', ['role', 'active'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_role_active', table_name='users')
+    op.drop_index('ix_users_office_active', table_name='users')
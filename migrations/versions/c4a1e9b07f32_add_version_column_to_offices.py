@@ -0,0 +1,26 @@
+"""Add version column to offices
+
+Revision ID: c4a1e9b07f32
+Revises: 197c362ebd55
+Create Date: 2026-10-19 11:26:40.118395
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a1e9b07f32'
+down_revision: Union[str, None] = '197c362ebd55'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('offices', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('offices', 'version')
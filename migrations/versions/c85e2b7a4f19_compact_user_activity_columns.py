@@ -0,0 +1,102 @@
+"""Compact user_activity columns
+
+Revision ID: c85e2b7a4f19
+Revises: 9a3f5d1c7e82
+Create Date: 2026-10-19 18:57:03.441769
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c85e2b7a4f19'
+down_revision: Union[str, None] = '9a3f5d1c7e82'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match ACTIVITY_ACTIONS in src/features/users/models/user_activity.py
+ACTIONS = {"LOGIN": 1, "LOGOUT": 2, "FAILED_LOGIN": 3, "PASSWORD_CHANGE": 4}
+
+
+def upgrade() -> None:
+    op.create_table('user_agents',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('user_agent', sa.String(length=255), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_agent')
+    )
+    op.execute(
+        """
+        INSERT IGNORE INTO `user_agents` (`user_agent`, `created_at`)
+        SELECT DISTINCT `user_agent`, UTC_TIMESTAMP() FROM `user_activity` WHERE `user_agent` IS NOT NULL;
+        """
+    )
+
+    op.execute(
+        """
+        ALTER TABLE `user_activity`
+            ADD COLUMN `user_agent_id` INT NULL,
+            ADD COLUMN `ip_address_bin` VARBINARY(16) NULL,
+            ADD COLUMN `action_code` TINYINT UNSIGNED NOT NULL DEFAULT 0;
+        """
+    )
+    # Unknown actions keep code 0 (OTHER); unparsable addresses become NULL
+    cases = " ".join(f"WHEN '{action}' THEN {code}" for action, code in ACTIONS.items())
+    op.execute(
+        f"""
+        UPDATE `user_activity` a
+        LEFT JOIN `user_agents` u ON u.`user_agent` = a.`user_agent`
+        SET a.`user_agent_id` = u.`id`,
+            a.`ip_address_bin` = INET6_ATON(a.`ip_address`),
+            a.`action_code` = CASE a.`action` {cases} ELSE 0 END;
+        """
+    )
+    op.execute(
+        """
+        ALTER TABLE `user_activity`
+            DROP COLUMN `user_agent`,
+            DROP COLUMN `ip_address`,
+            DROP COLUMN `action`,
+            RENAME COLUMN `ip_address_bin` TO `ip_address`,
+            RENAME COLUMN `action_code` TO `action`;
+        """
+    )
+    op.execute("ALTER TABLE `user_activity` ALTER COLUMN `action` DROP DEFAULT;")
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE `user_activity`
+            ADD COLUMN `user_agent_text` VARCHAR(255) NULL,
+            ADD COLUMN `ip_address_text` VARCHAR(48) NULL,
+            ADD COLUMN `action_text` VARCHAR(32) NOT NULL DEFAULT 'OTHER';
+        """
+    )
+    cases = " ".join(f"WHEN {code} THEN '{action}'" for action, code in ACTIONS.items())
+    op.execute(
+        f"""
+        UPDATE `user_activity` a
+        LEFT JOIN `user_agents` u ON u.`id` = a.`user_agent_id`
+        SET a.`user_agent_text` = u.`user_agent`,
+            a.`ip_address_text` = INET6_NTOA(a.`ip_address`),
+            a.`action_text` = CASE a.`action` {cases} ELSE 'OTHER' END;
+        """
+    )
+    op.execute(
+        """
+        ALTER TABLE `user_activity`
+            DROP COLUMN `user_agent_id`,
+            DROP COLUMN `ip_address`,
+            DROP COLUMN `action`,
+            RENAME COLUMN `user_agent_text` TO `user_agent`,
+            RENAME COLUMN `ip_address_text` TO `ip_address`,
+            RENAME COLUMN `action_text` TO `action`;
+        """
+    )
+    op.execute("ALTER TABLE `user_activity` ALTER COLUMN `action` DROP DEFAULT;")
+    op.drop_table('user_agents')
@@ -0,0 +1,25 @@
+"""Add updated_at index to offices
+
+Revision ID: d650654d4219
+Revises: 05fe43724734
+Create Date: 2026-10-19 10:03:54.902114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd650654d4219'
+down_revision: Union[str, None] = '05fe43724734'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_offices_updated_at_code', 'offices', ['updated_at', 'code'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_offices_updated_at_code', table_name='offices')
@@ -0,0 +1,86 @@
+"""Create office_history table
+
+Revision ID: e21f6a83b5c9
+Revises: 5b7f0c2d8e41
+Create Date: 2026-10-19 14:02:45.381926
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from datetime import datetime
+from decimal import Decimal
+import json
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e21f6a83b5c9'
+down_revision: Union[str, None] = '5b7f0c2d8e41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copy of the snapshot fields as of this revision, so that later changes to the
+# application model do not alter what this migration writes
+SNAPSHOT_FIELDS = (
+    "code", "name", "o_type", "ph_num1", "ph_num2", "email1", "email2", "website", "gst_num",
+    "pincode", "country", "state", "district", "taluka", "place",
+    "address_line1", "address_line2", "address_line3", "o_lat", "o_long", "notes",
+    "active", "deleted_at", "created_at",
+)
+BASELINE_BATCH_SIZE = 1000
+
+
+def snapshot_value(field, value):
+    if field == "active":
+        # MySQL returns booleans as TINYINT through a raw query
+        return bool(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def upgrade() -> None:
+    op.create_table('office_history',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('office_code', sa.String(length=16), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('action', sa.String(length=16), nullable=False),
+    sa.Column('changes', sa.JSON(), nullable=True),
+    sa.Column('snapshot', sa.JSON(), nullable=True),
+    sa.Column('changed_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_office_history_code_changed_at', 'office_history', ['office_code', 'changed_at'], unique=False)
+
+    # Seed a baseline snapshot of each existing office, so that its state as of any time
+    # since its last change can be rebuilt
+    bind = op.get_bind()
+    columns = ", ".join(f"`{field}`" for field in SNAPSHOT_FIELDS)
+    rows = bind.execute(
+        sa.text(f"SELECT {columns}, `version`, `updated_at` FROM `offices`")
+    ).mappings().all()
+    insert = sa.text(
+        "INSERT INTO `office_history` (`office_code`, `version`, `action`, `snapshot`, `changed_at`) "
+        "VALUES (:office_code, :version, 'BASELINE', :snapshot, :changed_at)"
+    )
+    now = datetime.utcnow()
+    for start in range(0, len(rows), BASELINE_BATCH_SIZE):
+        bind.execute(insert, [
+            {
+                "office_code": row["code"],
+                "version": row["version"],
+                "snapshot": json.dumps(
+                    {field: snapshot_value(field, row[field]) for field in SNAPSHOT_FIELDS}
+                ),
+                "changed_at": row["updated_at"] or row["created_at"] or now,
+            }
+            for row in rows[start:start + BASELINE_BATCH_SIZE]
+        ])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_office_history_code_changed_at', table_name='office_history')
+    op.drop_table('office_history')
@@ -0,0 +1,58 @@
+"""Create activity rollup tables
+
+Revision ID: e7b31a6c0d48
+Revises: c85e2b7a4f19
+Create Date: 2026-10-19 19:24:47.205318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b31a6c0d48'
+down_revision: Union[str, None] = 'c85e2b7a4f19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('activity_rollups_hourly',
+    sa.Column('bucket', sa.DateTime(), nullable=False),
+    sa.Column('action', mysql.TINYINT(unsigned=True), nullable=False),
+    sa.Column('office', sa.String(length=16), nullable=False),
+    sa.Column('role', sa.String(length=24), nullable=False),
+    sa.Column('total', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('bucket', 'action', 'office', 'role')
+    )
+    op.create_table('activity_rollups_daily',
+    sa.Column('bucket', sa.Date(), nullable=False),
+    sa.Column('action', mysql.TINYINT(unsigned=True), nullable=False),
+    sa.Column('office', sa.String(length=16), nullable=False),
+    sa.Column('role', sa.String(length=24), nullable=False),
+    sa.Column('total', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('bucket', 'action', 'office', 'role')
+    )
+    op.create_table('rollup_watermarks',
+    sa.Column('name', sa.String(length=32), nullable=False),
+    sa.Column('last_id', sa.BigInteger(), nullable=False),
+    sa.Column('pending_id', sa.BigInteger(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    # Existing activity is rolled up by the backfill, not by the first incremental run
+    op.execute(
+        """
+        INSERT INTO `rollup_watermarks` (`name`, `last_id`, `pending_id`, `updated_at`)
+        SELECT 'user_activity', COALESCE(MAX(`id`), 0), COALESCE(MAX(`id`), 0), UTC_TIMESTAMP() FROM `user_activity`;
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('rollup_watermarks')
+    op.drop_table('activity_rollups_daily')
+    op.drop_table('activity_rollups_hourly')
@@ -0,0 +1,30 @@
+"""Add OTP attempt counters to users
+
+Revision ID: f3a07c5d91b6
+Revises: b6d48f1e2a07
+Create Date: 2026-10-19 16:42:08.163925
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a07c5d91b6'
+down_revision: Union[str, None] = 'b6d48f1e2a07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('otp_attempts', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('users', sa.Column('email_otp_attempts', sa.Integer(), server_default='0', nullable=False))
+    # Outstanding codes are bcrypt hashes that can no longer be verified
+    op.execute("UPDATE users SET otp = NULL, email_verification_otp = NULL")
+
+
+def downgrade() -> None:
+    op.drop_column('users', 'email_otp_attempts')
+    op.drop_column('users', 'otp_attempts')
@@ -0,0 +1,78 @@
+from typing import Iterable
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    A fixed-size Bloom filter over strings.
+
+    Membership tests never give false negatives and give false positives at roughly
+    `error_rate` once `capacity` items have been added. Items cannot be removed; rebuild
+    the filter from the source of truth instead.
+
+    Attributes:
+        capacity (int): Number of items the filter is sized for.
+        error_rate (float): Target false-positive rate at capacity.
+        size (int): Number of bits in the filter.
+        hash_count (int): Number of bit positions set per item.
+        count (int): Number of items added.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """
+        Initializes an empty filter sized for `capacity` items at `error_rate`.
+
+        Args:
+            capacity (int): Expected number of items.
+            error_rate (float): Target false-positive rate at capacity.
+        """
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.size = max(8, int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / self.capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        """
+        Yields the bit positions of an item using double hashing over one BLAKE2b digest.
+        """
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (first + i * second) % self.size
+
+    def add(self, item: str) -> None:
+        """
+        Adds an item to the filter.
+
+        Args:
+            item (str): The item to add.
+        """
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def update(self, items: Iterable[str]) -> None:
+        """
+        Adds several items to the filter.
+
+        Args:
+            items (Iterable[str]): The items to add.
+        """
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item: str) -> bool:
+        """
+        Tests whether an item may have been added (True) or definitely was not (False).
+        """
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def __len__(self) -> int:
+        """
+        Returns the number of items added.
+        """
+        return self.count
@@ -1,7 +1,16 @@
 from pydantic_settings import BaseSettings
 from src.core.constants import PROJECT_ROOT
+from typing import Dict, Optional
 import base64
 
+# Connection pool settings per environment; any DB_POOL_* variable overrides its entry.
+# Recycling well below MySQL's wait_timeout avoids handing out connections the server closed.
+DB_POOL_PRESETS: Dict[str, dict] = {
+    "development": {"pool_size": 5, "max_overflow": 5, "pool_timeout": 30, "pool_recycle": 1800, "pool_pre_ping": True},
+    "test": {"pool_size": 2, "max_overflow": 2, "pool_timeout": 5, "pool_recycle": 1800, "pool_pre_ping": True},
+    "production": {"pool_size": 20, "max_overflow": 10, "pool_timeout": 10, "pool_recycle": 1800, "pool_pre_ping": True},
+}
+
 
 class Settings(BaseSettings):
     """
@@ -14,20 +23,102 @@ class Settings(BaseSettings):
     Attributes:
         app_name (str): Name of the application.
         database_url (str): Database connection URL for SQLAlchemy.
+        read_database_url (Optional[str]): Connection URL of a read replica; reads stay on the primary if unset.
+        read_your_writes_seconds (int): How long after a write a client's reads stay on the primary; should exceed replica lag.
         jwt_secret (str): Secret key for JWT signing and verification.
         jwt_algorithm (str): Algorithm used for JWT encoding (default: "HS256").
         jwt_expiration_minutes (int): JWT expiration time in minutes (default: 30).
         env (str): Current environment (e.g., "development", "production").
+        office_code_prefix_field (str): Office field whose value selects the code prefix ("o_type" or "state").
+        office_code_prefixes (Dict[str, str]): Code prefix per value of the prefix field.
+        office_code_digits (int): Number of zero-padded digits following the prefix.
+        office_code_block_size (int): Number of codes a worker reserves per sequence round trip.
+        office_history_snapshot_interval (int): Versions between full snapshots in the office history.
+        office_tile_max_zoom (int): Highest map zoom level for which office clusters are maintained.
+        office_tile_grid (int): Number of clustering cells along each edge of a map tile.
+        office_tile_sample_size (int): Maximum number of sample office codes kept per cluster.
+        password_hash_workers (int): Processes used for bulk password hashing (0: one per CPU).
+        user_import_chunk_size (int): Number of rows validated and inserted together in bulk user imports.
+        otp_secret (Optional[str]): Key for OTP digests; defaults to the JWT secret.
+        otp_digits (int): Number of digits in a generated OTP.
+        otp_expiry_minutes (int): Minutes an OTP stays valid after generation.
+        otp_max_attempts (int): Verification attempts allowed per generated OTP.
+        otp_resend_seconds (int): Minimum interval between two OTPs for the same channel; earlier requests are ignored.
+        token_revocation_capacity (int): Revoked tokens the in-memory bloom filter is sized for.
+        token_revocation_error_rate (float): Target false-positive rate of the bloom filter.
+        token_revocation_exact_capacity (int): Maximum revoked token IDs held in the exact in-memory set.
+        token_revocation_sync_seconds (int): Interval between incremental syncs of the revocation list.
+        token_revocation_rebuild_minutes (int): Interval between full rebuilds that drop expired revocations.
+        authz_sync_seconds (int): Interval between checks of the authorization version.
+        activity_retention_months (int): Whole months of user activity kept before the current month.
+        activity_partitions_ahead (int): Monthly user activity partitions provisioned ahead of time.
+        activity_partition_check_hours (int): Interval between user activity partition maintenance runs.
+        user_agent_cache_size (int): Maximum number of interned user agent ids cached per worker.
+        activity_rollup_seconds (int): Interval between incremental activity rollup runs.
+        activity_rollup_backfill_chunk (int): Activity entries aggregated per batch during a rollup backfill.
+        org_headcount_reconcile_minutes (int): Interval between reconciles of the office and role headcounts.
+        api_key_cache_seconds (int): How long a worker reuses an API key lookup; bounds how late revocations by other workers apply.
+        api_key_cache_size (int): Maximum number of API keys cached per worker.
+        db_pool_size (Optional[int]): Connections kept open per worker; defaults to the environment preset.
+        db_max_overflow (Optional[int]): Extra connections opened under load beyond the pool size.
+        db_pool_timeout (Optional[float]): Seconds a request waits for a free connection before failing.
+        db_pool_recycle (Optional[int]): Seconds after which a connection is replaced on checkout.
+        db_pool_pre_ping (Optional[bool]): Whether connections are tested before being handed out.
+        sql_slow_query_ms (float): Statements at least this slow are logged, with redacted parameters.
+        sql_fingerprint_capacity (int): Maximum number of distinct statement fingerprints tracked per worker.
+        sql_debug_headers (bool): Whether responses carry X-DB-Query-Count and X-DB-Time-Ms headers.
+        metrics_enabled (bool): Whether request metrics are recorded and served at /metrics.
     """
 
     # Define configuration attributes
     app_name: str = "Trilp API"
     log_level: str = "INFO"  # Default log level if not provided in .env
     database_url: str
+    read_database_url: Optional[str] = None
+    read_your_writes_seconds: int = 5
     jwt_secret: str
     jwt_algorithm: str = "HS256"
     jwt_expiration_minutes: int = 30
     env: str = "development"  # Indicates the current environment (e.g., development, production)
+    office_code_prefix_field: str = "o_type"
+    office_code_prefixes: Dict[str, str] = {"HQ": "HQ", "BRANCH": "BR"}
+    office_code_digits: int = 6
+    office_code_block_size: int = 100
+    office_history_snapshot_interval: int = 20
+    office_tile_max_zoom: int = 16
+    office_tile_grid: int = 8
+    office_tile_sample_size: int = 5
+    password_hash_workers: int = 0
+    user_import_chunk_size: int = 500
+    otp_secret: Optional[str] = None
+    otp_digits: int = 6
+    otp_expiry_minutes: int = 5
+    otp_max_attempts: int = 5
+    otp_resend_seconds: int = 120
+    token_revocation_capacity: int = 100000
+    token_revocation_error_rate: float = 0.001
+    token_revocation_exact_capacity: int = 50000
+    token_revocation_sync_seconds: int = 5
+    token_revocation_rebuild_minutes: int = 60
+    authz_sync_seconds: int = 5
+    activity_retention_months: int = 12
+    activity_partitions_ahead: int = 3
+    activity_partition_check_hours: int = 6
+    user_agent_cache_size: int = 5000
+    activity_rollup_seconds: int = 60
+    activity_rollup_backfill_chunk: int = 50000
+    org_headcount_reconcile_minutes: int = 60
+    api_key_cache_seconds: int = 60
+    api_key_cache_size: int = 10000
+    db_pool_size: Optional[int] = None
+    db_max_overflow: Optional[int] = None
+    db_pool_timeout: Optional[float] = None
+    db_pool_recycle: Optional[int] = None
+    db_pool_pre_ping: Optional[bool] = None
+    sql_slow_query_ms: float = 200
+    sql_fingerprint_capacity: int = 1000
+    sql_debug_headers: bool = False
+    metrics_enabled: bool = True
 
     class Config:
         """
@@ -66,6 +157,27 @@ class Settings(BaseSettings):
                 "JWT_SECRET is not set. Please check your `.env` file or environment variables."
             )
 
+    def db_pool_options(self) -> dict:
+        """
+        Returns the connection pool arguments for `create_async_engine`.
+
+        Starts from the preset of the current environment (development if unknown) and
+        applies every DB_POOL_* setting that is set.
+
+        Returns:
+            dict: pool_size, max_overflow, pool_timeout, pool_recycle and pool_pre_ping.
+        """
+        options = dict(DB_POOL_PRESETS.get(self.env, DB_POOL_PRESETS["development"]))
+        overrides = {
+            "pool_size": self.db_pool_size,
+            "max_overflow": self.db_max_overflow,
+            "pool_timeout": self.db_pool_timeout,
+            "pool_recycle": self.db_pool_recycle,
+            "pool_pre_ping": self.db_pool_pre_ping,
+        }
+        options.update({name: value for name, value in overrides.items() if value is not None})
+        return options
+
 
 # Instantiate the settings object for use throughout the application
 settings = Settings()
@@ -1,18 +1,65 @@
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.sql.selectable import CompoundSelect, Select
 from src.core.config import settings
+from src.core.pool import InstrumentedPool
+from src.core.query_stats import QueryStats
+from src.core.read_routing import replica_reads_allowed
 
-# Create the SQLAlchemy async engine using the database URL from settings
+# Create the SQLAlchemy async engine using the database URL and pool settings
 engine = create_async_engine(
     settings.database_url,
     echo=False,  # Enable SQL logging for debugging; set to False in production
+    poolclass=InstrumentedPool,  # Records checkout waits and timeouts, see get_pool_status
+    **settings.db_pool_options(),
 )
 
+# Optional engine for a read replica; without one, every statement goes to the primary
+read_engine = create_async_engine(
+    settings.read_database_url,
+    echo=False,
+    poolclass=InstrumentedPool,
+    **settings.db_pool_options(),
+) if settings.read_database_url else None
+
+# Statement timings per fingerprint, with a slow-query log, for all engines of this worker
+query_stats = QueryStats(settings.sql_fingerprint_capacity, settings.sql_slow_query_ms)
+for instrumented_engine in (engine, read_engine):
+    if instrumented_engine is not None:
+        query_stats.instrument(instrumented_engine)
+
+
+class RoutingSession(Session):
+    """
+    Session that sends plain SELECTs to the read replica when the session allows it.
+
+    Sessions allow replica reads only if `info["replica_reads"]` is set, which `get_db` does
+    for safe requests outside the client's read-your-writes window. The first write, flush,
+    locking read or raw statement moves the session to the primary for the rest of its
+    life, so a request always reads what it wrote.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        """
+        Choose the engine for a statement.
+        """
+        if read_engine is not None and self.info.get("replica_reads"):
+            if (
+                not self._flushing
+                and isinstance(clause, (Select, CompoundSelect))
+                and getattr(clause, "_for_update_arg", None) is None
+            ):
+                return read_engine.sync_engine
+            self.info["replica_reads"] = False
+        return super().get_bind(mapper, clause=clause, **kw)
+
+
 # Create a session factory for database interactions
 async_session = sessionmaker(
     engine,
     expire_on_commit=False,  # Keeps objects "alive" after commit to prevent re-fetching
     class_=AsyncSession,  # Use the async session for asyncio compatibility
+    sync_session_class=RoutingSession,  # Routes eligible reads to the read replica
 )
 
 async def get_db():
@@ -20,10 +67,26 @@ async def get_db():
     Dependency for injecting database sessions into FastAPI routes.
 
     This function provides a scoped session for the lifecycle of a request,
-    ensuring proper cleanup after use.
+    ensuring proper cleanup after use. Its reads go to the read replica when the
+    request is eligible (see `ReadRoutingMiddleware`).
 
     Yields:
         AsyncSession: An SQLAlchemy AsyncSession instance.
     """
     async with async_session() as session:
+        session.sync_session.info["replica_reads"] = replica_reads_allowed.get()
         yield session
+
+
+def get_pool_status() -> dict:
+    """
+    Returns the live state and checkout statistics of this worker's connection pool.
+
+    Returns:
+        dict: See `InstrumentedPool.status_dict`; the read replica's pool, if any, is
+            reported under "replica".
+    """
+    status = engine.pool.status_dict()
+    if read_engine is not None:
+        status["replica"] = read_engine.pool.status_dict()
+    return status
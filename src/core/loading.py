@@ -0,0 +1,31 @@
+from fastapi import HTTPException
+from typing import Iterable, Optional, Set
+
+
+def parse_include(include: Optional[str], allowed: Iterable[str]) -> Set[str]:
+    """
+    Parses an `?include=` query parameter into a set of relationship names.
+
+    Relationships are mapped with `lazy="raise"`, so anything a response embeds must be
+    requested explicitly and loaded eagerly by the repository (e.g., via selectinload).
+
+    Args:
+        include (Optional[str]): Comma-separated relationship names, e.g. "users,role".
+        allowed (Iterable[str]): The names the endpoint can embed.
+
+    Returns:
+        Set[str]: The requested relationship names.
+
+    Raises:
+        HTTPException: If an unknown relationship name is requested.
+    """
+    if not include:
+        return set()
+    requested = {name.strip() for name in include.split(",") if name.strip()}
+    unknown = requested - set(allowed)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown include: {', '.join(sorted(unknown))}. Allowed: {', '.join(sorted(allowed))}.",
+        )
+    return requested
@@ -0,0 +1,151 @@
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    REGISTRY,
+    generate_latest,
+    multiprocess,
+)
+import os
+import time
+
+# Route label of requests that matched no route, so unknown paths cannot inflate cardinality
+UNMATCHED_ROUTE = "<unmatched>"
+# Method label of requests with a non-standard method
+OTHER_METHOD = "OTHER"
+KNOWN_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"})
+
+# Bucket bounds in seconds, fine-grained around typical latency SLOs
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.15, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0)
+# Bucket bounds in bytes
+SIZE_BUCKETS = (100, 1000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+REQUESTS = Counter(
+    "http_requests_total",
+    "Number of HTTP requests handled.",
+    ["method", "route", "status"],
+)
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Time from receiving an HTTP request until its response was sent.",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "Size of HTTP response bodies.",
+    ["method", "route"],
+    buckets=SIZE_BUCKETS,
+)
+# Summed across live workers in multi-process mode; see mark_worker_dead
+IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "Number of HTTP requests being handled.",
+    multiprocess_mode="livesum",
+)
+
+
+def route_template(scope) -> str:
+    """
+    Returns the path template of the route that handled a request.
+
+    Routers included without being flattened match on their own path only; the prefix they
+    were included under is then taken from the request path in front of the matched part.
+
+    Args:
+        scope: The ASGI scope of the request, after routing.
+
+    Returns:
+        str: The path template, or UNMATCHED_ROUTE if no route matched.
+    """
+    route = scope.get("route")
+    template = getattr(route, "path", None)
+    if template is None:
+        return UNMATCHED_ROUTE
+    path = scope["path"]
+    if route.path_regex.match(path):
+        return template
+    for index in [i for i, char in enumerate(path) if char == "/"] + [len(path)]:
+        if index and route.path_regex.match(path[index:]):
+            return path[:index] + template
+    return template
+
+
+def render_metrics() -> tuple:
+    """
+    Renders the metrics in the Prometheus text format.
+
+    With PROMETHEUS_MULTIPROC_DIR set, the metrics of all worker processes are aggregated
+    from that directory; otherwise those of the current process are returned.
+
+    Returns:
+        tuple: The exposition bytes and their content type.
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_worker_dead() -> None:
+    """
+    Removes this worker's live gauge values from the multi-process directory on exit.
+
+    `livesum` gauges such as IN_FLIGHT are summed over the files left in the directory,
+    so a worker that exits without this would keep contributing its last value. A worker
+    killed without running its shutdown cannot clean up; its values stay until the
+    directory is cleared.
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        multiprocess.mark_process_dead(os.getpid())
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording request counts, latency, response sizes and in-flight requests.
+
+    Requests are labeled by the route's path template (e.g. `/api/v1/offices/id/{code}`),
+    not the raw path, so label values stay bounded by the routes.
+    """
+
+    def __init__(self, app):
+        """
+        Initializes the middleware.
+
+        Args:
+            app: The ASGI application.
+        """
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        size = 0
+
+        async def send_and_measure(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_and_measure)
+        finally:
+            elapsed = time.perf_counter() - started
+            IN_FLIGHT.dec()
+            method = scope["method"] if scope["method"] in KNOWN_METHODS else OTHER_METHOD
+            path = route_template(scope)
+            REQUESTS.labels(method, path, str(status)).inc()
+            REQUEST_LATENCY.labels(method, path).observe(elapsed)
+            RESPONSE_SIZE.labels(method, path).observe(size)
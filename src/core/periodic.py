@@ -0,0 +1,27 @@
+from typing import Awaitable, Callable
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+async def run_periodically(interval: float, job: Callable[[], Awaitable[None]], name: str) -> None:
+    """
+    Runs a background job forever, waiting `interval` seconds between runs.
+
+    Failures are logged and retried on the next run, so a transient database error does
+    not stop the job. Cancel the task to stop it.
+
+    Args:
+        interval (float): Seconds to wait after each run.
+        job (Callable[[], Awaitable[None]]): The coroutine function to run.
+        name (str): Name of the job used in log messages.
+    """
+    while True:
+        try:
+            await job()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Background job '%s' failed", name)
+        await asyncio.sleep(interval)
@@ -0,0 +1,123 @@
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from typing import Dict, List, Tuple
+import bisect
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (in milliseconds) of the checkout wait histogram buckets
+WAIT_BUCKETS_MS: Tuple[float, ...] = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class PoolStats:
+    """
+    Running statistics of connection checkouts from one pool.
+
+    Waits are recorded in a fixed-bucket histogram, so the cost per checkout is a
+    binary search and an increment regardless of traffic.
+    """
+
+    def __init__(self):
+        """
+        Initializes empty statistics.
+        """
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        # One count per bucket in WAIT_BUCKETS_MS, plus one for longer waits
+        self.wait_counts: List[int] = [0] * (len(WAIT_BUCKETS_MS) + 1)
+
+    def observe(self, seconds: float, timed_out: bool = False) -> None:
+        """
+        Record one checkout.
+
+        Args:
+            seconds (float): How long the checkout took.
+            timed_out (bool): Whether it failed with a pool timeout.
+        """
+        self.checkouts += 1
+        self.timeouts += int(timed_out)
+        self.wait_seconds_total += seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+        self.wait_counts[bisect.bisect_left(WAIT_BUCKETS_MS, seconds * 1000)] += 1
+
+    def histogram(self) -> List[Dict]:
+        """
+        Return the wait histogram as cumulative counts per upper bound, like Prometheus.
+
+        Returns:
+            List[Dict]: Entries of {"le_ms": bound, "count": checkouts waiting at most that long}.
+        """
+        buckets, cumulative = [], 0
+        for bound, count in zip(WAIT_BUCKETS_MS + (float("inf"),), self.wait_counts):
+            cumulative += count
+            buckets.append({"le_ms": bound if bound != float("inf") else "+Inf", "count": cumulative})
+        return buckets
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """
+    Async queue pool that records how long each connection checkout takes.
+
+    The time covers waiting for a free connection, opening a new one within the overflow
+    and the pre-ping, i.e. everything a request waits for before it can run a query.
+    Checkouts that time out are counted separately and logged.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Initializes the pool with empty statistics.
+        """
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def connect(self):
+        """
+        Check out a connection, recording the wait.
+        """
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.stats.observe(time.perf_counter() - started, timed_out=True)
+            logger.warning(
+                "Connection pool exhausted: %d checked out, %d overflow, timeout %.1fs",
+                self.checkedout(), self.overflow(), self._timeout,
+            )
+            raise
+        self.stats.observe(time.perf_counter() - started)
+        return connection
+
+    def recreate(self) -> "InstrumentedPool":
+        """
+        Replace the pool (e.g., after `engine.dispose()`), keeping its statistics.
+        """
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+    def status_dict(self) -> dict:
+        """
+        Return the live pool state and the checkout statistics.
+
+        Returns:
+            dict: Configured size, connections checked out, idle and in overflow, and the
+                checkout count, timeouts, mean and max wait and wait histogram.
+        """
+        stats = self.stats
+        return {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "max_overflow": self._max_overflow,
+            "timeout_seconds": self._timeout,
+            "checkouts": stats.checkouts,
+            "timeouts": stats.timeouts,
+            "wait_ms_mean": round(stats.wait_seconds_total * 1000 / stats.checkouts, 3) if stats.checkouts else 0.0,
+            "wait_ms_max": round(stats.wait_seconds_max * 1000, 3),
+            "wait_ms_histogram": stats.histogram(),
+        }
@@ -0,0 +1,254 @@
+from contextvars import ContextVar
+from functools import lru_cache
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import MutableHeaders
+from typing import Dict, List, Optional
+import logging
+import re
+import time
+
+logger = logging.getLogger(__name__)
+
+# Fingerprint under which statements are counted once the fingerprint table is full
+OTHER_FINGERPRINT = "<other>"
+# Longest statement whose fingerprint is cached, bounding the cache to a few MB
+MAX_CACHED_STATEMENT_LENGTH = 1024
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_BIND_PLACEHOLDER = re.compile(r"\?|%s|%\(\w+\)s|:\w+")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_VALUES_ROWS = re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _normalize(statement: str) -> str:
+    """
+    Computes the fingerprint of a statement; see `fingerprint`.
+    """
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _BIND_PLACEHOLDER.sub("?", normalized)
+    normalized = _PLACEHOLDER_LIST.sub("(?)", normalized)
+    normalized = _WHITESPACE.sub(" ", normalized).strip()
+    return _VALUES_ROWS.sub("(?), ...", normalized)
+
+
+_cached_normalize = lru_cache(maxsize=4096)(_normalize)
+
+
+def fingerprint(statement: str) -> str:
+    """
+    Normalizes a SQL statement so that executions differing only in values group together.
+
+    Literals become `?`, parenthesized placeholder lists (`IN` lists, `VALUES` rows) become
+    `(?)`, repeated `VALUES` rows collapse to one, and whitespace is squeezed.
+
+    Fingerprints of statements up to MAX_CACHED_STATEMENT_LENGTH characters are cached;
+    longer ones (typically multi-row INSERTs) are normalized on every call, so the cache
+    never holds their full text.
+
+    Args:
+        statement (str): The SQL statement as sent to the driver.
+
+    Returns:
+        str: The statement fingerprint.
+    """
+    if len(statement) > MAX_CACHED_STATEMENT_LENGTH:
+        return _normalize(statement)
+    return _cached_normalize(statement)
+
+
+def redact_parameters(parameters) -> str:
+    """
+    Describes bind parameters by type and size only, so logs never contain their values.
+
+    Args:
+        parameters: The parameters passed to the cursor (sequence, mapping or a list of either).
+
+    Returns:
+        str: A compact description such as "(str[12], int, None)".
+    """
+    def describe(value) -> str:
+        if value is None:
+            return "None"
+        if isinstance(value, (str, bytes)):
+            return f"{type(value).__name__}[{len(value)}]"
+        return type(value).__name__
+
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(f"{name}: {describe(value)}" for name, value in parameters.items()) + "}"
+    if isinstance(parameters, (list, tuple)) and parameters and isinstance(parameters[0], (list, tuple, dict)):
+        return f"{len(parameters)} rows of {redact_parameters(parameters[0])}"
+    if isinstance(parameters, (list, tuple)):
+        return "(" + ", ".join(describe(value) for value in parameters) + ")"
+    return describe(parameters)
+
+
+class RequestQueryStats:
+    """
+    Number and total duration of the statements executed for one request.
+    """
+
+    def __init__(self, path: str = ""):
+        """
+        Initializes empty statistics.
+
+        Args:
+            path (str): The request path, included in slow-query log entries.
+        """
+        self.path = path
+        self.count = 0
+        self.seconds = 0.0
+
+
+# Statistics of the request being served; None outside requests (background jobs, scripts)
+request_query_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar("request_query_stats", default=None)
+
+
+class QueryStats:
+    """
+    Per-worker execution statistics per statement fingerprint.
+
+    The table is bounded; once full, new fingerprints are counted under OTHER_FINGERPRINT.
+    """
+
+    def __init__(self, capacity: int, slow_query_ms: float):
+        """
+        Initializes empty statistics.
+
+        Args:
+            capacity (int): Maximum number of distinct fingerprints tracked.
+            slow_query_ms (float): Statements at least this slow are logged.
+        """
+        self.capacity = capacity
+        self.slow_query_ms = slow_query_ms
+        # fingerprint -> [executions, total seconds, max seconds]
+        self._stats: Dict[str, List[float]] = {}
+
+    def record(self, statement: str, parameters, seconds: float) -> None:
+        """
+        Record one executed statement.
+
+        Args:
+            statement (str): The SQL statement.
+            parameters: Its bind parameters, used only for the redacted slow-query log.
+            seconds (float): How long the execution took.
+        """
+        key = fingerprint(statement)
+        entry = self._stats.get(key)
+        if entry is None:
+            if len(self._stats) >= self.capacity:
+                key = OTHER_FINGERPRINT
+            entry = self._stats.setdefault(key, [0, 0.0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+        entry[2] = max(entry[2], seconds)
+
+        current = request_query_stats.get()
+        if current is not None:
+            current.count += 1
+            current.seconds += seconds
+
+        if seconds * 1000 >= self.slow_query_ms:
+            logger.warning(
+                "Slow query (%.1f ms)%s: %s; parameters: %s",
+                seconds * 1000,
+                f" on {current.path}" if current is not None else "",
+                key,
+                redact_parameters(parameters),
+            )
+
+    def top(self, limit: int = 20, order_by: str = "total_ms") -> List[dict]:
+        """
+        Return the most expensive fingerprints.
+
+        Args:
+            limit (int): Number of fingerprints to return.
+            order_by (str): "total_ms", "count", "mean_ms" or "max_ms".
+
+        Returns:
+            List[dict]: Fingerprints with their execution count and total, mean and max time.
+        """
+        rows = [
+            {
+                "fingerprint": key,
+                "count": int(count),
+                "total_ms": round(total * 1000, 3),
+                "mean_ms": round(total * 1000 / count, 3),
+                "max_ms": round(longest * 1000, 3),
+            }
+            for key, (count, total, longest) in self._stats.items()
+        ]
+        rows.sort(key=lambda row: row[order_by], reverse=True)
+        return rows[:limit]
+
+    def reset(self) -> None:
+        """
+        Forget all recorded fingerprints.
+        """
+        self._stats.clear()
+
+    def instrument(self, engine: AsyncEngine) -> None:
+        """
+        Attach the timing hooks to an engine.
+
+        Args:
+            engine (AsyncEngine): The engine whose statements are recorded.
+        """
+        sync_engine = engine.sync_engine
+
+        @event.listens_for(sync_engine, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+        @event.listens_for(sync_engine, "after_cursor_execute")
+        def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            started = conn.info["query_started"].pop()
+            self.record(statement, parameters, time.perf_counter() - started)
+
+        @event.listens_for(sync_engine, "handle_error")
+        def handle_error(exception_context):
+            conn = exception_context.connection
+            if conn is not None and conn.info.get("query_started"):
+                conn.info["query_started"].pop()
+
+
+class QueryStatsMiddleware:
+    """
+    ASGI middleware collecting the query count and database time of each request.
+
+    With `debug_headers`, responses carry them as X-DB-Query-Count and X-DB-Time-Ms.
+    """
+
+    def __init__(self, app, debug_headers: bool = False):
+        """
+        Initializes the middleware.
+
+        Args:
+            app: The ASGI application.
+            debug_headers (bool): Whether to add the statistics to response headers.
+        """
+        self.app = app
+        self.debug_headers = debug_headers
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats(scope["path"])
+        token = request_query_stats.set(stats)
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-DB-Query-Count"] = str(stats.count)
+                headers["X-DB-Time-Ms"] = f"{stats.seconds * 1000:.1f}"
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers if self.debug_headers else send)
+        finally:
+            request_query_stats.reset(token)
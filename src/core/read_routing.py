@@ -0,0 +1,67 @@
+from contextvars import ContextVar
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+import time
+
+# Cookie holding the epoch second until which the client reads from the primary
+PRIMARY_UNTIL_COOKIE = "db_primary_until"
+# HTTP methods that do not change state and may read from a replica
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Whether sessions opened for the current request may read from the replica; anything
+# outside a request (background jobs, scripts) uses the primary
+replica_reads_allowed: ContextVar[bool] = ContextVar("replica_reads_allowed", default=False)
+
+
+class ReadRoutingMiddleware:
+    """
+    ASGI middleware deciding per request whether reads may go to the read replica.
+
+    Reads of safe requests are allowed on the replica, unless the client wrote within the
+    read-your-writes window. A successful unsafe request starts that window by setting a
+    cookie, so the client's next reads see its own writes despite replication lag.
+    """
+
+    def __init__(self, app, window_seconds: int):
+        """
+        Initializes the middleware.
+
+        Args:
+            app: The ASGI application.
+            window_seconds (int): How long after a write the client reads from the primary.
+        """
+        self.app = app
+        self.window_seconds = window_seconds
+
+    def _recently_wrote(self, scope) -> bool:
+        """
+        Check whether the client's read-your-writes window is still open.
+        """
+        value = HTTPConnection(scope).cookies.get(PRIMARY_UNTIL_COOKIE)
+        try:
+            return value is not None and float(value) > time.time()
+        except ValueError:
+            return False
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        safe = scope["method"] in SAFE_METHODS
+        token = replica_reads_allowed.set(safe and not self._recently_wrote(scope))
+
+        async def send_with_window(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                primary_until = int(time.time()) + self.window_seconds
+                MutableHeaders(scope=message).append(
+                    "set-cookie",
+                    f"{PRIMARY_UNTIL_COOKIE}={primary_until}; Max-Age={self.window_seconds}; "
+                    f"Path=/; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send if safe else send_with_window)
+        finally:
+            replica_reads_allowed.reset(token)
@@ -1,8 +1,18 @@
+from concurrent.futures import ProcessPoolExecutor
 from passlib.context import CryptContext
+from src.core.config import settings
+from typing import List, Optional
+import asyncio
+import hashlib
+import hmac
+import secrets
 
 # Initialize the bcrypt context for hashing and verifying
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Process pool for bulk hashing, created on first use
+_hash_pool: Optional[ProcessPoolExecutor] = None
+
 
 def get_hash(text: str) -> str:
     """
@@ -33,3 +43,113 @@ def verify_hash(plain_text: str, hashed_text: str) -> bool:
         bool: True if the plaintext matches the hashed text, False otherwise.
     """
     return pwd_context.verify(plain_text, hashed_text)
+
+
+def _get_hash_pool() -> ProcessPoolExecutor:
+    """
+    Returns the shared process pool used for bulk hashing, creating it on first use.
+    """
+    global _hash_pool
+    if _hash_pool is None:
+        _hash_pool = ProcessPoolExecutor(max_workers=settings.password_hash_workers or None)
+    return _hash_pool
+
+
+async def get_hashes(texts: List[str]) -> List[str]:
+    """
+    Hashes many plaintext strings in parallel across a process pool.
+
+    bcrypt is deliberately CPU-bound, so hashing in the event loop (or a thread) would
+    block the server; each hash runs in a worker process instead, one per CPU by default.
+
+    Args:
+        texts (List[str]): The plaintext strings to be hashed.
+
+    Returns:
+        List[str]: The hashed strings, in the same order as the input.
+    """
+    if not texts:
+        return []
+    loop = asyncio.get_running_loop()
+    pool = _get_hash_pool()
+    return list(await asyncio.gather(*(loop.run_in_executor(pool, get_hash, text) for text in texts)))
+
+
+def generate_otp(digits: int = None) -> str:
+    """
+    Generates a random numeric OTP using a cryptographically secure source.
+
+    Args:
+        digits (int, optional): Number of digits. Defaults to settings.otp_digits.
+
+    Returns:
+        str: The zero-padded OTP.
+    """
+    digits = digits or settings.otp_digits
+    return str(secrets.randbelow(10 ** digits)).zfill(digits)
+
+
+def get_otp_digest(otp: str, subject: str) -> str:
+    """
+    Computes the keyed HMAC-SHA256 digest stored in place of an OTP.
+
+    OTPs expire within minutes and are limited to a few attempts, so a keyed digest is
+    enough to keep them unreadable at rest; unlike bcrypt it costs microseconds.
+
+    Args:
+        otp (str): The plaintext OTP.
+        subject (str): What the OTP is bound to (e.g., user id and channel), so that a
+            digest cannot be replayed for another user or channel.
+
+    Returns:
+        str: The hex-encoded digest.
+    """
+    key = (settings.otp_secret or settings.jwt_secret).encode("utf-8")
+    return hmac.new(key, f"{subject}:{otp}".encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+def verify_otp_digest(otp: str, subject: str, digest: Optional[str]) -> bool:
+    """
+    Verifies an OTP against its stored digest in constant time.
+
+    Args:
+        otp (str): The plaintext OTP to verify.
+        subject (str): The subject the OTP was issued for.
+        digest (Optional[str]): The stored digest.
+
+    Returns:
+        bool: True if the OTP matches the digest, False otherwise.
+    """
+    if not digest:
+        return False
+    return hmac.compare_digest(get_otp_digest(otp, subject), digest)
+
+
+# Marks API keys so they are recognizable in logs and by secret scanners
+API_KEY_PREFIX = "trk_"
+
+
+def generate_api_key() -> str:
+    """
+    Generates a new API key with 256 bits of entropy.
+
+    Returns:
+        str: The plaintext key; it is shown to the client once and only its digest is stored.
+    """
+    return API_KEY_PREFIX + secrets.token_urlsafe(32)
+
+
+def get_api_key_digest(key: str) -> str:
+    """
+    Computes the SHA-256 digest stored in place of an API key.
+
+    API keys are random and far too long to brute force, so a plain digest protects them
+    at rest and, unlike bcrypt, allows looking a key up by its digest in microseconds.
+
+    Args:
+        key (str): The plaintext API key.
+
+    Returns:
+        str: The hex-encoded digest.
+    """
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
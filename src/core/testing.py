@@ -0,0 +1,60 @@
+from contextlib import contextmanager
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from typing import List
+
+
+class QueryCounter:
+    """
+    Collects the SQL statements executed on an engine while it is attached.
+    """
+
+    def __init__(self):
+        self.statements: List[str] = []
+
+    @property
+    def count(self) -> int:
+        """
+        Returns the number of statements executed so far.
+        """
+        return len(self.statements)
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+
+@contextmanager
+def count_queries(engine: AsyncEngine):
+    """
+    Counts the SQL statements executed on an engine inside the block.
+
+    Example:
+        with count_queries(engine) as counter:
+            client.get("/api/v1/offices?include=users")
+        print(counter.count)
+    """
+    counter = QueryCounter()
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", counter)
+    try:
+        yield counter
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", counter)
+
+
+@contextmanager
+def assert_query_count(engine: AsyncEngine, expected: int):
+    """
+    Asserts that exactly `expected` SQL statements are executed inside the block.
+
+    Use it around a request to pin the number of queries an endpoint issues, so that
+    an accidental N+1 pattern fails the test instead of surfacing as latency.
+
+    Raises:
+        AssertionError: If the number of statements differs, listing the statements run.
+    """
+    with count_queries(engine) as counter:
+        yield counter
+    if counter.count != expected:
+        listing = "\n".join(f"  {index + 1}. {sql}" for index, sql in enumerate(counter.statements))
+        raise AssertionError(f"Expected {expected} queries, got {counter.count}:\n{listing}")
@@ -0,0 +1,94 @@
+from sqlalchemy import Column, String, DateTime, Date, BigInteger
+from src.models.base import Base
+from src.models.types import CodedString
+from src.features.users.models.user_activity import ACTIVITY_ACTIONS
+
+# Stored in place of a missing office or role, so it can be part of the primary key
+NO_VALUE = ""
+
+
+class ActivityRollupColumns:
+    """
+    Columns shared by the hourly and daily activity rollups.
+
+    Each row counts the activity entries of one action by users of one office and role
+    within one bucket. Office and role are those of the user when the entry was rolled up.
+    """
+    action = Column(
+        CodedString(ACTIVITY_ACTIONS),
+        primary_key=True,
+        nullable=False,
+        doc="The action counted, stored as its code from ACTIVITY_ACTIONS."
+    )
+    office = Column(
+        String(16),
+        primary_key=True,
+        nullable=False,
+        default=NO_VALUE,
+        doc="Office code of the users; empty for users without an office."
+    )
+    role = Column(
+        String(24),
+        primary_key=True,
+        nullable=False,
+        default=NO_VALUE,
+        doc="Role of the users; empty for users without a role."
+    )
+    total = Column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        doc="Number of activity entries in the bucket."
+    )
+
+    def __repr__(self):
+        """
+        Provides a string representation of the object for debugging and logging.
+        """
+        return (
+            f"<{type(self).__name__}(bucket={self.bucket!r}, action={self.action!r}, "
+            f"office={self.office!r}, role={self.role!r}, total={self.total!r})>"
+        )
+
+    def to_dict(self):
+        """
+        Converts the object to a dictionary for JSON serialization or API responses.
+
+        Returns:
+            dict: A dictionary representation of the rollup row.
+        """
+        return {
+            "bucket": self.bucket.isoformat() if self.bucket else None,
+            "action": self.action,
+            "office": self.office or None,
+            "role": self.role or None,
+            "total": self.total,
+        }
+
+
+class ActivityRollupHourly(ActivityRollupColumns, Base):
+    """
+    Represents the activity counts of one hour.
+    """
+    __tablename__ = "activity_rollups_hourly"
+
+    bucket = Column(
+        DateTime,
+        primary_key=True,
+        nullable=False,
+        doc="Start of the hour (UTC)."
+    )
+
+
+class ActivityRollupDaily(ActivityRollupColumns, Base):
+    """
+    Represents the activity counts of one day.
+    """
+    __tablename__ = "activity_rollups_daily"
+
+    bucket = Column(
+        Date,
+        primary_key=True,
+        nullable=False,
+        doc="The day (UTC)."
+    )
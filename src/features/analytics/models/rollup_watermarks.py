@@ -0,0 +1,62 @@
+from sqlalchemy import Column, String, DateTime, BigInteger
+from src.models.base import Base
+from datetime import datetime
+
+
+class RollupWatermark(Base):
+    """
+    Represents how far a rollup has consumed its source table.
+
+    Source rows with an id up to `last_id` are included in the rollup. `pending_id` is
+    the highest id seen on the previous run; it is consumed on the next run, which gives
+    transactions that allocated lower ids a full interval to commit before their rows
+    are rolled up.
+    """
+    __tablename__ = "rollup_watermarks"
+
+    # Columns
+    name = Column(
+        String(32),
+        primary_key=True,
+        nullable=False,
+        doc="Name of the rollup (e.g., 'user_activity')."
+    )
+    last_id = Column(
+        BigInteger,
+        default=0,
+        nullable=False,
+        doc="Highest source id included in the rollup."
+    )
+    pending_id = Column(
+        BigInteger,
+        default=0,
+        nullable=False,
+        doc="Highest source id seen on the previous run; consumed on the next run."
+    )
+    updated_at = Column(
+        DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        nullable=False,
+        doc="Timestamp of the last run."
+    )
+
+    def __repr__(self):
+        """
+        Provides a string representation of the object for debugging and logging.
+        """
+        return f"<RollupWatermark(name={self.name!r}, last_id={self.last_id!r})>"
+
+    def to_dict(self):
+        """
+        Converts the object to a dictionary for JSON serialization or API responses.
+
+        Returns:
+            dict: A dictionary representation of the RollupWatermark instance.
+        """
+        return {
+            "name": self.name,
+            "last_id": self.last_id,
+            "pending_id": self.pending_id,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
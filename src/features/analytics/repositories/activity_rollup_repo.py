@@ -0,0 +1,263 @@
+from sqlalchemy import Integer, delete, func, literal_column, select, type_coerce, update
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from src.features.analytics.models.activity_rollups import ActivityRollupHourly, ActivityRollupDaily, NO_VALUE
+from src.features.analytics.models.rollup_watermarks import RollupWatermark
+from src.features.users.models.user_activity import UserActivity
+from src.features.users.models.users import User
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional, Tuple
+import numpy as np
+
+# Watermark row of the activity rollups
+WATERMARK = "user_activity"
+
+# Rollup tables with the SQL expression and numpy unit that truncate action_time to their bucket.
+# Constants are inlined so the SELECT and GROUP BY expressions match under ONLY_FULL_GROUP_BY.
+ROLLUPS = (
+    (ActivityRollupHourly, lambda column: func.date_format(column, literal_column("'%Y-%m-%d %H:00:00'")), "h"),
+    (ActivityRollupDaily, lambda column: func.date(column), "D"),
+)
+
+
+class ActivityRollupRepository:
+    """
+    Repository class for maintaining and reading the hourly and daily activity rollups.
+    """
+
+    @staticmethod
+    async def _watermark(conn: AsyncConnection) -> Tuple[int, int]:
+        """
+        Lock and return the (last_id, pending_id) watermark for the current transaction.
+        """
+        result = await conn.execute(
+            select(RollupWatermark.last_id, RollupWatermark.pending_id)
+            .where(RollupWatermark.name == WATERMARK)
+            .with_for_update()
+        )
+        return tuple(result.one())
+
+    @staticmethod
+    async def _set_watermark(conn: AsyncConnection, last_id: int, pending_id: int) -> None:
+        """
+        Store the watermark within the current transaction.
+        """
+        await conn.execute(
+            update(RollupWatermark.__table__)
+            .where(RollupWatermark.__table__.c.name == WATERMARK)
+            .values(last_id=last_id, pending_id=pending_id, updated_at=datetime.utcnow())
+        )
+
+    @staticmethod
+    async def _max_activity_id(conn: AsyncConnection) -> int:
+        """
+        Return the highest activity id, read from the primary key.
+        """
+        result = await conn.execute(select(func.coalesce(func.max(UserActivity.__table__.c.id), 0)))
+        return int(result.scalar_one())
+
+    @staticmethod
+    async def apply_increment(conn: AsyncConnection) -> int:
+        """
+        Roll up the activity entries that arrived since the previous run, in one transaction.
+
+        Consumes ids up to the previous run's maximum and remembers the current maximum for
+        the next run. Each rollup is updated with one INSERT ... SELECT ... GROUP BY that
+        adds to existing buckets.
+
+        Args:
+            conn (AsyncConnection): A connection holding the rollup lock.
+
+        Returns:
+            int: The highest activity id now included in the rollups.
+        """
+        async with conn.begin():
+            last_id, pending_id = await ActivityRollupRepository._watermark(conn)
+            current_max = await ActivityRollupRepository._max_activity_id(conn)
+            activity, users = UserActivity.__table__, User.__table__
+            if pending_id > last_id:
+                for model, truncate, _ in ROLLUPS:
+                    bucket = truncate(activity.c.action_time)
+                    office = func.coalesce(users.c.office, literal_column(f"'{NO_VALUE}'"))
+                    role = func.coalesce(users.c.role, literal_column(f"'{NO_VALUE}'"))
+                    source = (
+                        select(bucket, activity.c.action, office, role, func.count())
+                        .select_from(activity.outerjoin(users, users.c.id == activity.c.user_id))
+                        .where(activity.c.id > last_id, activity.c.id <= pending_id)
+                        .group_by(bucket, activity.c.action, office, role)
+                    )
+                    table = model.__table__
+                    statement = insert(table).from_select(["bucket", "action", "office", "role", "total"], source)
+                    await conn.execute(
+                        statement.on_duplicate_key_update(total=table.c.total + statement.inserted.total)
+                    )
+                last_id = pending_id
+            await ActivityRollupRepository._set_watermark(conn, last_id, max(current_max, last_id))
+        return last_id
+
+    @staticmethod
+    def _aggregate(
+        times: np.ndarray, actions: np.ndarray, groups: np.ndarray, unit: str
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Count entries per (bucket, action, office/role group) with array operations.
+
+        Returns:
+            Tuple of the distinct buckets, actions and group indexes, and their counts.
+        """
+        buckets = times.astype(f"datetime64[{unit}]").astype(np.int64)
+        keys = np.stack([buckets, actions, groups], axis=1)
+        distinct, counts = np.unique(keys, axis=0, return_counts=True)
+        return distinct[:, 0].astype(f"datetime64[{unit}]"), distinct[:, 1], distinct[:, 2], counts
+
+    @staticmethod
+    async def backfill(conn: AsyncConnection, chunk_size: int = 50000) -> int:
+        """
+        Recompute the rollups over all retained activity entries.
+
+        Only buckets from the one holding the oldest retained entry onwards are replaced;
+        older buckets aggregate activity whose partitions retention has dropped, and are
+        kept. Entries are read in id-ordered chunks and aggregated with numpy; each chunk's
+        aggregates are upserted in one multi-row statement per rollup and committed with
+        the watermark, so an interrupted backfill resumes incremental rollups consistently.
+
+        Args:
+            conn (AsyncConnection): A connection holding the rollup lock.
+            chunk_size (int): The number of activity entries per chunk.
+
+        Returns:
+            int: The highest activity id included in the rollups.
+        """
+        activity = UserActivity.__table__
+        async with conn.begin():
+            await ActivityRollupRepository._watermark(conn)
+            oldest = (await conn.execute(select(func.min(activity.c.action_time)))).scalar()
+            if oldest is not None:
+                for model, _, unit in ROLLUPS:
+                    table = model.__table__
+                    first_bucket = np.datetime64(oldest, unit).item()
+                    await conn.execute(delete(table).where(table.c.bucket >= first_bucket))
+            await ActivityRollupRepository._set_watermark(conn, 0, 0)
+            high = await ActivityRollupRepository._max_activity_id(conn)
+
+        result = await conn.execute(select(User.id, User.office, User.role))
+        user_rows = result.all()
+        await conn.commit()
+        # Users are mapped to an index into the distinct (office, role) pairs
+        pairs = sorted({(office or NO_VALUE, role or NO_VALUE) for _, office, role in user_rows} | {(NO_VALUE, NO_VALUE)})
+        pair_index = {pair: index for index, pair in enumerate(pairs)}
+        user_ids = np.array([user_id for user_id, _, _ in user_rows], dtype=np.int64)
+        user_groups = np.array(
+            [pair_index[(office or NO_VALUE, role or NO_VALUE)] for _, office, role in user_rows], dtype=np.int64
+        )
+        no_group = pair_index[(NO_VALUE, NO_VALUE)]
+        # A trailing sentinel keeps every searchsorted position in range
+        order = np.argsort(user_ids)
+        user_ids = np.append(user_ids[order], np.iinfo(np.int64).max)
+        user_groups = np.append(user_groups[order], no_group)
+
+        last_id = 0
+        while last_id < high:
+            async with conn.begin():
+                result = await conn.execute(
+                    select(activity.c.id, activity.c.user_id, type_coerce(activity.c.action, Integer), activity.c.action_time)
+                    .where(activity.c.id > last_id, activity.c.id <= high)
+                    .order_by(activity.c.id)
+                    .limit(chunk_size)
+                )
+                rows = result.all()
+                if not rows:
+                    last_id = high
+                    await ActivityRollupRepository._set_watermark(conn, high, high)
+                    break
+                ids, row_users, actions, times = zip(*rows)
+                row_users = np.array(row_users, dtype=np.int64)
+                positions = np.searchsorted(user_ids, row_users)
+                groups = np.where(user_ids[positions] == row_users, user_groups[positions], no_group)
+                times = np.array(times, dtype="datetime64[s]")
+                actions = np.array(actions, dtype=np.int64)
+
+                for model, _, unit in ROLLUPS:
+                    buckets, codes, group_ids, counts = ActivityRollupRepository._aggregate(times, actions, groups, unit)
+                    values = [
+                        {
+                            "bucket": bucket.item(),
+                            "action": int(code),
+                            "office": pairs[group][0],
+                            "role": pairs[group][1],
+                            "total": int(count),
+                        }
+                        for bucket, code, group, count in zip(buckets, codes, group_ids, counts)
+                    ]
+                    table = model.__table__
+                    statement = insert(table).values(values)
+                    await conn.execute(
+                        statement.on_duplicate_key_update(total=table.c.total + statement.inserted.total)
+                    )
+                last_id = int(ids[-1])
+                await ActivityRollupRepository._set_watermark(conn, last_id, last_id)
+        return last_id
+
+    @staticmethod
+    async def query(
+        db: AsyncSession,
+        granularity: str,
+        since: datetime,
+        until: datetime,
+        group_by: Iterable[str],
+        action: Optional[str] = None,
+        office: Optional[str] = None,
+        role: Optional[str] = None,
+    ) -> List[dict]:
+        """
+        Sum rollup rows per bucket and the requested dimensions.
+
+        Args:
+            db (AsyncSession): The database session.
+            granularity (str): "hour" or "day".
+            since (datetime): Start of the range (inclusive); the bucket containing it is included.
+            until (datetime): End of the range (exclusive); a bucket starting before it is
+                included, so a daily query up to now includes the current day.
+            group_by (Iterable[str]): Dimensions kept in the result ("action", "office", "role").
+            action (Optional[str]): Filter by action.
+            office (Optional[str]): Filter by office code.
+            role (Optional[str]): Filter by role.
+
+        Returns:
+            List[dict]: One entry per bucket and dimension values, ordered by bucket.
+        """
+        model = ActivityRollupHourly if granularity == "hour" else ActivityRollupDaily
+        # Floor the start to its bucket, so the partial first bucket is included
+        if granularity == "hour":
+            bucket_since = since.replace(minute=0, second=0, microsecond=0)
+            bucket_until = until
+        else:
+            bucket_since = since.date()
+            if until.time() == datetime.min.time():
+                bucket_until = until.date()
+            else:
+                bucket_until = until.date() + timedelta(days=1)
+        dimensions = [getattr(model, name) for name in ("action", "office", "role") if name in group_by]
+
+        query = (
+            select(model.bucket, *dimensions, func.sum(model.total).label("total"))
+            .where(model.bucket >= bucket_since, model.bucket < bucket_until)
+            .group_by(model.bucket, *dimensions)
+            .order_by(model.bucket, *dimensions)
+        )
+        if action is not None:
+            query = query.where(model.action == action)
+        if office is not None:
+            query = query.where(model.office == office)
+        if role is not None:
+            query = query.where(model.role == role)
+        result = await db.execute(query)
+
+        entries = []
+        for row in result.mappings().all():
+            entry = {"bucket": row["bucket"], "total": int(row["total"])}
+            for column in dimensions:
+                value = row[column.key]
+                entry[column.key] = value if value != NO_VALUE else None
+            entries.append(entry)
+        return entries
@@ -0,0 +1,32 @@
+from fastapi import APIRouter, Depends, Query
+from typing import List, Optional
+from datetime import datetime
+from src.features.analytics.services.activity_rollup_service import get_activity_analytics
+from src.features.analytics.schemas.analytics_schemas import ActivityRollupPoint
+from src.core.db import get_db
+from src.features.auth.dependencies import require_privilege
+
+
+router = APIRouter()
+
+
+@router.get(
+    "/activity",
+    response_model=List[ActivityRollupPoint],
+    response_model_exclude_unset=True,
+    dependencies=[Depends(require_privilege("USER_R"))],
+)
+async def read_activity_analytics(
+    db=Depends(get_db),
+    granularity: str = Query("hour", description="Bucket size: hour or day"),
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    group_by: List[str] = Query([], description="Dimensions to break down by: action, office, role"),
+    action: Optional[str] = None,
+    office: Optional[str] = None,
+    role: Optional[str] = None,
+):
+    """
+    Retrieve activity counts per hour or day, read from the rollups.
+    """
+    return await get_activity_analytics(db, granularity, since, until, group_by, action, office, role)
@@ -0,0 +1,17 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+from datetime import datetime
+
+
+class ActivityRollupPoint(BaseModel):
+    """
+    Schema for the activity count of one bucket and combination of the grouped dimensions.
+
+    Dimensions not requested in `group_by` are omitted; an empty office or role means
+    users without one.
+    """
+    bucket: datetime = Field(..., description="Start of the hour or day (UTC)")
+    action: Optional[str] = Field(None, description="Action counted, if grouped by action")
+    office: Optional[str] = Field(None, description="Office code, if grouped by office")
+    role: Optional[str] = Field(None, description="Role, if grouped by role")
+    total: int = Field(..., description="Number of activity entries")
@@ -0,0 +1,131 @@
+"""
+Hourly and daily rollups of `user_activity` per action, office and role.
+
+Rollups are advanced incrementally from a high-watermark on the activity id, so each run
+only aggregates the entries added since the previous one. A full recomputation is done in
+vectorized batches by the backfill:
+
+    python -m src.features.analytics.services.activity_rollup_service --backfill
+
+Without arguments, a single incremental run is made.
+"""
+from fastapi import HTTPException
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from src.core.config import settings
+from src.core.db import engine
+from src.features.analytics.repositories.activity_rollup_repo import ActivityRollupRepository
+from src.features.users.models.user_activity import ACTIVITY_ACTIONS
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, List, Optional
+import argparse
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Named lock ensuring only one worker advances the rollups at a time
+LOCK_NAME = "activity_rollups"
+GRANULARITIES = ("hour", "day")
+DIMENSIONS = ("action", "office", "role")
+# Range queried when the client gives none
+DEFAULT_RANGE = timedelta(days=30)
+
+
+async def _with_rollup_lock(job: Callable[[AsyncConnection], Awaitable[int]]) -> Optional[int]:
+    """
+    Run a rollup job on a connection holding the rollup lock.
+
+    Returns:
+        Optional[int]: The job's result, or None if another worker holds the lock.
+    """
+    async with engine.connect() as conn:
+        acquired = (await conn.execute(text("SELECT GET_LOCK(:name, 0)"), {"name": LOCK_NAME})).scalar()
+        # The lock belongs to the connection and outlives this transaction
+        await conn.commit()
+        if not acquired:
+            return None
+        try:
+            return await job(conn)
+        finally:
+            await conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": LOCK_NAME})
+            await conn.commit()
+
+
+async def run_activity_rollups() -> None:
+    """
+    Add the activity entries recorded since the previous run to the rollups, unless another
+    worker is already doing so.
+    """
+    await _with_rollup_lock(ActivityRollupRepository.apply_increment)
+
+
+async def backfill_activity_rollups() -> Optional[int]:
+    """
+    Recompute the rollups from all retained activity entries.
+
+    Returns:
+        Optional[int]: The highest activity id rolled up, or None if the rollups are busy.
+    """
+    return await _with_rollup_lock(
+        lambda conn: ActivityRollupRepository.backfill(conn, settings.activity_rollup_backfill_chunk)
+    )
+
+
+async def get_activity_analytics(
+    db: AsyncSession,
+    granularity: str = "hour",
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    group_by: Optional[List[str]] = None,
+    action: Optional[str] = None,
+    office: Optional[str] = None,
+    role: Optional[str] = None,
+) -> List[dict]:
+    """
+    Retrieve activity counts per hour or day from the rollups.
+
+    Args:
+        db (AsyncSession): The database session.
+        granularity (str): "hour" or "day".
+        since (datetime, optional): Start of the range; defaults to 30 days before `until`.
+        until (datetime, optional): End of the range (exclusive); defaults to now.
+        group_by (List[str], optional): Dimensions to break the counts down by.
+        action (str, optional): Only count this action.
+        office (str, optional): Only count users of this office.
+        role (str, optional): Only count users with this role.
+
+    Returns:
+        List[dict]: The counts per bucket, ordered by bucket.
+
+    Raises:
+        HTTPException: If the granularity, dimensions, action or range are invalid.
+    """
+    if granularity not in GRANULARITIES:
+        raise HTTPException(status_code=400, detail=f"Invalid granularity. Use one of: {', '.join(GRANULARITIES)}.")
+    group_by = group_by or []
+    unknown = set(group_by) - set(DIMENSIONS)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid group_by: {', '.join(sorted(unknown))}. Use any of: {', '.join(DIMENSIONS)}.",
+        )
+    if action is not None and action not in ACTIVITY_ACTIONS:
+        raise HTTPException(status_code=400, detail=f"Invalid action. Use one of: {', '.join(ACTIVITY_ACTIONS)}.")
+
+    until = until or datetime.utcnow()
+    since = since or until - DEFAULT_RANGE
+    if since >= until:
+        raise HTTPException(status_code=400, detail="`since` must be before `until`.")
+    return await ActivityRollupRepository.query(db, granularity, since, until, group_by, action, office, role)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Maintain the user activity rollups.")
+    parser.add_argument("--backfill", action="store_true", help="recompute the rollups from all activity")
+    arguments = parser.parse_args()
+    if arguments.backfill:
+        rolled_up = asyncio.run(backfill_activity_rollups())
+        print("Rollups are busy, try again later." if rolled_up is None else f"Rolled up activity up to id {rolled_up}.")
+    else:
+        asyncio.run(run_activity_rollups())
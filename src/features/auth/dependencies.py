@@ -0,0 +1,136 @@
+from fastapi import Depends, HTTPException, status
+from fastapi.security import APIKeyHeader, HTTPAuthorizationCredentials, HTTPBearer
+from src.features.auth.services.jwt_util import decode_token
+from src.features.auth.services.revocation_service import token_revocation_list
+from src.features.auth.services.authz_service import privilege_resolver, principal_privileges
+from src.features.auth.services.api_key_service import api_key_cache
+from typing import Callable, Optional
+
+# Reads the bearer token; missing credentials are reported by get_current_claims
+bearer_scheme = HTTPBearer(auto_error=False)
+# Reads the API key of machine clients; used instead of a bearer token when present
+api_key_scheme = APIKeyHeader(name="X-API-Key", auto_error=False)
+
+
+def _unauthorized(detail: str) -> HTTPException:
+    """
+    Build a 401 response asking for bearer authentication.
+    """
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+async def get_current_claims(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
+) -> dict:
+    """
+    Authenticates the request from its bearer access token.
+
+    The signature and expiry are checked locally and revocation against the in-memory
+    revocation list, so no database round trip is needed in the common case.
+
+    Args:
+        credentials (Optional[HTTPAuthorizationCredentials]): The bearer credentials.
+
+    Returns:
+        dict: The claims of the access token.
+
+    Raises:
+        HTTPException: If the token is missing, invalid, expired, or revoked.
+    """
+    if credentials is None:
+        raise _unauthorized("Not authenticated")
+    try:
+        claims = decode_token(credentials.credentials)
+    except ValueError as e:
+        raise _unauthorized(str(e))
+    if claims.get("type") != "access" or not claims.get("jti"):
+        raise _unauthorized("Invalid or expired token")
+    if await token_revocation_list.is_revoked(claims["jti"]):
+        raise _unauthorized("Token has been revoked")
+    return claims
+
+
+async def get_current_principal(
+    api_key: Optional[str] = Depends(api_key_scheme),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
+) -> dict:
+    """
+    Authenticates the request from its API key or, failing that, its bearer access token.
+
+    API keys are resolved from the in-memory key cache after their first use, so neither
+    kind of credential normally costs a database round trip.
+
+    Args:
+        api_key (Optional[str]): The X-API-Key header.
+        credentials (Optional[HTTPAuthorizationCredentials]): The bearer credentials.
+
+    Returns:
+        dict: The claims of the access token, or the principal of the API key
+            (with "type" set to "api_key").
+
+    Raises:
+        HTTPException: If the credentials are missing or invalid.
+    """
+    if api_key:
+        principal = await api_key_cache.authenticate(api_key)
+        if principal is None:
+            raise _unauthorized("Invalid, revoked or expired API key")
+        return principal
+    return await get_current_claims(credentials)
+
+
+def require_privilege(privilege: str) -> Callable:
+    """
+    Builds a dependency that admits only users whose role grants a privilege.
+
+    Users are checked against their role's current effective privileges (including
+    inherited ones), so grant changes apply to tokens that are already issued; API keys
+    against the privileges they were created with.
+
+    Args:
+        privilege (str): The privilege required (e.g., 'USER_W').
+
+    Returns:
+        Callable: A dependency returning the claims of the authorized token or API key.
+    """
+    async def dependency(claims: dict = Depends(get_current_principal)) -> dict:
+        await privilege_resolver.ensure_loaded()
+        if privilege not in principal_privileges(claims):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Missing privilege '{privilege}'.",
+            )
+        return claims
+
+    return dependency
+
+
+def require_self_or_privilege(privilege: str) -> Callable:
+    """
+    Builds a dependency for routes about one user (`{user_id}` in the path) that admits
+    that user themselves, or any principal holding a privilege.
+
+    API keys are only admitted by privilege, even though they carry their creator's id.
+
+    Args:
+        privilege (str): The privilege required to access other users (e.g., 'USER_R').
+
+    Returns:
+        Callable: A dependency returning the claims of the authorized token or API key.
+    """
+    async def dependency(user_id: int, claims: dict = Depends(get_current_principal)) -> dict:
+        if claims.get("type") != "api_key" and claims.get("userid") == user_id:
+            return claims
+        await privilege_resolver.ensure_loaded()
+        if privilege not in principal_privileges(claims):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Missing privilege '{privilege}'.",
+            )
+        return claims
+
+    return dependency
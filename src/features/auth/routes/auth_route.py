@@ -1,12 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Literal, Optional
 from src.core.db import get_db
-from src.features.auth.services.auth_service import authenticate_user
+from src.features.auth.dependencies import get_current_claims
+from src.features.auth.services.auth_service import authenticate_user, sign_out
+from src.features.auth.services.otp_service import generate_user_otp, verify_user_otp
 
 # Define the router
 router = APIRouter()
 
+
+def _client_info(request: Request) -> dict:
+    """
+    Extract the client details recorded in the user activity log.
+    """
+    return {
+        "ip_address": request.client.host if request.client else None,
+        "user_agent": request.headers.get("user-agent"),
+    }
+
 # Request schema for user signin
 class SigninRequest(BaseModel):
     loginid: str
@@ -33,10 +46,55 @@ class SigninResponse(BaseModel):
             }
         }
 
+# Request schema for user signout
+class SignoutRequest(BaseModel):
+    refresh_token: Optional[str] = None
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "refresh_token": "eyJhbGciOiJIUzI1Ni..."
+            }
+        }
+
+# Request schema for OTP generation
+class OtpGenerateRequest(BaseModel):
+    loginid: str
+    channel: Literal["mobile", "email"] = "mobile"
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "loginid": "admin",
+                "channel": "mobile"
+            }
+        }
+
+# Response schema for OTP generation
+class OtpGenerateResponse(BaseModel):
+    detail: str
+    expires_in: int
+
+# Request schema for OTP verification
+class OtpVerifyRequest(BaseModel):
+    loginid: str
+    channel: Literal["mobile", "email"] = "mobile"
+    otp: str = Field(..., pattern=r"^[0-9]{4,10}$")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "loginid": "admin",
+                "channel": "mobile",
+                "otp": "123456"
+            }
+        }
+
 
 @router.post("/signin", response_model=SigninResponse, tags=["Authentication"])
 async def signin(
     signin_data: SigninRequest,
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -44,6 +102,7 @@ async def signin(
 
     Args:
         signin_data (SigninRequest): Login credentials provided by the user.
+        request (Request): The incoming request, for the client details.
         db (AsyncSession): Database session injected via dependency.
 
     Returns:
@@ -53,7 +112,9 @@ async def signin(
         HTTPException: If authentication fails due to invalid credentials.
     """
     try:
-        tokens = await authenticate_user(db, signin_data.loginid, signin_data.password)
+        tokens = await authenticate_user(
+            db, signin_data.loginid, signin_data.password, **_client_info(request)
+        )
         return SigninResponse(**tokens)
     except ValueError as e:
         raise HTTPException(
@@ -61,3 +122,79 @@ async def signin(
             detail=str(e),
             headers={"WWW-Authenticate": "Bearer"},
         )
+
+
+@router.post("/otp/generate", response_model=OtpGenerateResponse, tags=["Authentication"])
+async def otp_generate(
+    otp_data: OtpGenerateRequest,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Generates an OTP for the user's mobile number or email address.
+
+    Args:
+        otp_data (OtpGenerateRequest): Login ID and delivery channel.
+        db (AsyncSession): Database session injected via dependency.
+
+    Returns:
+        OtpGenerateResponse: A confirmation and the validity of the OTP in seconds; the same
+            for unknown login IDs and for requests within the resend interval.
+    """
+    return await generate_user_otp(db, otp_data.loginid, otp_data.channel)
+
+
+@router.post("/otp/verify", response_model=SigninResponse, tags=["Authentication"])
+async def otp_verify(
+    otp_data: OtpVerifyRequest,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Verifies an OTP, marks the channel as verified and generates access and refresh tokens.
+
+    Args:
+        otp_data (OtpVerifyRequest): Login ID, channel and the OTP entered by the user.
+        request (Request): The incoming request, for the client details.
+        db (AsyncSession): Database session injected via dependency.
+
+    Returns:
+        SigninResponse: A dictionary containing access and refresh tokens.
+
+    Raises:
+        HTTPException: If the OTP is invalid, expired, or out of attempts.
+    """
+    tokens = await verify_user_otp(
+        db, otp_data.loginid, otp_data.channel, otp_data.otp, **_client_info(request)
+    )
+    return SigninResponse(**tokens)
+
+
+@router.post("/signout", response_model=dict, tags=["Authentication"])
+async def signout(
+    request: Request,
+    signout_data: Optional[SignoutRequest] = None,
+    claims: dict = Depends(get_current_claims),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Signs the user out by revoking the access token and, if given, the refresh token.
+
+    Args:
+        request (Request): The incoming request, for the client details.
+        signout_data (SignoutRequest, optional): The refresh token to revoke as well.
+        claims (dict): Claims of the authenticated access token.
+        db (AsyncSession): Database session injected via dependency.
+
+    Returns:
+        dict: A confirmation message.
+
+    Raises:
+        HTTPException: If the access token or the refresh token is invalid.
+    """
+    try:
+        await sign_out(
+            db, claims, signout_data.refresh_token if signout_data else None, **_client_info(request)
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return {"detail": "Signed out."}
@@ -0,0 +1,176 @@
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.features.users.models.api_keys import ApiKey
+from src.features.users.repositories.api_key_repo import ApiKeyRepository
+from src.features.users.repositories.privilege_repo import PrivilegeRepository
+from src.features.users.schemas.api_key_schemas import ApiKeyCreate
+from src.features.auth.services.authz_service import privilege_resolver, principal_privileges
+from src.core.security import generate_api_key, get_api_key_digest
+from src.core.config import settings
+from src.core.db import async_session
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+import time
+
+
+def _principal(api_key: ApiKey) -> dict:
+    """
+    Build the principal an API key authenticates as, shaped like access token claims.
+    """
+    return {
+        "type": "api_key",
+        "api_key_id": api_key.id,
+        "name": api_key.name,
+        "userid": api_key.created_by,
+        "privileges": sorted(api_key.privileges or ()),
+        "expires_at": api_key.expires_at,
+    }
+
+
+class ApiKeyCache:
+    """
+    Per-worker cache of authenticated API keys, keyed by digest.
+
+    After the first request, a key is authenticated with a SHA-256 digest and a dict
+    lookup. Unknown and revoked keys are cached too, so invalid keys cannot force a query
+    per request. Revocations made by this worker apply immediately; those made by other
+    workers apply once the entry expires.
+    """
+
+    def __init__(self, ttl_seconds: int, max_size: int):
+        """
+        Initializes an empty cache.
+
+        Args:
+            ttl_seconds (int): How long a lookup result is reused.
+            max_size (int): Maximum number of keys cached; the oldest entry is evicted first.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries: Dict[str, Tuple[float, Optional[dict]]] = {}
+
+    def _store(self, key_digest: str, principal: Optional[dict]) -> None:
+        """
+        Cache the lookup result of a digest, evicting the oldest entry when full.
+        """
+        self._entries.pop(key_digest, None)
+        if len(self._entries) >= self.max_size:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key_digest] = (time.monotonic() + self.ttl_seconds, principal)
+
+    def invalidate(self, key_digest: str) -> None:
+        """
+        Drop a key from the cache, e.g. after revoking it.
+
+        Args:
+            key_digest (str): The digest of the key.
+        """
+        self._entries.pop(key_digest, None)
+
+    async def authenticate(self, key: str) -> Optional[dict]:
+        """
+        Resolve an API key to the principal it authenticates as.
+
+        Args:
+            key (str): The plaintext API key from the request.
+
+        Returns:
+            Optional[dict]: The principal, or None if the key is unknown, revoked or expired.
+        """
+        key_digest = get_api_key_digest(key)
+        entry = self._entries.get(key_digest)
+        if entry is None or entry[0] <= time.monotonic():
+            async with async_session() as db:
+                api_key = await ApiKeyRepository.get_by_digest(db, key_digest)
+            principal = _principal(api_key) if api_key is not None and api_key.active else None
+            self._store(key_digest, principal)
+        else:
+            principal = entry[1]
+        if principal is None:
+            return None
+        if principal["expires_at"] is not None and principal["expires_at"] <= datetime.utcnow():
+            return None
+        return principal
+
+
+# Shared API key cache for this worker
+api_key_cache = ApiKeyCache(settings.api_key_cache_seconds, settings.api_key_cache_size)
+
+
+async def get_all_api_keys(db: AsyncSession, active: Optional[bool] = None) -> List[dict]:
+    """
+    Retrieve all API keys, without their values.
+
+    Args:
+        db (AsyncSession): The database session.
+        active (bool, optional): Filter by active status.
+
+    Returns:
+        List[dict]: The API keys as dictionaries.
+    """
+    api_keys = await ApiKeyRepository.get_all(db, active)
+    return [api_key.to_dict() for api_key in api_keys]
+
+async def create_api_key(db: AsyncSession, data: ApiKeyCreate, claims: dict) -> dict:
+    """
+    Create an API key scoped to a set of privileges.
+
+    The creator can only grant privileges they hold themselves.
+
+    Args:
+        db (AsyncSession): The database session.
+        data (ApiKeyCreate): The name, privileges and expiry of the key.
+        claims (dict): The authenticated principal creating the key.
+
+    Returns:
+        dict: The created key, including its value, which is not retrievable later.
+
+    Raises:
+        HTTPException: If a privilege does not exist or is not held by the creator,
+            or the expiry is in the past.
+    """
+    privileges = set(data.privileges)
+    missing = privileges - await PrivilegeRepository.get_existing(db, privileges)
+    if missing:
+        raise HTTPException(status_code=400, detail=f"Unknown privileges: {', '.join(sorted(missing))}.")
+    await privilege_resolver.ensure_loaded()
+    not_held = privileges - principal_privileges(claims)
+    if not_held:
+        raise HTTPException(
+            status_code=403,
+            detail=f"Cannot grant privileges you do not hold: {', '.join(sorted(not_held))}.",
+        )
+    if data.expires_at is not None and data.expires_at <= datetime.utcnow():
+        raise HTTPException(status_code=400, detail="`expires_at` must be in the future.")
+
+    key = generate_api_key()
+    api_key = await ApiKeyRepository.create(db, {
+        "name": data.name,
+        "key_prefix": key[:12],
+        "key_digest": get_api_key_digest(key),
+        "privileges": sorted(privileges),
+        "expires_at": data.expires_at,
+        "created_by": claims.get("userid"),
+    })
+    return {**api_key.to_dict(), "key": key}
+
+async def revoke_api_key(db: AsyncSession, api_key_id: int) -> dict:
+    """
+    Revoke an API key.
+
+    Args:
+        db (AsyncSession): The database session.
+        api_key_id (int): The unique identifier of the key.
+
+    Returns:
+        dict: The revoked key as a dictionary.
+
+    Raises:
+        HTTPException: If the key does not exist.
+    """
+    api_key = await ApiKeyRepository.get_by_id(db, api_key_id)
+    if not api_key:
+        raise HTTPException(status_code=404, detail="API key not found.")
+    api_key = await ApiKeyRepository.revoke(db, api_key)
+    api_key_cache.invalidate(api_key.key_digest)
+    return api_key.to_dict()
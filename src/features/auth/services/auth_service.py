@@ -1,19 +1,67 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from src.features.users.models.users import User
-from src.features.auth.services.jwt_util import create_access_token, create_refresh_token
+from src.features.auth.services.jwt_util import create_access_token, create_refresh_token, decode_token
+from src.features.auth.services.revocation_service import token_revocation_list
+from src.features.auth.services.authz_service import privilege_resolver
+from src.features.users.services.user_activity_service import record_user_activity
 from src.core.security import verify_hash
-from datetime import timedelta
+from datetime import datetime, timedelta
+from typing import Optional
 
 
-async def authenticate_user(session: AsyncSession, loginid: str, password: str) -> dict:
+async def issue_tokens(user: User) -> dict:
+    """
+    Creates the access and refresh tokens for an authenticated user.
+
+    The token lists the effective privileges of the user's role, including those
+    inherited from parent roles.
+
+    Args:
+        user (User): The authenticated user.
+
+    Returns:
+        dict: A dictionary containing the access and refresh tokens.
+    """
+    await privilege_resolver.ensure_loaded()
+    user_data = {
+        "userid": user.id,
+        "loginid": user.loginid,
+        "name": user.name,
+        "gender": user.gender,
+        "profile_pic_url": user.profile_pic_url,
+        "lang_pref": user.lang_pref,
+        "tzone": user.tzone,
+        "role": user.role,
+        "privileges": sorted(privilege_resolver.privileges_for(user.role)),
+        "office": user.office,
+        "job_title": user.job_title,
+    }
+
+    access_token = create_access_token(user_data)
+    refresh_token = create_refresh_token(user_data)
+
+    return {"access_token": access_token, "refresh_token": refresh_token}
+
+
+async def authenticate_user(
+    session: AsyncSession,
+    loginid: str,
+    password: str,
+    ip_address: Optional[str] = None,
+    user_agent: Optional[str] = None,
+) -> dict:
     """
     Authenticates the user by login ID and password.
 
+    Successful and failed attempts on existing users are recorded in the user's activity.
+
     Args:
         session (AsyncSession): Database session.
         loginid (str): Login ID of the user.
         password (str): Plaintext password.
+        ip_address (str, optional): Client IP address, for the activity log.
+        user_agent (str, optional): Client user agent, for the activity log.
 
     Returns:
         dict: A dictionary containing the user's information and tokens if authentication succeeds.
@@ -26,25 +74,51 @@ async def authenticate_user(session: AsyncSession, loginid: str, password: str)
     result = await session.execute(query)
     user = result.scalar_one_or_none()
 
-    if not user or not verify_hash(password, user.password):
+    if not user or not user.password or not verify_hash(password, user.password):
+        if user:
+            await record_user_activity(session, user.id, "FAILED_LOGIN", ip_address, user_agent)
         raise ValueError("Invalid login credentials")
 
+    await record_user_activity(session, user.id, "LOGIN", ip_address, user_agent)
+
     # Create JWT tokens
-    user_data = {
-        "userid": user.id,
-        "loginid": user.loginid,
-        "name": user.name,
-        "gender": user.gender,
-        "profile_pic_url": user.profile_pic_url,
-        "lang_pref": user.lang_pref,
-        "tzone": user.tzone,
-        "role": user.role,
-        "privileges": [],  # Placeholder for privileges
-        "office": user.office,
-        "job_title": user.job_title,
-    }
+    return await issue_tokens(user)
 
-    access_token = create_access_token(user_data)
-    refresh_token = create_refresh_token(user_data)
 
-    return {"access_token": access_token, "refresh_token": refresh_token}
+async def sign_out(
+    session: AsyncSession,
+    claims: dict,
+    refresh_token: Optional[str] = None,
+    ip_address: Optional[str] = None,
+    user_agent: Optional[str] = None,
+) -> None:
+    """
+    Revokes the access token of the request and, if given, the user's refresh token.
+
+    Args:
+        session (AsyncSession): Database session.
+        claims (dict): Claims of the authenticated access token.
+        refresh_token (str, optional): The refresh token issued alongside the access token.
+        ip_address (str, optional): Client IP address, for the activity log.
+        user_agent (str, optional): Client user agent, for the activity log.
+
+    Raises:
+        ValueError: If the refresh token is invalid or belongs to another user.
+    """
+    revoke = [claims]
+    if refresh_token:
+        refresh_claims = decode_token(refresh_token)
+        if refresh_claims.get("type") != "refresh" or refresh_claims.get("userid") != claims.get("userid"):
+            raise ValueError("Invalid refresh token")
+        revoke.append(refresh_claims)
+
+    for token_claims in revoke:
+        if token_claims.get("jti"):
+            await token_revocation_list.revoke(
+                session,
+                token_claims["jti"],
+                datetime.utcfromtimestamp(token_claims["exp"]),
+                token_claims.get("userid"),
+            )
+    if claims.get("userid"):
+        await record_user_activity(session, claims["userid"], "LOGOUT", ip_address, user_agent)
@@ -0,0 +1,243 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from src.features.users.models.roles import Role
+from src.features.users.models.role_privileges import RolePrivilege
+from src.features.users.models.authz_versions import AuthzVersion, AUTHZ_VERSION_ID
+from src.core.db import async_session
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+from collections import deque
+import asyncio
+
+
+class PrivilegeResolver:
+    """
+    In-memory transitive closure of the role hierarchy.
+
+    Holds, for every role, the frozen set of privileges it grants directly or inherits
+    through its chain of parent roles, so an authorization check is one dict lookup and
+    one set membership test however deep the hierarchy is.
+
+    Changes to the role graph recompute only the affected role and its descendants.
+    Changes made by other workers are picked up by `sync`, which reloads once whenever
+    the authorization version has moved.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty resolver; call `load` before use.
+        """
+        self._parents: Dict[str, Optional[str]] = {}
+        self._children: Dict[str, Set[str]] = {}
+        self._grants: Dict[str, Set[str]] = {}
+        self._effective: Dict[str, FrozenSet[str]] = {}
+        self.loaded = False
+        self.version: Optional[int] = None
+        self._lock = asyncio.Lock()
+
+    def _recompute(self, roles: Iterable[str]) -> None:
+        """
+        Recompute the effective privileges of the given roles and all their descendants.
+
+        Roles are visited parents-first, so each one only unions its own grants with its
+        parent's already up-to-date closure.
+        """
+        pending = deque(roles)
+        visited = set()
+        while pending:
+            role = pending.popleft()
+            if role in visited:
+                continue
+            visited.add(role)
+            parent = self._parents.get(role)
+            inherited = self._effective.get(parent, frozenset()) if parent else frozenset()
+            self._effective[role] = frozenset(self._grants.get(role, set())) | inherited
+            pending.extend(sorted(self._children.get(role, ())))
+
+    def _roots(self, roles: Iterable[str]) -> List[str]:
+        """
+        Return the given roles whose parent is not also among them.
+        """
+        roles = set(roles)
+        return [role for role in roles if self._parents.get(role) not in roles]
+
+    async def load(self, db: AsyncSession = None) -> None:
+        """
+        Load the role hierarchy and grants and compute every closure from scratch.
+
+        Args:
+            db (AsyncSession, optional): The database session; a new one is opened if omitted.
+        """
+        if db is None:
+            async with async_session() as session:
+                return await self.load(session)
+
+        # Read the version first: a change committed meanwhile makes the next sync reload again
+        version = (
+            await db.execute(select(AuthzVersion.version).where(AuthzVersion.id == AUTHZ_VERSION_ID))
+        ).scalar_one_or_none() or 0
+        roles = (await db.execute(select(Role.role, Role.parent_role))).all()
+        grants = (await db.execute(select(RolePrivilege.role, RolePrivilege.privilege))).all()
+
+        parents = {role: parent for role, parent in roles}
+        children: Dict[str, Set[str]] = {}
+        for role, parent in roles:
+            if parent:
+                children.setdefault(parent, set()).add(role)
+        granted: Dict[str, Set[str]] = {}
+        for role, privilege in grants:
+            granted.setdefault(role, set()).add(privilege)
+
+        self._parents, self._children, self._grants, self._effective = parents, children, granted, {}
+        self._recompute(self._roots(parents))
+        self.version = version
+        self.loaded = True
+
+    async def ensure_loaded(self, db: AsyncSession = None) -> None:
+        """
+        Load the resolver on first use.
+
+        Args:
+            db (AsyncSession, optional): The database session; a new one is opened if omitted.
+        """
+        if self.loaded:
+            return
+        async with self._lock:
+            if not self.loaded:
+                await self.load(db)
+
+    async def sync(self) -> None:
+        """
+        Reload the resolver if the authorization version changed since the last load.
+        """
+        async with async_session() as db:
+            version = (
+                await db.execute(select(AuthzVersion.version).where(AuthzVersion.id == AUTHZ_VERSION_ID))
+            ).scalar_one_or_none() or 0
+            if version == self.version:
+                return
+            async with self._lock:
+                await self.load(db)
+
+    def applied(self, version: int) -> None:
+        """
+        Record that a change committed as `version` has already been applied incrementally.
+
+        If other changes were committed in between, the version is left behind so the next
+        `sync` reloads.
+
+        Args:
+            version (int): The authorization version after the change.
+        """
+        if self.version is not None and version == self.version + 1:
+            self.version = version
+
+    def privileges_for(self, role: Optional[str]) -> FrozenSet[str]:
+        """
+        Return the effective privileges of a role.
+
+        Args:
+            role (Optional[str]): The role, or None for users without one.
+
+        Returns:
+            FrozenSet[str]: The privileges granted directly or inherited.
+        """
+        return self._effective.get(role, frozenset()) if role else frozenset()
+
+    def has_privilege(self, role: Optional[str], privilege: str) -> bool:
+        """
+        Check whether a role grants a privilege, directly or through inheritance.
+
+        Args:
+            role (Optional[str]): The role to check.
+            privilege (str): The privilege required.
+
+        Returns:
+            bool: True if the role has the privilege, False otherwise.
+        """
+        return privilege in self.privileges_for(role)
+
+    def check_parent(self, role: str, parent: Optional[str]) -> None:
+        """
+        Validate a parent assignment against the current hierarchy.
+
+        Args:
+            role (str): The role being changed.
+            parent (Optional[str]): The proposed parent role.
+
+        Raises:
+            ValueError: If the parent does not exist or the assignment would create a cycle.
+        """
+        if parent is None:
+            return
+        if parent not in self._parents:
+            raise ValueError(f"Role '{parent}' does not exist.")
+        ancestor = parent
+        while ancestor is not None:
+            if ancestor == role:
+                raise ValueError(f"Making '{parent}' the parent of '{role}' would create a cycle.")
+            ancestor = self._parents.get(ancestor)
+
+    def set_role(self, role: str, parent: Optional[str]) -> None:
+        """
+        Apply a created role or a changed parent, recomputing the role and its descendants.
+
+        Args:
+            role (str): The role.
+            parent (Optional[str]): Its parent role; validate with `check_parent` first.
+        """
+        previous = self._parents.get(role)
+        if previous:
+            self._children.get(previous, set()).discard(role)
+        if parent:
+            self._children.setdefault(parent, set()).add(role)
+        self._parents[role] = parent
+        self._recompute([role])
+
+    def set_grants(self, role: str, privileges: Iterable[str]) -> None:
+        """
+        Apply the new direct grants of a role, recomputing the role and its descendants.
+
+        Args:
+            role (str): The role.
+            privileges (Iterable[str]): The complete set of privileges granted directly.
+        """
+        self._grants[role] = set(privileges)
+        self._recompute([role])
+
+    def remove_role(self, role: str) -> None:
+        """
+        Apply a deleted role; its children become roots, as with ON DELETE SET NULL.
+
+        Args:
+            role (str): The deleted role.
+        """
+        orphans = self._children.pop(role, set())
+        parent = self._parents.pop(role, None)
+        if parent:
+            self._children.get(parent, set()).discard(role)
+        self._grants.pop(role, None)
+        self._effective.pop(role, None)
+        for child in orphans:
+            self._parents[child] = None
+        self._recompute(orphans)
+
+
+# Shared resolver for this worker
+privilege_resolver = PrivilegeResolver()
+
+
+def principal_privileges(claims: dict) -> FrozenSet[str]:
+    """
+    Return the privileges of an authenticated principal.
+
+    API keys carry their own privileges; users get the effective privileges of their role.
+
+    Args:
+        claims (dict): The claims of an access token or the principal of an API key.
+
+    Returns:
+        FrozenSet[str]: The privileges the principal holds.
+    """
+    if claims.get("type") == "api_key":
+        return frozenset(claims.get("privileges") or ())
+    return privilege_resolver.privileges_for(claims.get("role"))
@@ -0,0 +1,162 @@
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from fastapi import HTTPException
+from src.features.users.models.users import User
+from src.features.auth.services.auth_service import issue_tokens
+from src.features.users.services.user_activity_service import record_user_activity
+from src.core.config import settings
+from src.core.security import generate_otp, get_otp_digest, verify_otp_digest
+from datetime import datetime, timedelta
+from typing import Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Per-channel User columns: (digest, generated at, attempts, verified flag)
+OTP_CHANNELS = {
+    "mobile": ("otp", "otp_gen_at", "otp_attempts", "mobile_verified"),
+    "email": ("email_verification_otp", "email_otp_gen_at", "email_otp_attempts", "email_verified"),
+}
+
+
+def _otp_subject(user_id: int, channel: str) -> str:
+    """
+    Build the subject an OTP digest is bound to.
+    """
+    return f"{user_id}:{channel}"
+
+
+async def _get_active_user(db: AsyncSession, loginid: str) -> User:
+    """
+    Fetch an active, unlocked, non-deleted user by login ID, or None.
+    """
+    result = await db.execute(
+        select(User).where(
+            User.loginid == loginid,
+            User.active.is_(True),
+            User.is_locked.is_(False),
+            User.deleted_at.is_(None),
+        )
+    )
+    return result.scalar_one_or_none()
+
+
+async def generate_user_otp(db: AsyncSession, loginid: str, channel: str) -> dict:
+    """
+    Generate an OTP for a user's mobile number or email address.
+
+    Only the HMAC digest of the code is stored. The response is the same whether or not
+    the login ID exists, so the endpoint cannot be used to enumerate users; for the same
+    reason a request within the resend interval is ignored rather than rejected.
+
+    Args:
+        db (AsyncSession): The database session.
+        loginid (str): Login ID of the user.
+        channel (str): "mobile" or "email".
+
+    Returns:
+        dict: A confirmation message and the validity of the code in seconds.
+    """
+    digest_field, gen_at_field, attempts_field, _ = OTP_CHANNELS[channel]
+    response = {"detail": "OTP sent.", "expires_in": settings.otp_expiry_minutes * 60}
+
+    user = await _get_active_user(db, loginid)
+    if not user:
+        return response
+
+    now = datetime.utcnow()
+    generated_at = getattr(user, gen_at_field)
+    if generated_at and now - generated_at < timedelta(seconds=settings.otp_resend_seconds):
+        # The previous code stays valid; answering 429 here would reveal that the user exists
+        return response
+
+    otp = generate_otp()
+    await db.execute(
+        update(User)
+        .where(User.id == user.id)
+        .values({
+            digest_field: get_otp_digest(otp, _otp_subject(user.id, channel)),
+            gen_at_field: now,
+            attempts_field: 0,
+        })
+    )
+    await db.commit()
+
+    # Delivery (SMS / email gateway) hooks in here; the code is only logged in development
+    if settings.env == "development":
+        logger.debug("OTP for %s via %s: %s", loginid, channel, otp)
+    return response
+
+
+async def verify_user_otp(
+    db: AsyncSession,
+    loginid: str,
+    channel: str,
+    otp: str,
+    ip_address: Optional[str] = None,
+    user_agent: Optional[str] = None,
+) -> dict:
+    """
+    Verify an OTP, mark the channel as verified and sign the user in.
+
+    Every attempt is counted with a single conditional UPDATE before the digest is
+    compared, so concurrent guesses cannot exceed the attempt limit. A code is consumed
+    by the first successful verification. Unknown, locked and out-of-attempts login IDs
+    all get the same 401 as a wrong code, so the endpoint cannot be used to enumerate users.
+
+    Args:
+        db (AsyncSession): The database session.
+        loginid (str): Login ID of the user.
+        channel (str): "mobile" or "email".
+        otp (str): The code entered by the user.
+        ip_address (str, optional): Client IP address, for the activity log.
+        user_agent (str, optional): Client user agent, for the activity log.
+
+    Returns:
+        dict: A dictionary containing the access and refresh tokens.
+
+    Raises:
+        HTTPException: If the code is invalid, expired, or out of attempts, or the user is
+            unknown or locked.
+    """
+    digest_field, gen_at_field, attempts_field, verified_field = OTP_CHANNELS[channel]
+    invalid = HTTPException(status_code=401, detail="Invalid or expired OTP.")
+
+    user = await _get_active_user(db, loginid)
+    if not user:
+        raise invalid
+    digest, generated_at = getattr(user, digest_field), getattr(user, gen_at_field)
+    if not digest or not generated_at:
+        raise invalid
+    if datetime.utcnow() - generated_at > timedelta(minutes=settings.otp_expiry_minutes):
+        raise invalid
+
+    attempts = getattr(User, attempts_field)
+    result = await db.execute(
+        update(User)
+        .where(User.id == user.id, getattr(User, digest_field) == digest, attempts < settings.otp_max_attempts)
+        .values({attempts_field: attempts + 1})
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount == 0:
+        # Out of attempts; answering 429 here would reveal that the user exists
+        await db.commit()
+        raise invalid
+
+    if not verify_otp_digest(otp, _otp_subject(user.id, channel), digest):
+        await db.commit()
+        raise invalid
+
+    result = await db.execute(
+        update(User)
+        .where(User.id == user.id, getattr(User, digest_field) == digest)
+        .values({digest_field: None, verified_field: True, "last_login_at": datetime.utcnow()})
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    if result.rowcount == 0:
+        # A concurrent request consumed the code first
+        raise invalid
+    await record_user_activity(db, user.id, "LOGIN", ip_address, user_agent)
+    return await issue_tokens(user)
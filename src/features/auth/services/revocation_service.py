@@ -0,0 +1,184 @@
+from sqlalchemy import delete
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from src.features.users.models.revoked_tokens import RevokedToken
+from src.core.bloom import BloomFilter
+from src.core.config import settings
+from src.core.db import async_session
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Revocations younger than this are re-read on the next sync, so rows whose ids were
+# allocated before a concurrent commit became visible are not skipped by the watermark
+SYNC_SETTLE_SECONDS = 5
+
+
+class TokenRevocationList:
+    """
+    Per-worker view of the revoked token table for memory-only revocation checks.
+
+    Every revoked `jti` goes into a bloom filter and, while there is room, into an exact
+    set. A token absent from the bloom filter (the common case) is not revoked; one in the
+    exact set is. Only a bloom hit missing from the exact set (a false positive, or an
+    overflowed exact set) is resolved against the database.
+
+    The view is kept current by `sync`, which reads rows past an id watermark, and is
+    periodically rebuilt from scratch because bloom filters cannot forget expired entries.
+    """
+
+    def __init__(self, capacity: int, error_rate: float, exact_capacity: int):
+        """
+        Initializes an empty revocation list.
+
+        Args:
+            capacity (int): Number of revocations the bloom filter is sized for.
+            error_rate (float): Target false-positive rate of the bloom filter.
+            exact_capacity (int): Maximum number of token IDs kept in the exact set.
+        """
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.exact_capacity = exact_capacity
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._exact: Dict[str, datetime] = {}
+        self._last_id = 0
+        self._rebuilt_at: Optional[datetime] = None
+        self._lock = asyncio.Lock()
+
+    def _remember(
+        self,
+        jti: str,
+        expires_at: datetime,
+        bloom: Optional[BloomFilter] = None,
+        exact: Optional[Dict[str, datetime]] = None,
+    ) -> None:
+        """
+        Add a revoked token ID to the in-memory structures, or to the given replacements.
+        """
+        bloom = self._bloom if bloom is None else bloom
+        exact = self._exact if exact is None else exact
+        if jti in exact:
+            return
+        bloom.add(jti)
+        if len(exact) < self.exact_capacity:
+            exact[jti] = expires_at
+
+    async def _load(
+        self,
+        db: AsyncSession,
+        now: datetime,
+        last_id: int,
+        bloom: Optional[BloomFilter] = None,
+        exact: Optional[Dict[str, datetime]] = None,
+    ) -> int:
+        """
+        Read revocations past a watermark into the in-memory structures (or the given
+        replacements) and return the watermark advanced to the last settled row.
+        """
+        result = await db.execute(
+            select(RevokedToken.id, RevokedToken.jti, RevokedToken.expires_at, RevokedToken.revoked_at)
+            .where(RevokedToken.id > last_id, RevokedToken.expires_at > now)
+            .order_by(RevokedToken.id)
+        )
+        horizon = now - timedelta(seconds=SYNC_SETTLE_SECONDS)
+        settled = True
+        for row_id, jti, expires_at, revoked_at in result.all():
+            self._remember(jti, expires_at, bloom, exact)
+            settled = settled and revoked_at <= horizon
+            if settled:
+                last_id = row_id
+        return last_id
+
+    async def _rebuild(self, db: AsyncSession, now: datetime) -> None:
+        """
+        Purge expired revocations and reload the in-memory structures from the table.
+
+        The replacements are filled off to the side and swapped in at once, so revocation
+        checks keep using the current structures while the table is read.
+        """
+        await db.execute(delete(RevokedToken).where(RevokedToken.expires_at <= now))
+        await db.commit()
+        bloom, exact = BloomFilter(self.capacity, self.error_rate), {}
+        last_id = await self._load(db, now, 0, bloom, exact)
+        # Keep revocations this worker made while the table was being read
+        for jti, expires_at in list(self._exact.items()):
+            if expires_at > now:
+                self._remember(jti, expires_at, bloom, exact)
+        self._bloom, self._exact, self._last_id = bloom, exact, last_id
+        self._rebuilt_at = now
+        if len(self._bloom) > self.capacity:
+            logger.warning(
+                "Token revocation list holds %d entries, above its capacity of %d; "
+                "raise TOKEN_REVOCATION_CAPACITY to keep the false-positive rate down.",
+                len(self._bloom), self.capacity,
+            )
+
+    async def sync(self) -> None:
+        """
+        Bring the in-memory view up to date with the revoked token table.
+
+        Runs an incremental read past the watermark, or a full rebuild when the rebuild
+        interval has elapsed.
+        """
+        async with self._lock:
+            now = datetime.utcnow()
+            async with async_session() as db:
+                rebuild_due = self._rebuilt_at is None or now - self._rebuilt_at >= timedelta(
+                    minutes=settings.token_revocation_rebuild_minutes
+                )
+                if rebuild_due:
+                    await self._rebuild(db, now)
+                else:
+                    self._last_id = await self._load(db, now, self._last_id)
+            self._exact = {jti: expires_at for jti, expires_at in self._exact.items() if expires_at > now}
+
+    async def is_revoked(self, jti: str) -> bool:
+        """
+        Check whether a token ID has been revoked.
+
+        Args:
+            jti (str): The `jti` claim of the token.
+
+        Returns:
+            bool: True if the token has been revoked, False otherwise.
+        """
+        if jti not in self._bloom:
+            return False
+        if jti in self._exact:
+            return True
+        async with async_session() as db:
+            result = await db.execute(select(RevokedToken.id).where(RevokedToken.jti == jti))
+            return result.first() is not None
+
+    async def revoke(self, db: AsyncSession, jti: str, expires_at: datetime, user_id: Optional[int] = None) -> None:
+        """
+        Revoke a token until it expires.
+
+        The revocation takes effect in this worker immediately and in the others at
+        their next sync.
+
+        Args:
+            db (AsyncSession): The database session.
+            jti (str): The `jti` claim of the token.
+            expires_at (datetime): The expiry of the token.
+            user_id (Optional[int]): The user the token was issued to.
+        """
+        await db.execute(
+            insert(RevokedToken.__table__)
+            .prefix_with("IGNORE")
+            .values(jti=jti, user_id=user_id, expires_at=expires_at, revoked_at=datetime.utcnow())
+        )
+        await db.commit()
+        self._remember(jti, expires_at)
+
+
+# Shared revocation list for this worker
+token_revocation_list = TokenRevocationList(
+    settings.token_revocation_capacity,
+    settings.token_revocation_error_rate,
+    settings.token_revocation_exact_capacity,
+)
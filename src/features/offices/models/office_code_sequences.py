@@ -0,0 +1,52 @@
+from sqlalchemy import Column, String, DateTime, BigInteger
+from src.models.base import Base
+from datetime import datetime
+
+
+class OfficeCodeSequence(Base):
+    """
+    Represents the allocation state of generated office codes for one prefix.
+
+    Workers reserve codes in blocks by advancing `next_value`, then hand them out
+    from memory, so the table is touched once per block rather than once per office.
+    """
+    __tablename__ = "office_code_sequences"
+
+    # Columns
+    prefix = Column(
+        String(12),
+        primary_key=True,
+        nullable=False,
+        doc="Code prefix the sequence belongs to (e.g., 'HQ', 'BR')."
+    )
+    next_value = Column(
+        BigInteger,
+        nullable=False,
+        doc="First number not yet reserved by any worker."
+    )
+    updated_at = Column(
+        DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        nullable=False,
+        doc="Timestamp of when the last block was reserved."
+    )
+
+    def __repr__(self):
+        """
+        Provides a string representation of the object for debugging and logging.
+        """
+        return f"<OfficeCodeSequence(prefix={self.prefix!r}, next_value={self.next_value!r})>"
+
+    def to_dict(self):
+        """
+        Converts the object to a dictionary for JSON serialization or API responses.
+
+        Returns:
+            dict: A dictionary representation of the OfficeCodeSequence instance.
+        """
+        return {
+            "prefix": self.prefix,
+            "next_value": self.next_value,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
@@ -0,0 +1,86 @@
+from sqlalchemy import Column, String, DateTime, BigInteger, update
+from src.models.base import Base
+from datetime import datetime
+
+
+class OfficeCount(Base):
+    """
+    Represents a cached row count of offices for a single listing filter.
+
+    Each record holds the exact number of offices matching one filter combination
+    (e.g., 'all', 'active:1', 'active:0'). Counts are maintained incrementally by
+    the Office write listeners so that paginated listings can report a total
+    without running COUNT(*) over the offices table.
+    """
+    __tablename__ = "office_counts"
+
+    # Columns
+    filter_key = Column(
+        String(32),
+        primary_key=True,
+        nullable=False,
+        doc="Normalized filter combination the count applies to (e.g., 'all', 'active:1')."
+    )
+    total = Column(
+        BigInteger,
+        default=0,
+        nullable=False,
+        doc="Number of offices matching the filter combination."
+    )
+    updated_at = Column(
+        DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        nullable=False,
+        doc="Timestamp of when the count was last adjusted."
+    )
+
+    def __repr__(self):
+        """
+        Provides a string representation of the object for debugging and logging.
+        """
+        return f"<OfficeCount(filter_key={self.filter_key!r}, total={self.total!r})>"
+
+    def to_dict(self):
+        """
+        Converts the object to a dictionary for JSON serialization or API responses.
+
+        Returns:
+            dict: A dictionary representation of the OfficeCount instance.
+        """
+        return {
+            "filter_key": self.filter_key,
+            "total": self.total,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+
+def office_count_keys(active: bool) -> list:
+    """
+    Returns the counter keys an office with the given active status contributes to.
+
+    Args:
+        active (bool): The active status of the office.
+
+    Returns:
+        list: The filter keys whose counts include the office.
+    """
+    return ["all", f"active:{int(bool(active))}"]
+
+
+def adjust_office_counts(connection, deltas: dict):
+    """
+    Applies per-filter deltas to the cached office counts within the current transaction.
+
+    Args:
+        connection: The connection of the transaction performing the office writes.
+        deltas (dict): Mapping of filter key to the amount to add (may be negative).
+    """
+    for filter_key, delta in deltas.items():
+        if delta == 0:
+            continue
+        connection.execute(
+            update(OfficeCount.__table__)
+            .where(OfficeCount.__table__.c.filter_key == filter_key)
+            .values(total=OfficeCount.__table__.c.total + delta, updated_at=datetime.utcnow())
+        )
@@ -0,0 +1,116 @@
+from sqlalchemy import Column, String, DateTime, BigInteger, Integer, JSON, Index, insert
+from src.models.base import Base
+from datetime import datetime
+from decimal import Decimal
+
+
+class OfficeHistory(Base):
+    """
+    Represents one entry in the append-only change history of an office.
+
+    Each entry stores only the fields changed by a write. A full snapshot of the office
+    is stored on creation and every few versions, so any past state can be rebuilt from
+    the nearest snapshot plus a bounded number of diffs.
+    """
+    __tablename__ = "office_history"
+
+    # Columns
+    id = Column(
+        BigInteger,
+        primary_key=True,
+        autoincrement=True,
+        doc="Unique identifier for the history entry."
+    )
+    office_code = Column(
+        String(16),
+        nullable=False,
+        doc="Code of the office the entry belongs to; kept after the office is deleted."
+    )
+    version = Column(
+        Integer,
+        nullable=False,
+        doc="Version of the office after the change."
+    )
+    action = Column(
+        String(16),
+        nullable=False,
+        doc="Type of change: CREATE, UPDATE or DELETE, or BASELINE for offices that predate the history."
+    )
+    changes = Column(
+        JSON(none_as_null=True),
+        nullable=True,
+        doc="New values of the fields changed by the write, keyed by field name."
+    )
+    snapshot = Column(
+        JSON(none_as_null=True),
+        nullable=True,
+        doc="Full state of the office after the change; present on creation and periodically."
+    )
+    changed_at = Column(
+        DateTime,
+        default=datetime.utcnow,
+        nullable=False,
+        doc="Timestamp of when the change was written."
+    )
+
+    # Indexes
+    __table_args__ = (
+        Index("ix_office_history_code_changed_at", "office_code", "changed_at"),
+    )
+
+    def __repr__(self):
+        """
+        Provides a string representation of the object for debugging and logging.
+        """
+        return (
+            f"<OfficeHistory(id={self.id!r}, office_code={self.office_code!r}, "
+            f"version={self.version!r}, action={self.action!r})>"
+        )
+
+    def to_dict(self):
+        """
+        Converts the object to a dictionary for JSON serialization or API responses.
+
+        Returns:
+            dict: A dictionary representation of the OfficeHistory instance.
+        """
+        return {
+            "id": self.id,
+            "office_code": self.office_code,
+            "version": self.version,
+            "action": self.action,
+            "changes": self.changes if self.changes is not None else self.snapshot,
+            "changed_at": self.changed_at.isoformat() if self.changed_at else None,
+        }
+
+
+# Office columns recorded in the history; bookkeeping columns are derived from the entry itself
+HISTORY_EXCLUDED_FIELDS = {"version", "content_hash", "updated_at"}
+
+
+def history_value(value):
+    """
+    Converts a column value to its JSON representation in the history.
+    """
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def record_office_history(connection, entries: list):
+    """
+    Appends history entries within the transaction that performed the office writes.
+
+    Args:
+        connection: The connection of the transaction performing the office writes.
+        entries (list): Dictionaries with office_code, version, action, changes and snapshot.
+    """
+    if not entries:
+        return
+    now = datetime.utcnow()
+    connection.execute(
+        insert(OfficeHistory.__table__),
+        [{"changes": None, "snapshot": None, "changed_at": now, **entry} for entry in entries],
+    )
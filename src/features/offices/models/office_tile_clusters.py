@@ -0,0 +1,214 @@
+from sqlalchemy import (
+    Column,
+    Integer,
+    SmallInteger,
+    Float,
+    JSON,
+    DateTime,
+    PrimaryKeyConstraint,
+    case,
+    delete,
+    func,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.mysql import insert
+from src.models.base import Base
+from src.core.config import settings
+from datetime import datetime
+import math
+
+# Web Mercator cannot represent the poles; latitudes are clamped to this bound
+MAX_MERCATOR_LAT = 85.0511287798
+
+
+class OfficeTileCluster(Base):
+    """
+    Represents a pre-aggregated cluster of offices within one cell of a map tile.
+
+    Every map tile (z, x, y) is divided into a grid of cells; each cell holding at least
+    one office has a row with the office count, coordinate sums for the centroid and a
+    few sample codes. A tile is served with a primary-key prefix scan of its cells.
+    """
+    __tablename__ = "office_tile_clusters"
+
+    # Columns
+    z = Column(
+        SmallInteger,
+        nullable=False,
+        doc="Zoom level of the tile."
+    )
+    tile_x = Column(
+        Integer,
+        nullable=False,
+        doc="Column of the tile at the zoom level."
+    )
+    tile_y = Column(
+        Integer,
+        nullable=False,
+        doc="Row of the tile at the zoom level."
+    )
+    cell = Column(
+        SmallInteger,
+        nullable=False,
+        doc="Index of the grid cell within the tile (row-major)."
+    )
+    office_count = Column(
+        Integer,
+        nullable=False,
+        doc="Number of offices located in the cell."
+    )
+    lat_sum = Column(
+        Float(precision=53),
+        nullable=False,
+        doc="Sum of the latitudes of the offices in the cell, for computing the centroid."
+    )
+    long_sum = Column(
+        Float(precision=53),
+        nullable=False,
+        doc="Sum of the longitudes of the offices in the cell, for computing the centroid."
+    )
+    sample_codes = Column(
+        JSON,
+        nullable=False,
+        doc="Codes of up to a few offices in the cell."
+    )
+    updated_at = Column(
+        DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        nullable=False,
+        doc="Timestamp of when the cluster was last updated."
+    )
+
+    __table_args__ = (
+        PrimaryKeyConstraint("z", "tile_x", "tile_y", "cell", name="pk_office_tile_clusters"),
+    )
+
+    def __repr__(self):
+        """
+        Provides a string representation of the object for debugging and logging.
+        """
+        return (
+            f"<OfficeTileCluster(z={self.z!r}, tile_x={self.tile_x!r}, tile_y={self.tile_y!r}, "
+            f"cell={self.cell!r}, office_count={self.office_count!r})>"
+        )
+
+    def to_dict(self):
+        """
+        Converts the object to a dictionary for JSON serialization or API responses.
+
+        Returns:
+            dict: The cluster's office count, centroid and sample codes.
+        """
+        return {
+            "count": self.office_count,
+            "lat": self.lat_sum / self.office_count if self.office_count else None,
+            "long": self.long_sum / self.office_count if self.office_count else None,
+            "sample_codes": self.sample_codes,
+        }
+
+
+def tile_cells(lat: float, long: float) -> list:
+    """
+    Computes the cluster cell containing a coordinate at every maintained zoom level.
+
+    Args:
+        lat (float): Latitude in degrees.
+        long (float): Longitude in degrees.
+
+    Returns:
+        list: (z, tile_x, tile_y, cell) tuples, one per zoom level.
+    """
+    grid = settings.office_tile_grid
+    lat = max(min(float(lat), MAX_MERCATOR_LAT), -MAX_MERCATOR_LAT)
+    x_frac = (float(long) + 180.0) / 360.0
+    y_frac = (1.0 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2.0
+
+    cells = []
+    for z in range(settings.office_tile_max_zoom + 1):
+        size = (1 << z) * grid
+        gx = min(max(int(x_frac * size), 0), size - 1)
+        gy = min(max(int(y_frac * size), 0), size - 1)
+        cells.append((z, gx // grid, gy // grid, (gy % grid) * grid + gx % grid))
+    return cells
+
+
+def add_to_tile_clusters(connection, code: str, lat: float, long: float):
+    """
+    Adds an office to its cluster at every zoom level with one multi-row upsert.
+
+    Args:
+        connection: The connection of the transaction performing the office write.
+        code (str): The office code.
+        lat (float): Latitude of the office.
+        long (float): Longitude of the office.
+    """
+    table = OfficeTileCluster.__table__
+    now = datetime.utcnow()
+    stmt = insert(table).values([
+        {
+            "z": z, "tile_x": tile_x, "tile_y": tile_y, "cell": cell, "office_count": 1,
+            "lat_sum": float(lat), "long_sum": float(long), "sample_codes": [code], "updated_at": now,
+        }
+        for z, tile_x, tile_y, cell in tile_cells(lat, long)
+    ])
+    stmt = stmt.on_duplicate_key_update(
+        office_count=table.c.office_count + 1,
+        lat_sum=table.c.lat_sum + stmt.inserted.lat_sum,
+        long_sum=table.c.long_sum + stmt.inserted.long_sum,
+        sample_codes=case(
+            (
+                func.json_length(table.c.sample_codes) < settings.office_tile_sample_size,
+                func.json_array_append(table.c.sample_codes, "$", code),
+            ),
+            else_=table.c.sample_codes,
+        ),
+        updated_at=now,
+    )
+    connection.execute(stmt)
+
+
+def escape_like(value: str) -> str:
+    """
+    Escapes the LIKE wildcards in a value, using backslash as the escape character.
+    """
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def remove_from_tile_clusters(connection, code: str, lat: float, long: float):
+    """
+    Removes an office from its cluster at every zoom level, dropping emptied clusters.
+
+    Args:
+        connection: The connection of the transaction performing the office write.
+        code (str): The office code.
+        lat (float): Latitude the office was clustered at.
+        long (float): Longitude the office was clustered at.
+    """
+    table = OfficeTileCluster.__table__
+    keys = tuple_(table.c.z, table.c.tile_x, table.c.tile_y, table.c.cell).in_(tile_cells(lat, long))
+    connection.execute(
+        update(table)
+        .where(keys)
+        .values(
+            office_count=table.c.office_count - 1,
+            lat_sum=table.c.lat_sum - float(lat),
+            long_sum=table.c.long_sum - float(long),
+            sample_codes=case(
+                (
+                    func.json_contains(table.c.sample_codes, func.json_quote(code)) == 1,
+                    func.json_remove(
+                        table.c.sample_codes,
+                        func.json_unquote(
+                            # JSON_SEARCH matches a LIKE pattern, so wildcards in the code are escaped
+                            func.json_search(table.c.sample_codes, "one", escape_like(code), "\\")
+                        ),
+                    ),
+                ),
+                else_=table.c.sample_codes,
+            ),
+            updated_at=datetime.utcnow(),
+        )
+    )
+    connection.execute(delete(table).where(keys, table.c.office_count <= 0))
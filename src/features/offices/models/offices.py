@@ -1,6 +1,7 @@
 from sqlalchemy import (
     Column,
     String,
+    Integer,
     Boolean,
     DateTime,
     Float,
@@ -8,11 +9,59 @@ from sqlalchemy import (
     DECIMAL,
     ForeignKeyConstraint,
     event,
+    update,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, attributes
 from src.models.base import Base
+from src.core.config import settings
 from datetime import datetime
-from src.features.users.models.users import User
+from src.features.users.models.users import User, detach_office_headcounts
+from src.features.offices.models.office_counts import office_count_keys, adjust_office_counts
+from src.features.offices.models.office_tile_clusters import (
+    add_to_tile_clusters,
+    remove_from_tile_clusters,
+)
+from src.features.offices.models.office_history import (
+    HISTORY_EXCLUDED_FIELDS,
+    history_value,
+    record_office_history,
+)
+import hashlib
+import json
+
+
+# Business fields covered by Office.content_hash; lifecycle columns (active, deleted_at,
+# version and timestamps) are deliberately excluded.
+CONTENT_HASH_FIELDS = (
+    "name", "o_type", "ph_num1", "ph_num2", "email1", "email2", "website", "gst_num",
+    "pincode", "country", "state", "district", "taluka", "place",
+    "address_line1", "address_line2", "address_line3", "o_lat", "o_long", "notes",
+)
+
+
+def compute_content_hash(values: dict) -> str:
+    """
+    Computes the SHA-256 content hash of an office's business fields.
+
+    Values are normalized first so that equal data hashes equally regardless of its
+    source (e.g., float vs. DECIMAL coordinates, missing vs. empty fields).
+
+    Args:
+        values (dict): Business field values keyed by column name; missing keys count as None.
+
+    Returns:
+        str: The hex-encoded SHA-256 digest.
+    """
+    normalized = []
+    for field in CONTENT_HASH_FIELDS:
+        value = values.get(field)
+        if value == "":
+            value = None
+        if value is not None and field in ("o_lat", "o_long"):
+            value = f"{float(value):.8f}"
+        normalized.append(value)
+    payload = json.dumps(normalized, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 
 class Office(Base):
@@ -140,6 +189,16 @@ class Office(Base):
         nullable=True,
         doc="Timestamp for soft deletes; null if the record is active."
     )
+    content_hash = Column(
+        String(64),
+        nullable=True,
+        doc="SHA-256 hash of the business fields, used to skip writes that change nothing."
+    )
+    version = Column(
+        Integer,
+        nullable=False,
+        doc="Row version for optimistic concurrency; incremented by SQLAlchemy on every update."
+    )
     created_at = Column(
         DateTime,
         default=datetime.utcnow,
@@ -157,9 +216,10 @@ class Office(Base):
     # Relationships
     users = relationship(
         "User",
-        back_populates="office",
-        cascade="all, delete-orphan",  # Ensure dependent users are updated/nullified on soft delete
-        passive_deletes=True,
+        back_populates="office_relationship",
+        cascade="save-update, merge",  # Users outlive their office; never cascade deletes to them
+        passive_deletes="all",  # users.office is nullified set-based, never by loading the collection
+        lazy="raise",  # Load explicitly with selectinload (see OfficeRepository.load_options)
         doc="Defines the relationship with the User model."
     )
 
@@ -167,8 +227,13 @@ class Office(Base):
     __table_args__ = (
         Index("ix_offices_o_type", "o_type"),  # Index for filtering by o_type
         Index("ix_offices_active", "active"),  # Index for filtering by active status
+        Index("ix_offices_updated_at_code", "updated_at", "code"),  # Keyset index for delta sync
+        Index("ix_offices_deleted_at", "deleted_at"),  # Index for purging soft-deleted offices
     )
 
+    # Optimistic concurrency: UPDATEs are guarded by `WHERE version = <loaded version>`
+    __mapper_args__ = {"version_id_col": version}
+
     def __repr__(self):
         """
         Provides a string representation of the object for debugging and logging.
@@ -178,11 +243,30 @@ class Office(Base):
             f"type={self.o_type!r}, active={self.active!r})>"
         )
 
-    def to_dict(self):
+    def business_values(self) -> dict:
         """
-        Converts the object to a dictionary for JSON serialization or API responses.
+        Returns the values of the fields covered by the content hash.
+        """
+        return {field: getattr(self, field) for field in CONTENT_HASH_FIELDS}
+
+    def history_state(self) -> dict:
+        """
+        Returns the full state recorded in history snapshots, in JSON-compatible form.
         """
         return {
+            attr.key: history_value(getattr(self, attr.key))
+            for attr in self.__mapper__.column_attrs
+            if attr.key not in HISTORY_EXCLUDED_FIELDS
+        }
+
+    def to_dict(self, include=()):
+        """
+        Converts the object to a dictionary for JSON serialization or API responses.
+
+        Args:
+            include (Iterable[str]): Eagerly loaded relationships to embed (e.g., "users").
+        """
+        data = {
             "code": self.code,
             "name": self.name,
             "o_type": self.o_type,
@@ -205,10 +289,14 @@ class Office(Base):
             "o_long": float(self.o_long) if self.o_long is not None else None,
             "notes": self.notes,
             "active": self.active,
+            "version": self.version,
             "deleted_at": self.deleted_at.isoformat() if self.deleted_at else None,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
+        if "users" in include:
+            data["users"] = [user.to_dict() for user in self.users]
+        return data
 
 
 # Event listener to handle soft delete and nullify related foreign keys
@@ -216,12 +304,160 @@ class Office(Base):
 def before_delete(mapper, connection, target):
     """
     Handles actions before deleting an Office, such as nullifying related foreign keys.
+
+    The users of the office are detached with a single set-based UPDATE, so deleting
+    an office never loads its users into memory.
     """
+    detach_office_headcounts(connection, [target.code])
     connection.execute(
-        """
-        UPDATE users
-        SET office = NULL
-        WHERE office = :office_code
-        """,
-        {"office_code": target.code},
+        update(User.__table__)
+        .where(User.__table__.c.office == target.code)
+        .values(office=None)
     )
+
+
+@event.listens_for(Office, "before_insert")
+@event.listens_for(Office, "before_update")
+def before_write_content_hash(mapper, connection, target):
+    """
+    Keeps the stored content hash in step with the business fields being written.
+    """
+    target.content_hash = compute_content_hash(target.business_values())
+
+
+@event.listens_for(Office, "after_insert")
+def after_insert_counts(mapper, connection, target):
+    """
+    Increments the cached office counts that include the newly inserted office.
+    """
+    adjust_office_counts(connection, {key: 1 for key in office_count_keys(target.active)})
+
+
+@event.listens_for(Office, "after_update")
+def after_update_counts(mapper, connection, target):
+    """
+    Moves the office between cached counts when its active status changes.
+    """
+    history = attributes.get_history(target, "active")
+    if not history.deleted or not history.added:
+        return
+    old_active, new_active = bool(history.deleted[0]), bool(history.added[0])
+    if old_active == new_active:
+        return
+    deltas = {}
+    for key in office_count_keys(old_active):
+        deltas[key] = deltas.get(key, 0) - 1
+    for key in office_count_keys(new_active):
+        deltas[key] = deltas.get(key, 0) + 1
+    adjust_office_counts(connection, deltas)
+
+
+@event.listens_for(Office, "after_delete")
+def after_delete_counts(mapper, connection, target):
+    """
+    Decrements the cached office counts that included the deleted office.
+    """
+    adjust_office_counts(connection, {key: -1 for key in office_count_keys(target.active)})
+
+
+@event.listens_for(Office, "after_insert")
+def after_insert_history(mapper, connection, target):
+    """
+    Records the creation of an office, with a full snapshot of its initial state.
+    """
+    record_office_history(connection, [{
+        "office_code": target.code,
+        "version": target.version,
+        "action": "CREATE",
+        "snapshot": target.history_state(),
+    }])
+
+
+@event.listens_for(Office, "after_update")
+def after_update_history(mapper, connection, target):
+    """
+    Records the fields changed by an update, adding a snapshot every few versions.
+    """
+    changes = {}
+    for attr in mapper.column_attrs:
+        if attr.key in HISTORY_EXCLUDED_FIELDS:
+            continue
+        if attributes.get_history(target, attr.key).has_changes():
+            changes[attr.key] = history_value(getattr(target, attr.key))
+    if not changes:
+        return
+    entry = {"office_code": target.code, "version": target.version, "action": "UPDATE", "changes": changes}
+    if (target.version - 1) % max(settings.office_history_snapshot_interval, 1) == 0:
+        entry["snapshot"] = target.history_state()
+    record_office_history(connection, [entry])
+
+
+@event.listens_for(Office, "after_delete")
+def after_delete_history(mapper, connection, target):
+    """
+    Records the permanent deletion of an office.
+    """
+    record_office_history(connection, [{
+        "office_code": target.code,
+        "version": target.version,
+        "action": "DELETE",
+    }])
+
+
+def _tile_position(lat, long, deleted_at):
+    """
+    Returns the map position an office is clustered at, or None if it is not on the map.
+    """
+    if lat is None or long is None or deleted_at is not None:
+        return None
+    return float(lat), float(long)
+
+
+def _previous_value(target, key):
+    """
+    Returns the value an attribute had before the pending flush.
+    """
+    history = attributes.get_history(target, key)
+    if history.deleted:
+        return history.deleted[0]
+    if history.added:
+        return None
+    return getattr(target, key)
+
+
+@event.listens_for(Office, "after_insert")
+def after_insert_tiles(mapper, connection, target):
+    """
+    Adds a newly inserted office to the map tile clusters.
+    """
+    position = _tile_position(target.o_lat, target.o_long, target.deleted_at)
+    if position:
+        add_to_tile_clusters(connection, target.code, *position)
+
+
+@event.listens_for(Office, "after_update")
+def after_update_tiles(mapper, connection, target):
+    """
+    Moves an office between map tile clusters when its location or deletion state changes.
+    """
+    keys = ("o_lat", "o_long", "deleted_at")
+    if not any(attributes.get_history(target, key).has_changes() for key in keys):
+        return
+    old_position = _tile_position(*(_previous_value(target, key) for key in keys))
+    new_position = _tile_position(target.o_lat, target.o_long, target.deleted_at)
+    if old_position == new_position:
+        return
+    if old_position:
+        remove_from_tile_clusters(connection, target.code, *old_position)
+    if new_position:
+        add_to_tile_clusters(connection, target.code, *new_position)
+
+
+@event.listens_for(Office, "after_delete")
+def after_delete_tiles(mapper, connection, target):
+    """
+    Removes a deleted office from the map tile clusters.
+    """
+    position = _tile_position(target.o_lat, target.o_long, target.deleted_at)
+    if position:
+        remove_from_tile_clusters(connection, target.code, *position)
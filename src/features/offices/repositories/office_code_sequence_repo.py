@@ -0,0 +1,40 @@
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.future import select
+from src.core.db import engine
+from src.features.offices.models.office_code_sequences import OfficeCodeSequence
+from datetime import datetime
+from typing import Tuple
+
+
+class OfficeCodeSequenceRepository:
+    """
+    Repository class for reserving blocks of generated office codes.
+    """
+
+    @staticmethod
+    async def reserve_block(prefix: str, size: int) -> Tuple[int, int]:
+        """
+        Reserve the next block of code numbers for a prefix.
+
+        The reservation runs in its own short transaction, independent of the caller's
+        session, so the sequence row is locked only for the duration of one upsert and
+        a rollback of the caller never hands the same numbers out twice.
+
+        Args:
+            prefix (str): The code prefix.
+            size (int): The number of code numbers to reserve.
+
+        Returns:
+            Tuple[int, int]: The reserved half-open range [start, end).
+        """
+        table = OfficeCodeSequence.__table__
+        now = datetime.utcnow()
+        upsert = insert(table).values(prefix=prefix, next_value=1 + size, updated_at=now)
+        upsert = upsert.on_duplicate_key_update(next_value=table.c.next_value + size, updated_at=now)
+        async with engine.begin() as connection:
+            await connection.execute(upsert)
+            result = await connection.execute(
+                select(table.c.next_value).where(table.c.prefix == prefix)
+            )
+            end = result.scalar_one()
+        return end - size, end
@@ -0,0 +1,56 @@
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from src.features.offices.models.offices import Office
+from src.features.offices.models.office_counts import OfficeCount
+from typing import Optional
+
+
+class OfficeCountRepository:
+    """
+    Repository class for serving total counts of office listings.
+
+    Every supported filter combination is backed by a counter in `office_counts`, seeded by
+    its migration and kept current by the Office write listeners, so a total is answered
+    exactly with a primary-key lookup.
+    """
+
+    @staticmethod
+    def counter_key(active: Optional[bool] = None) -> str:
+        """
+        Resolve the counter key for the listing filters.
+
+        Args:
+            active (Optional[bool]): Filter by active status; None for all offices.
+
+        Returns:
+            str: The counter key.
+        """
+        return "all" if active is None else f"active:{int(bool(active))}"
+
+    @staticmethod
+    async def count(db: AsyncSession, active: Optional[bool] = None) -> int:
+        """
+        Count offices matching the listing filters.
+
+        Reads the counter row; should it be missing, the offices are counted instead,
+        without writing, so that the read stays read-only.
+
+        Args:
+            db (AsyncSession): The database session.
+            active (Optional[bool]): Filter by active status.
+
+        Returns:
+            int: The number of offices matching the filters.
+        """
+        result = await db.execute(
+            select(OfficeCount.total).where(OfficeCount.filter_key == OfficeCountRepository.counter_key(active))
+        )
+        total = result.scalar_one_or_none()
+        if total is not None:
+            return total
+
+        query = select(func.count()).select_from(Office)
+        if active is not None:
+            query = query.where(Office.active == active)
+        return (await db.execute(query)).scalar_one()
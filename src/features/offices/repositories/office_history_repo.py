@@ -0,0 +1,96 @@
+from sqlalchemy import and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from src.features.offices.models.office_history import OfficeHistory
+from datetime import datetime
+from typing import List, Optional
+
+
+class OfficeHistoryRepository:
+    """
+    Repository class for reading the change history of offices.
+    """
+
+    @staticmethod
+    async def get_for_office(
+        db: AsyncSession, code: str, before_id: Optional[int] = None, limit: int = 50
+    ) -> List[OfficeHistory]:
+        """
+        Fetch the history entries of an office, newest first.
+
+        Args:
+            db (AsyncSession): The database session.
+            code (str): The unique code of the office.
+            before_id (Optional[int]): Only return entries older than the entry with this id.
+            limit (int): The maximum number of entries to return.
+
+        Returns:
+            List[OfficeHistory]: The history entries.
+        """
+        query = (
+            select(OfficeHistory)
+            .where(OfficeHistory.office_code == code)
+            .order_by(OfficeHistory.changed_at.desc(), OfficeHistory.id.desc())
+            .limit(limit)
+        )
+        if before_id is not None:
+            # Continue after the given entry in (changed_at, id) order, so the page is read
+            # from the (office_code, changed_at) index
+            before_at = (
+                select(OfficeHistory.changed_at).where(OfficeHistory.id == before_id).scalar_subquery()
+            )
+            query = query.where(
+                or_(
+                    OfficeHistory.changed_at < before_at,
+                    and_(OfficeHistory.changed_at == before_at, OfficeHistory.id < before_id),
+                )
+            )
+        result = await db.execute(query)
+        return result.scalars().all()
+
+    @staticmethod
+    async def get_state_as_of(db: AsyncSession, code: str, as_of: datetime) -> Optional[dict]:
+        """
+        Reconstruct the state of an office at a point in time.
+
+        Starts from the latest snapshot at or before `as_of` and replays the diffs written
+        after it, which is bounded by the snapshot interval.
+
+        Args:
+            db (AsyncSession): The database session.
+            code (str): The unique code of the office.
+            as_of (datetime): The point in time to reconstruct.
+
+        Returns:
+            Optional[dict]: The office state, or None if it did not exist at that time.
+        """
+        result = await db.execute(
+            select(OfficeHistory)
+            .where(
+                OfficeHistory.office_code == code,
+                OfficeHistory.changed_at <= as_of,
+                OfficeHistory.snapshot.isnot(None),
+            )
+            .order_by(OfficeHistory.changed_at.desc(), OfficeHistory.id.desc())
+            .limit(1)
+        )
+        base = result.scalar_one_or_none()
+        if base is None:
+            return None
+
+        result = await db.execute(
+            select(OfficeHistory)
+            .where(
+                OfficeHistory.office_code == code,
+                OfficeHistory.changed_at <= as_of,
+                OfficeHistory.id > base.id,
+            )
+            .order_by(OfficeHistory.id)
+        )
+        state = dict(base.snapshot, version=base.version, updated_at=base.changed_at.isoformat())
+        for entry in result.scalars().all():
+            if entry.action == "DELETE":
+                return None
+            state.update(entry.changes or {})
+            state.update(version=entry.version, updated_at=entry.changed_at.isoformat())
+        return state
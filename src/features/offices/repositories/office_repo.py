@@ -1,10 +1,16 @@
+from sqlalchemy import and_, or_, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import joinedload
-from src.features.offices.models.offices import Office
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.exc import StaleDataError
+from src.features.offices.models.offices import Office, CONTENT_HASH_FIELDS, compute_content_hash
+from src.features.offices.models.office_counts import office_count_keys, adjust_office_counts
+from src.features.offices.models.office_history import record_office_history
+from src.features.users.models.users import User, detach_office_headcounts
 from src.features.offices.schemas.office_schemas import OfficeCreate, OfficeUpdate
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional, Tuple
+import asyncio
 
 
 class OfficeRepository:
@@ -12,25 +18,56 @@ class OfficeRepository:
     Repository class for performing CRUD operations on Office entities.
     """
 
+    # Changes younger than this are held back from delta sync so that transactions
+    # still committing with an earlier updated_at can never be skipped by a token.
+    SYNC_SETTLE_SECONDS = 5
+
+    # Relationships (and the "user_count" headcount) that can be embedded via `?include=`
+    INCLUDES = ("users", "user_count")
+
     @staticmethod
-    async def get_by_code(db: AsyncSession, code: str) -> Optional[Office]:
+    def load_options(include: Iterable[str] = ()) -> list:
+        """
+        Map requested relationship names to eager-loading strategies.
+
+        Relationships are mapped with `lazy="raise"`; each included collection is loaded
+        with one extra SELECT ... IN query for the whole result set.
+
+        Args:
+            include (Iterable[str]): Relationship names from `OfficeRepository.INCLUDES`.
+
+        Returns:
+            list: Loader options to apply to an Office query.
+        """
+        options = []
+        if "users" in include:
+            options.append(selectinload(Office.users))
+        return options
+
+    @staticmethod
+    async def get_by_code(db: AsyncSession, code: str, include: Iterable[str] = ()) -> Optional[Office]:
         """
         Fetch an office by its unique code.
 
         Args:
             db (AsyncSession): The database session.
             code (str): The unique code of the office.
+            include (Iterable[str]): Relationships to load eagerly.
 
         Returns:
             Optional[Office]: The Office instance if found, otherwise None.
         """
-        query = select(Office).where(Office.code == code)
+        query = select(Office).where(Office.code == code).options(*OfficeRepository.load_options(include))
         result = await db.execute(query)
         return result.scalar_one_or_none()
 
     @staticmethod
     async def get_all(
-        db: AsyncSession, skip: int = 0, limit: int = 10, active: Optional[bool] = None
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 10,
+        active: Optional[bool] = None,
+        include: Iterable[str] = (),
     ) -> List[Office]:
         """
         Fetch all offices with optional pagination and filtering by active status.
@@ -40,16 +77,60 @@ class OfficeRepository:
             skip (int): The number of records to skip.
             limit (int): The maximum number of records to return.
             active (Optional[bool]): Filter by active status if specified.
+            include (Iterable[str]): Relationships to load eagerly.
 
         Returns:
             List[Office]: A list of Office instances.
         """
-        query = select(Office).offset(skip).limit(limit)
+        query = (
+            select(Office)
+            .options(*OfficeRepository.load_options(include))
+            .offset(skip)
+            .limit(limit)
+        )
         if active is not None:
             query = query.where(Office.active == active)
         result = await db.execute(query)
         return result.scalars().all()
 
+    @staticmethod
+    async def get_changes(
+        db: AsyncSession, since: Optional[Tuple[datetime, str]] = None, limit: int = 500
+    ) -> Tuple[List[Office], bool]:
+        """
+        Fetch offices changed after a sync position, ordered by (updated_at, code).
+
+        The position is a keyset on the `ix_offices_updated_at_code` index, so the cost
+        is proportional to the number of changes returned rather than the table size.
+
+        Args:
+            db (AsyncSession): The database session.
+            since (Optional[Tuple[datetime, str]]): The (updated_at, code) of the last
+                change the client has seen, or None to start from the beginning.
+            limit (int): The maximum number of changes to return.
+
+        Returns:
+            Tuple[List[Office], bool]: The changed offices and whether more are pending.
+        """
+        horizon = datetime.utcnow() - timedelta(seconds=OfficeRepository.SYNC_SETTLE_SECONDS)
+        query = (
+            select(Office)
+            .where(Office.updated_at <= horizon)
+            .order_by(Office.updated_at, Office.code)
+            .limit(limit + 1)
+        )
+        if since is not None:
+            since_at, since_code = since
+            query = query.where(
+                or_(
+                    Office.updated_at > since_at,
+                    and_(Office.updated_at == since_at, Office.code > since_code),
+                )
+            )
+        result = await db.execute(query)
+        offices = result.scalars().all()
+        return offices[:limit], len(offices) > limit
+
     @staticmethod
     async def create(db: AsyncSession, data: OfficeCreate) -> Office:
         """
@@ -68,28 +149,117 @@ class OfficeRepository:
         await db.refresh(new_office)
         return new_office
 
+    @staticmethod
+    async def create_many(db: AsyncSession, offices: List[OfficeCreate]) -> List[Office]:
+        """
+        Create several offices in a single transaction.
+
+        Args:
+            db (AsyncSession): The database session.
+            offices (List[OfficeCreate]): The data for the new offices; codes must be set.
+
+        Returns:
+            List[Office]: The newly created Office instances.
+        """
+        new_offices = [Office(**data.dict()) for data in offices]
+        db.add_all(new_offices)
+        await db.commit()
+        return new_offices
+
     @staticmethod
     async def update(db: AsyncSession, code: str, data: OfficeUpdate) -> Optional[Office]:
         """
         Update an existing office.
 
+        The UPDATE is guarded by the office's version column, so a concurrent change
+        between the read and the write is detected instead of silently overwritten.
+        Requests that leave the content hash and status unchanged issue no UPDATE.
+
         Args:
             db (AsyncSession): The database session.
             code (str): The unique code of the office to update.
-            data (OfficeUpdate): The updated office data.
+            data (OfficeUpdate): The updated office data, optionally with the expected version.
 
         Returns:
             Optional[Office]: The updated Office instance if found, otherwise None.
+
+        Raises:
+            StaleDataError: If the office was modified since the expected or loaded version.
         """
         office = await OfficeRepository.get_by_code(db, code)
         if not office:
             return None
-        for key, value in data.dict(exclude_unset=True).items():
+        values = data.dict(exclude_unset=True)
+        expected_version = values.pop("version", None)
+        if expected_version is not None and expected_version != office.version:
+            raise StaleDataError(
+                f"Office {code!r} is at version {office.version}, not {expected_version}."
+            )
+
+        # Skip the write entirely if the request would not change anything
+        merged = office.business_values()
+        merged.update({key: value for key, value in values.items() if key in CONTENT_HASH_FIELDS})
+        if compute_content_hash(merged) == office.content_hash and all(
+            getattr(office, key) == value
+            for key, value in values.items() if key not in CONTENT_HASH_FIELDS
+        ):
+            return office
+
+        for key, value in values.items():
             setattr(office, key, value)
-        await db.commit()
+        try:
+            await db.commit()
+        except StaleDataError:
+            await db.rollback()
+            raise
         await db.refresh(office)
         return office
 
+    @staticmethod
+    async def import_many(db: AsyncSession, offices: List[OfficeCreate], chunk_size: int = 500) -> dict:
+        """
+        Insert new offices and update changed ones, skipping rows whose content is unchanged.
+
+        Each chunk costs one narrow SELECT of (code, content_hash); only offices whose hash
+        differs are loaded and written, so re-importing identical data issues no writes.
+
+        Args:
+            db (AsyncSession): The database session.
+            offices (List[OfficeCreate]): The validated offices to import.
+            chunk_size (int): The number of offices processed per transaction.
+
+        Returns:
+            dict: The number of offices inserted, updated and left unchanged.
+        """
+        counts = {"inserted": 0, "updated": 0, "unchanged": 0}
+        for start in range(0, len(offices), chunk_size):
+            chunk = {office.code: office for office in offices[start:start + chunk_size]}
+            result = await db.execute(
+                select(Office.code, Office.content_hash).where(Office.code.in_(list(chunk)))
+            )
+            stored_hashes = {row.code: row.content_hash for row in result.all()}
+
+            changed = []
+            for code, data in chunk.items():
+                if code not in stored_hashes:
+                    db.add(Office(**data.dict()))
+                    counts["inserted"] += 1
+                elif compute_content_hash(data.dict()) == stored_hashes[code]:
+                    counts["unchanged"] += 1
+                else:
+                    changed.append(code)
+
+            if changed:
+                result = await db.execute(select(Office).where(Office.code.in_(changed)))
+                for office in result.scalars().all():
+                    for key, value in chunk[office.code].dict().items():
+                        if key in CONTENT_HASH_FIELDS:
+                            setattr(office, key, value)
+                counts["updated"] += len(changed)
+
+            await db.commit()
+        return counts
+
     @staticmethod
     async def deactivate(db: AsyncSession, code: str) -> Optional[Office]:
         """
@@ -106,7 +276,11 @@ class OfficeRepository:
         if not office:
             return None
         office.active = False
-        await db.commit()
+        try:
+            await db.commit()
+        except StaleDataError:
+            await db.rollback()
+            raise
         await db.refresh(office)
         return office
 
@@ -126,7 +300,11 @@ class OfficeRepository:
         if not office:
             return None
         office.deleted_at = datetime.utcnow()
-        await db.commit()
+        try:
+            await db.commit()
+        except StaleDataError:
+            await db.rollback()
+            raise
         await db.refresh(office)
         return office
 
@@ -148,3 +326,65 @@ class OfficeRepository:
         await db.delete(office)
         await db.commit()
         return True
+
+    @staticmethod
+    async def purge_soft_deleted(db: AsyncSession, before: datetime, batch_size: int = 500) -> dict:
+        """
+        Permanently delete offices soft-deleted before a cutoff, in bounded batches.
+
+        Each batch moves the users' headcounts, detaches the offices' users with one
+        set-based UPDATE and removes the offices with one DELETE, then commits and yields to the event loop. Locks are
+        therefore held for a single batch only, and no user rows are loaded into memory.
+
+        Args:
+            db (AsyncSession): The database session.
+            before (datetime): Offices soft-deleted before this timestamp are purged.
+            batch_size (int): The maximum number of offices removed per batch.
+
+        Returns:
+            dict: The number of offices purged and the number of batches executed.
+        """
+        purged, batches = 0, 0
+        while True:
+            result = await db.execute(
+                select(Office.code, Office.active, Office.version)
+                .where(Office.deleted_at < before)
+                .order_by(Office.deleted_at, Office.code)
+                .limit(batch_size)
+            )
+            rows = result.all()
+            if not rows:
+                break
+
+            codes = [row.code for row in rows]
+            await db.run_sync(lambda session: detach_office_headcounts(session.connection(), codes))
+            await db.execute(
+                update(User).where(User.office.in_(codes)).values(office=None)
+                .execution_options(synchronize_session=False)
+            )
+            await db.execute(
+                delete(Office).where(Office.code.in_(codes))
+                .execution_options(synchronize_session=False)
+            )
+
+            # Bulk statements bypass the Office listeners, so adjust the cached counts
+            # and append the history entries here
+            deltas = {}
+            for row in rows:
+                for key in office_count_keys(row.active):
+                    deltas[key] = deltas.get(key, 0) - 1
+            history = [
+                {"office_code": row.code, "version": row.version, "action": "DELETE"} for row in rows
+            ]
+
+            def apply_side_effects(session):
+                adjust_office_counts(session.connection(), deltas)
+                record_office_history(session.connection(), history)
+
+            await db.run_sync(apply_side_effects)
+
+            await db.commit()
+            purged += len(codes)
+            batches += 1
+            await asyncio.sleep(0)  # Yield to other requests between batches
+        return {"purged": purged, "batches": batches}
@@ -0,0 +1,124 @@
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from src.core.config import settings
+from src.features.offices.models.offices import Office
+from src.features.offices.models.office_tile_clusters import OfficeTileCluster, MAX_MERCATOR_LAT
+from datetime import datetime
+from typing import List
+import numpy as np
+
+
+class OfficeTileRepository:
+    """
+    Repository class for reading and rebuilding the pre-aggregated map tile clusters.
+    """
+
+    @staticmethod
+    async def get_tile(db: AsyncSession, z: int, x: int, y: int) -> List[OfficeTileCluster]:
+        """
+        Fetch the office clusters of one map tile.
+
+        Args:
+            db (AsyncSession): The database session.
+            z (int): The zoom level.
+            x (int): The tile column.
+            y (int): The tile row.
+
+        Returns:
+            List[OfficeTileCluster]: The non-empty clusters of the tile.
+        """
+        result = await db.execute(
+            select(OfficeTileCluster).where(
+                OfficeTileCluster.z == z,
+                OfficeTileCluster.tile_x == x,
+                OfficeTileCluster.tile_y == y,
+            )
+        )
+        return result.scalars().all()
+
+    @staticmethod
+    def _cluster_rows(codes: np.ndarray, lats: np.ndarray, longs: np.ndarray) -> List[dict]:
+        """
+        Grid-cluster office coordinates at every maintained zoom level.
+
+        Cell assignment, counts and coordinate sums are computed with array operations
+        over all offices at once; only the per-cluster output rows are built in Python.
+        """
+        grid = settings.office_tile_grid
+        sample_size = settings.office_tile_sample_size
+        clamped = np.radians(np.clip(lats, -MAX_MERCATOR_LAT, MAX_MERCATOR_LAT))
+        x_frac = (longs + 180.0) / 360.0
+        y_frac = (1.0 - np.arcsinh(np.tan(clamped)) / np.pi) / 2.0
+        now = datetime.utcnow()
+
+        rows = []
+        for z in range(settings.office_tile_max_zoom + 1):
+            size = (1 << z) * grid
+            gx = np.clip((x_frac * size).astype(np.int64), 0, size - 1)
+            gy = np.clip((y_frac * size).astype(np.int64), 0, size - 1)
+            cells, inverse, counts = np.unique(gy * size + gx, return_inverse=True, return_counts=True)
+            lat_sums = np.bincount(inverse, weights=lats)
+            long_sums = np.bincount(inverse, weights=longs)
+            order = np.argsort(inverse, kind="stable")
+            starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+            for index, cell_id in enumerate(cells):
+                cell_x, cell_y = int(cell_id % size), int(cell_id // size)
+                samples = codes[order[starts[index]:starts[index] + min(counts[index], sample_size)]]
+                rows.append({
+                    "z": z,
+                    "tile_x": cell_x // grid,
+                    "tile_y": cell_y // grid,
+                    "cell": (cell_y % grid) * grid + cell_x % grid,
+                    "office_count": int(counts[index]),
+                    "lat_sum": float(lat_sums[index]),
+                    "long_sum": float(long_sums[index]),
+                    "sample_codes": samples.tolist(),
+                    "updated_at": now,
+                })
+        return rows
+
+    @staticmethod
+    async def rebuild(db: AsyncSession, chunk_size: int = 1000) -> int:
+        """
+        Recompute all map tile clusters from the offices table.
+
+        Incremental maintenance by the Office listeners keeps the clusters current; a
+        rebuild is only needed for the initial backfill or after changing the tile settings.
+
+        Args:
+            db (AsyncSession): The database session.
+            chunk_size (int): The number of offices fetched per batch and cluster rows inserted
+                per statement.
+
+        Returns:
+            int: The number of clusters written.
+        """
+        # Stream the coordinates in batches, keeping only the compact arrays in memory
+        result = await db.stream(
+            select(Office.code, Office.o_lat, Office.o_long)
+            .where(
+                Office.deleted_at.is_(None),
+                Office.o_lat.isnot(None),
+                Office.o_long.isnot(None),
+            )
+            .execution_options(yield_per=chunk_size)
+        )
+        codes, lats, longs = [], [], []
+        async for partition in result.partitions():
+            codes.append(np.array([office.code for office in partition], dtype=object))
+            lats.append(np.array([float(office.o_lat) for office in partition]))
+            longs.append(np.array([float(office.o_long) for office in partition]))
+
+        rows = []
+        if codes:
+            rows = OfficeTileRepository._cluster_rows(
+                np.concatenate(codes), np.concatenate(lats), np.concatenate(longs)
+            )
+
+        await db.execute(delete(OfficeTileCluster.__table__))
+        for start in range(0, len(rows), chunk_size):
+            await db.execute(insert(OfficeTileCluster.__table__), rows[start:start + chunk_size])
+        await db.commit()
+        return len(rows)
@@ -1,57 +1,116 @@
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File
+from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Response, Query
 from fastapi.responses import FileResponse
 from typing import List, Optional
+from datetime import datetime
 from src.features.offices.services.office_service import (
     create_office,
+    create_offices_bulk,
     get_office_by_id,
+    get_office_history,
     get_all_offices,
+    count_offices,
+    get_office_changes,
     update_office,
     deactivate_office,
     soft_delete_office,
     delete_office_permanent,
+    purge_deleted_offices,
+    get_office_tile,
+    rebuild_office_tiles,
     export_offices_to_xlsx,
     download_offices_xlsx_template,
     import_offices_from_xlsx,
 )
-from src.features.offices.schemas.office_schemas import OfficeCreate, OfficeUpdate, OfficeBase
+from src.features.offices.schemas.office_schemas import (
+    OfficeCreate,
+    OfficeUpdate,
+    OfficeResponse,
+    OfficeChanges,
+    OfficeHistoryEntry,
+    OfficeTile,
+)
 from src.core.db import get_db
 
 router = APIRouter()
 
-@router.post("", response_model=OfficeBase, status_code=201)
+@router.post("", response_model=OfficeResponse, status_code=201)
 async def create_office_endpoint(data: OfficeCreate, db=Depends(get_db)):
     """
     Create a new office.
     """
     return await create_office(db, data)
 
-@router.get("/id/{code}", response_model=OfficeBase)
-async def read_office_by_id(code: str, db=Depends(get_db)):
+@router.post("/bulk", response_model=List[OfficeResponse], status_code=201)
+async def create_offices_bulk_endpoint(data: List[OfficeCreate], db=Depends(get_db)):
+    """
+    Create several offices at once; codes are generated for entries without one.
+    """
+    return await create_offices_bulk(db, data)
+
+@router.get("/id/{code}", response_model=OfficeResponse)
+async def read_office_by_id(
+    code: str,
+    as_of: Optional[datetime] = None,
+    include: Optional[str] = Query(None, description="Comma-separated relationships to embed: users, user_count"),
+    db=Depends(get_db),
+):
     """
-    Retrieve an office by its unique code.
+    Retrieve an office by its unique code, optionally as it was at `as_of`.
     """
-    office = await get_office_by_id(db, code)
+    office = await get_office_by_id(db, code, as_of, include)
     if not office:
         raise HTTPException(status_code=404, detail="Office not found")
     return office
 
-@router.get("", response_model=List[OfficeBase])
+@router.get("/id/{code}/history", response_model=List[OfficeHistoryEntry])
+async def read_office_history(
+    code: str,
+    before_id: Optional[int] = None,
+    limit: int = Query(50, ge=1, le=500),
+    db=Depends(get_db),
+):
+    """
+    Retrieve the change history of an office, newest first.
+    """
+    return await get_office_history(db, code, before_id, limit)
+
+@router.get("", response_model=List[OfficeResponse])
 async def read_all_offices(
-    db=Depends(get_db), skip: int = 0, limit: int = 10, active: Optional[bool] = None
+    response: Response,
+    db=Depends(get_db),
+    skip: int = 0,
+    limit: int = 10,
+    active: Optional[bool] = None,
+    with_count: bool = False,
+    include: Optional[str] = Query(None, description="Comma-separated relationships to embed: users, user_count"),
 ):
     """
     Retrieve all offices with optional pagination and filtering.
+
+    When `with_count` is set, the total number of matching offices is returned in the
+    `X-Total-Count` header.
     """
-    return await get_all_offices(db, skip, limit, active)
+    if with_count:
+        response.headers["X-Total-Count"] = str(await count_offices(db, active))
+    return await get_all_offices(db, skip, limit, active, include)
 
-@router.get("/wop", response_model=List[OfficeBase])
+@router.get("/wop", response_model=List[OfficeResponse])
 async def read_all_offices_without_pagination(db=Depends(get_db)):
     """
     Retrieve all offices without pagination.
     """
     return await get_all_offices(db)
 
-@router.put("/id/{code}", response_model=OfficeBase)
+@router.get("/changes", response_model=OfficeChanges)
+async def read_office_changes(
+    db=Depends(get_db), since: Optional[str] = None, limit: int = Query(500, ge=1, le=5000)
+):
+    """
+    Retrieve offices created, updated or soft-deleted since a sync token.
+    """
+    return await get_office_changes(db, since, limit)
+
+@router.put("/id/{code}", response_model=OfficeResponse)
 async def update_office_endpoint(code: str, data: OfficeUpdate, db=Depends(get_db)):
     """
     Update an office by its unique code.
@@ -79,6 +138,29 @@ async def delete_office_permanent_endpoint(code: str, db=Depends(get_db)):
     """
     return await delete_office_permanent(db, code)
 
+@router.delete("/purge", response_model=dict)
+async def purge_deleted_offices_endpoint(
+    before: datetime, batch_size: int = Query(500, ge=1, le=5000), db=Depends(get_db)
+):
+    """
+    Permanently delete offices soft-deleted before the given timestamp, in batches.
+    """
+    return await purge_deleted_offices(db, before, batch_size)
+
+@router.get("/tiles/{z}/{x}/{y}", response_model=OfficeTile)
+async def read_office_tile(z: int, x: int, y: int, db=Depends(get_db)):
+    """
+    Retrieve pre-aggregated office clusters for a map tile.
+    """
+    return await get_office_tile(db, z, x, y)
+
+@router.post("/tiles/rebuild", response_model=dict)
+async def rebuild_office_tiles_endpoint(db=Depends(get_db)):
+    """
+    Recompute all map tile clusters from the offices table.
+    """
+    return await rebuild_office_tiles(db)
+
 @router.get("/export/xlsx", response_class=FileResponse)
 async def export_to_xlsx_endpoint(db=Depends(get_db)):
     """
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, EmailStr
-from typing import Optional, Literal
+from typing import Optional, Literal, List
 from datetime import datetime
 
 
@@ -33,8 +33,33 @@ class OfficeBase(BaseModel):
 class OfficeCreate(OfficeBase):
     """
     Schema for creating a new office.
+    The code is generated by the server when omitted.
     """
-    pass
+    code: Optional[str] = Field(
+        None, max_length=16, description="Unique identifier for the office; generated if omitted"
+    )
+
+
+class OfficeUser(BaseModel):
+    """
+    Schema for a user embedded in an office response via `?include=users`.
+    """
+    id: int = Field(..., description="Unique identifier of the user")
+    loginid: str = Field(..., description="Login ID of the user")
+    name: str = Field(..., description="Full name of the user")
+    role: Optional[str] = Field(None, description="Role assigned to the user")
+    job_title: Optional[str] = Field(None, description="Job title of the user")
+    active: bool = Field(..., description="Status of the user account (active/inactive)")
+
+
+class OfficeResponse(OfficeBase):
+    """
+    Schema for an office returned by the API.
+    """
+    active: bool = Field(..., description="Status of the office (active/inactive)")
+    version: int = Field(..., description="Row version; send it back on update to detect conflicts")
+    users: Optional[List[OfficeUser]] = Field(None, description="Users of the office, if included")
+    user_count: Optional[int] = Field(None, description="Number of users of the office, if included")
 
 
 class OfficeUpdate(BaseModel):
@@ -63,6 +88,58 @@ class OfficeUpdate(BaseModel):
     o_long: Optional[float] = Field(None, description="Longitude coordinates")
     notes: Optional[str] = Field(None, max_length=64, description="Additional notes about the office")
     active: Optional[bool] = Field(None, description="Status of the office (active/inactive)")
+    version: Optional[int] = Field(
+        None, description="Version the update is based on; rejected with 409 if the office has changed"
+    )
 
     class Config:
         orm_mode = True
+
+
+class OfficeTombstone(BaseModel):
+    """
+    Marker for an office that was soft-deleted since the client's sync token.
+    """
+    code: str = Field(..., description="Unique identifier of the deleted office")
+    deleted_at: datetime = Field(..., description="Timestamp of the soft delete")
+
+
+class OfficeChanges(BaseModel):
+    """
+    Schema for a page of office changes returned by the delta-sync endpoint.
+    """
+    offices: List[OfficeResponse] = Field(..., description="Offices created or updated since the sync token")
+    tombstones: List[OfficeTombstone] = Field(..., description="Offices soft-deleted since the sync token")
+    next_token: Optional[str] = Field(None, description="Token to pass as `since` on the next sync")
+    has_more: bool = Field(..., description="True if more changes are pending beyond this page")
+
+
+class OfficeHistoryEntry(BaseModel):
+    """
+    Schema for one entry in the change history of an office.
+    """
+    id: int = Field(..., description="Identifier of the history entry")
+    version: int = Field(..., description="Version of the office after the change")
+    action: Literal['CREATE', 'UPDATE', 'DELETE'] = Field(..., description="Type of change")
+    changes: Optional[dict] = Field(None, description="New values of the changed fields")
+    changed_at: datetime = Field(..., description="Timestamp of the change")
+
+
+class OfficeCluster(BaseModel):
+    """
+    Schema for a cluster of offices within a map tile.
+    """
+    count: int = Field(..., description="Number of offices in the cluster")
+    lat: float = Field(..., description="Latitude of the cluster centroid")
+    long: float = Field(..., description="Longitude of the cluster centroid")
+    sample_codes: List[str] = Field(..., description="Codes of a few offices in the cluster")
+
+
+class OfficeTile(BaseModel):
+    """
+    Schema for the office clusters of one map tile.
+    """
+    z: int = Field(..., description="Zoom level")
+    x: int = Field(..., description="Tile column")
+    y: int = Field(..., description="Tile row")
+    clusters: List[OfficeCluster] = Field(..., description="Non-empty clusters within the tile")
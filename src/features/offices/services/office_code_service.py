@@ -0,0 +1,83 @@
+from src.core.config import settings
+from src.features.offices.repositories.office_code_sequence_repo import OfficeCodeSequenceRepository
+from typing import Dict, List
+import asyncio
+import re
+
+
+class OfficeCodeGenerator:
+    """
+    Generates unique office codes using hi-lo block allocation.
+
+    Each worker reserves a block of numbers per prefix from `office_code_sequences` and
+    assigns codes from memory until the block is used up. Generated codes are unique
+    across workers by construction, so creation needs no SELECT-then-INSERT check.
+    """
+
+    def __init__(self, block_size: int, digits: int):
+        """
+        Args:
+            block_size (int): Number of codes reserved per sequence round trip.
+            digits (int): Number of zero-padded digits following the prefix.
+        """
+        self.block_size = block_size
+        self.digits = digits
+        self._blocks: Dict[str, List[int]] = {}  # prefix -> [next, end)
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def prefix_for(values: dict) -> str:
+        """
+        Resolve the code prefix for an office from the configured prefix field.
+
+        Args:
+            values (dict): The office's field values.
+
+        Returns:
+            str: The configured prefix, or the first letters of the field value.
+        """
+        value = values.get(settings.office_code_prefix_field) or ""
+        prefix = settings.office_code_prefixes.get(value)
+        if prefix is None:
+            prefix = re.sub(r"[^A-Z0-9]", "", str(value).upper())[:4] or "OF"
+        return prefix
+
+    def _format(self, prefix: str, number: int) -> str:
+        """
+        Render a code number with its prefix, e.g. ('BR', 42) -> 'BR000042'.
+        """
+        code = f"{prefix}{number:0{self.digits}d}"
+        if len(code) > 16:
+            raise ValueError(f"Generated office code {code!r} exceeds 16 characters.")
+        return code
+
+    async def next_codes(self, prefix: str, count: int = 1) -> List[str]:
+        """
+        Take the next codes for a prefix, reserving new blocks as needed.
+
+        Args:
+            prefix (str): The code prefix.
+            count (int): The number of codes to generate.
+
+        Returns:
+            List[str]: The generated codes.
+        """
+        codes = []
+        async with self._lock:
+            while len(codes) < count:
+                block = self._blocks.get(prefix)
+                if block is None or block[0] >= block[1]:
+                    size = max(self.block_size, count - len(codes))
+                    block = list(await OfficeCodeSequenceRepository.reserve_block(prefix, size))
+                    self._blocks[prefix] = block
+                take = min(count - len(codes), block[1] - block[0])
+                codes.extend(self._format(prefix, number) for number in range(block[0], block[0] + take))
+                block[0] += take
+        return codes
+
+
+# Process-wide generator; blocks are reserved lazily on first use
+office_code_generator = OfficeCodeGenerator(
+    block_size=settings.office_code_block_size,
+    digits=settings.office_code_digits,
+)
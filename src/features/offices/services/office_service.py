@@ -1,16 +1,126 @@
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.exc import StaleDataError
 from fastapi import HTTPException, UploadFile
 from src.features.offices.models.offices import Office
 from src.features.offices.schemas.office_schemas import OfficeCreate, OfficeUpdate
 from src.features.offices.repositories.office_repo import OfficeRepository
-from typing import List
+from src.features.offices.repositories.office_count_repo import OfficeCountRepository
+from src.features.offices.repositories.office_history_repo import OfficeHistoryRepository
+from src.features.offices.repositories.office_tile_repo import OfficeTileRepository
+from src.features.offices.services.office_code_service import office_code_generator
+from src.features.users.repositories.org_headcount_repo import OrgHeadcountRepository
+from src.core.config import settings
+from src.core.loading import parse_include
+from typing import List, Optional, Tuple
 from fastapi.responses import FileResponse
+from pydantic import ValidationError
+from datetime import datetime
+from openpyxl.utils.exceptions import InvalidFileException
+import base64
 import io
+import openpyxl
+import zipfile
+
+
+def _encode_sync_token(updated_at: datetime, code: str) -> str:
+    """
+    Encode a delta-sync position as an opaque URL-safe token.
+    """
+    raw = f"{updated_at.isoformat()}|{code}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_sync_token(token: str) -> Tuple[datetime, str]:
+    """
+    Decode a token produced by `_encode_sync_token` back into a sync position.
+
+    Raises:
+        HTTPException: If the token is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode("utf-8")
+        updated_at, code = raw.split("|", 1)
+        return datetime.fromisoformat(updated_at), code
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail="Invalid sync token.") from e
+
+
+def _read_offices_xlsx(content: bytes) -> Tuple[List[OfficeCreate], List[dict]]:
+    """
+    Parse and validate the rows of an office import workbook.
+
+    The first row of the active sheet holds the column names (matching the OfficeCreate
+    fields); every following non-empty row is one office.
+
+    Returns:
+        Tuple[List[OfficeCreate], List[dict]]: The valid offices and the per-row errors.
+
+    Raises:
+        HTTPException: If the content is not a readable workbook, or a code appears in
+            more than one row.
+    """
+    try:
+        workbook = openpyxl.load_workbook(io.BytesIO(content), read_only=True, data_only=True)
+    except (InvalidFileException, zipfile.BadZipFile, KeyError) as e:
+        raise HTTPException(status_code=400, detail="The uploaded file is not a valid XLSX workbook.") from e
+    rows = workbook.active.iter_rows(values_only=True)
+    header = [str(name).strip().lower() if name is not None else None for name in next(rows, ())]
+
+    offices, errors, code_rows = [], [], {}
+    for row_number, row in enumerate(rows, start=2):
+        values = {}
+        for name, value in zip(header, row):
+            if name not in OfficeCreate.__fields__ or value is None or value == "":
+                continue
+            values[name] = value if name in ("o_lat", "o_long") else str(value).strip()
+        if not values:
+            continue
+        code = values.get("code")
+        if code:
+            if code in code_rows:
+                workbook.close()
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Row {row_number}: office code '{code}' already appears in row {code_rows[code]}.",
+                )
+            code_rows[code] = row_number
+        try:
+            offices.append(OfficeCreate(**values))
+        except ValidationError as e:
+            detail = "; ".join(
+                f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}" for error in e.errors()
+            )
+            errors.append({"row": row_number, "detail": detail})
+    workbook.close()
+    return offices, errors
+
+
+async def _assign_codes(offices: List[OfficeCreate]) -> List[OfficeCreate]:
+    """
+    Fill in generated codes for offices that were submitted without one.
+
+    Codes are requested in one batch per prefix, so a large list costs at most one
+    sequence round trip per exhausted block.
+    """
+    pending = {}
+    for index, data in enumerate(offices):
+        if not data.code:
+            pending.setdefault(office_code_generator.prefix_for(data.dict()), []).append(index)
+
+    offices = list(offices)
+    for prefix, indexes in pending.items():
+        codes = await office_code_generator.next_codes(prefix, len(indexes))
+        for index, code in zip(indexes, codes):
+            offices[index] = offices[index].copy(update={"code": code})
+    return offices
 
 async def create_office(db: AsyncSession, data: OfficeCreate) -> dict:
     """
     Create a new office in the database.
 
+    If no code is supplied, one is generated from the office's prefix sequence.
+
     Args:
         db (AsyncSession): The database session.
         data (OfficeCreate): The data for the new office.
@@ -19,34 +129,119 @@ async def create_office(db: AsyncSession, data: OfficeCreate) -> dict:
         dict: The newly created office as a dictionary.
 
     Raises:
-        HTTPException: If an office with the given code already exists.
+        HTTPException: If an office with the given code already exists, or no valid code
+            can be generated for it.
     """
-    existing_office = await OfficeRepository.get_by_code(db, data.code)
-    if existing_office:
-        raise HTTPException(status_code=400, detail="Office with this code already exists.")
-    office = await OfficeRepository.create(db, data)
+    if data.code:
+        existing_office = await OfficeRepository.get_by_code(db, data.code)
+        if existing_office:
+            raise HTTPException(status_code=400, detail="Office with this code already exists.")
+    else:
+        prefix = office_code_generator.prefix_for(data.dict())
+        try:
+            (code,) = await office_code_generator.next_codes(prefix)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        data = data.copy(update={"code": code})
+    try:
+        office = await OfficeRepository.create(db, data)
+    except IntegrityError as e:
+        # A concurrent insert, or a generated code already taken by a manually entered one
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Office with this code already exists.") from e
     return office.to_dict()
 
-async def get_office_by_id(db: AsyncSession, code: str) -> dict:
+async def create_offices_bulk(db: AsyncSession, offices: List[OfficeCreate]) -> List[dict]:
+    """
+    Create several offices in one transaction, generating codes for those without one.
+
+    Codes are taken from in-memory blocks, one batch per prefix, so no per-office
+    existence check is needed.
+
+    Args:
+        db (AsyncSession): The database session.
+        offices (List[OfficeCreate]): The data for the new offices.
+
+    Returns:
+        List[dict]: The newly created offices as dictionaries.
+
+    Raises:
+        HTTPException: If a supplied code is duplicated or already exists, or no valid code
+            can be generated.
+    """
+    try:
+        offices = await _assign_codes(offices)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    try:
+        created = await OfficeRepository.create_many(db, offices)
+    except IntegrityError as e:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="One or more office codes already exist.") from e
+    return [office.to_dict() for office in created]
+
+async def _embed_user_counts(db: AsyncSession, offices: List[dict]) -> None:
+    """
+    Add the `user_count` headcount to office dictionaries with one primary-key lookup per office.
+    """
+    counts = await OrgHeadcountRepository.get_office_counts(db, [office["code"] for office in offices])
+    for office in offices:
+        office["user_count"] = counts.get(office["code"], 0)
+
+async def get_office_by_id(
+    db: AsyncSession, code: str, as_of: Optional[datetime] = None, include: Optional[str] = None
+) -> dict:
     """
     Retrieve an office by its unique code.
 
     Args:
         db (AsyncSession): The database session.
         code (str): The unique code of the office.
+        as_of (datetime, optional): Return the office as it was at this point in time.
+        include (str, optional): Comma-separated relationships to embed (e.g., "users,user_count").
 
     Returns:
         dict: The office as a dictionary.
 
     Raises:
-        HTTPException: If the office does not exist.
+        HTTPException: If the office does not exist (or did not exist at `as_of`),
+            or an unknown relationship is requested.
     """
-    office = await OfficeRepository.get_by_code(db, code)
+    relationships = parse_include(include, OfficeRepository.INCLUDES)
+    if as_of is not None:
+        state = await OfficeHistoryRepository.get_state_as_of(db, code, as_of)
+        if state is None:
+            raise HTTPException(status_code=404, detail="Office not found.")
+        return state
+    office = await OfficeRepository.get_by_code(db, code, relationships)
     if not office:
         raise HTTPException(status_code=404, detail="Office not found.")
-    return office.to_dict()
+    data = office.to_dict(relationships)
+    if "user_count" in relationships:
+        await _embed_user_counts(db, [data])
+    return data
+
+async def get_office_history(
+    db: AsyncSession, code: str, before_id: Optional[int] = None, limit: int = 50
+) -> List[dict]:
+    """
+    Retrieve the change history of an office, newest first.
 
-async def get_all_offices(db: AsyncSession, skip: int = 0, limit: int = 10, active: bool = None) -> List[dict]:
+    Args:
+        db (AsyncSession): The database session.
+        code (str): The unique code of the office.
+        before_id (int, optional): Only return entries older than this entry id.
+        limit (int): The maximum number of entries to return.
+
+    Returns:
+        List[dict]: The history entries as dictionaries.
+    """
+    entries = await OfficeHistoryRepository.get_for_office(db, code, before_id, limit)
+    return [entry.to_dict() for entry in entries]
+
+async def get_all_offices(
+    db: AsyncSession, skip: int = 0, limit: int = 10, active: bool = None, include: Optional[str] = None
+) -> List[dict]:
     """
     Retrieve all offices with optional pagination and filtering.
 
@@ -55,12 +250,64 @@ async def get_all_offices(db: AsyncSession, skip: int = 0, limit: int = 10, acti
         skip (int): The number of records to skip.
         limit (int): The maximum number of records to return.
         active (bool, optional): Filter by active status.
+        include (str, optional): Comma-separated relationships to embed (e.g., "users,user_count").
 
     Returns:
         List[dict]: A list of office dictionaries.
+
+    Raises:
+        HTTPException: If an unknown relationship is requested.
     """
-    offices = await OfficeRepository.get_all(db, skip, limit, active)
-    return [office.to_dict() for office in offices]
+    relationships = parse_include(include, OfficeRepository.INCLUDES)
+    offices = await OfficeRepository.get_all(db, skip, limit, active, relationships)
+    data = [office.to_dict(relationships) for office in offices]
+    if "user_count" in relationships:
+        await _embed_user_counts(db, data)
+    return data
+
+async def count_offices(db: AsyncSession, active: bool = None) -> int:
+    """
+    Count the offices matching the listing filters for pagination headers.
+
+    Args:
+        db (AsyncSession): The database session.
+        active (bool, optional): Filter by active status.
+
+    Returns:
+        int: The number of matching offices.
+    """
+    return await OfficeCountRepository.count(db, active=active)
+
+async def get_office_changes(db: AsyncSession, since: Optional[str] = None, limit: int = 500) -> dict:
+    """
+    Retrieve offices created, updated or soft-deleted after a sync token.
+
+    Args:
+        db (AsyncSession): The database session.
+        since (str, optional): The token returned by the previous sync; omit for a full sync.
+        limit (int): The maximum number of changes to return.
+
+    Returns:
+        dict: The changed offices, tombstones for soft-deleted offices, the next token
+        and whether more changes are pending.
+
+    Raises:
+        HTTPException: If the sync token is malformed.
+    """
+    position = _decode_sync_token(since) if since else None
+    offices, has_more = await OfficeRepository.get_changes(db, position, limit)
+
+    changes, tombstones = [], []
+    for office in offices:
+        if office.deleted_at is not None:
+            tombstones.append({"code": office.code, "deleted_at": office.deleted_at})
+        else:
+            changes.append(office.to_dict())
+
+    next_token = since
+    if offices:
+        next_token = _encode_sync_token(offices[-1].updated_at, offices[-1].code)
+    return {"offices": changes, "tombstones": tombstones, "next_token": next_token, "has_more": has_more}
 
 async def update_office(db: AsyncSession, code: str, data: OfficeUpdate) -> dict:
     """
@@ -75,9 +322,14 @@ async def update_office(db: AsyncSession, code: str, data: OfficeUpdate) -> dict
         dict: The updated office as a dictionary.
 
     Raises:
-        HTTPException: If the office does not exist.
+        HTTPException: If the office does not exist, or 409 if it was modified concurrently.
     """
-    office = await OfficeRepository.update(db, code, data)
+    try:
+        office = await OfficeRepository.update(db, code, data)
+    except StaleDataError as e:
+        raise HTTPException(
+            status_code=409, detail="Office was modified by another request. Reload and retry."
+        ) from e
     if not office:
         raise HTTPException(status_code=404, detail="Office not found.")
     return office.to_dict()
@@ -94,9 +346,14 @@ async def deactivate_office(db: AsyncSession, code: str) -> dict:
         dict: The deactivated office as a dictionary.
 
     Raises:
-        HTTPException: If the office does not exist.
+        HTTPException: If the office does not exist, or 409 if it was modified concurrently.
     """
-    office = await OfficeRepository.deactivate(db, code)
+    try:
+        office = await OfficeRepository.deactivate(db, code)
+    except StaleDataError as e:
+        raise HTTPException(
+            status_code=409, detail="Office was modified by another request. Reload and retry."
+        ) from e
     if not office:
         raise HTTPException(status_code=404, detail="Office not found.")
     return office.to_dict()
@@ -113,9 +370,14 @@ async def soft_delete_office(db: AsyncSession, code: str) -> dict:
         dict: The soft-deleted office as a dictionary.
 
     Raises:
-        HTTPException: If the office does not exist.
+        HTTPException: If the office does not exist, or 409 if it was modified concurrently.
     """
-    office = await OfficeRepository.soft_delete(db, code)
+    try:
+        office = await OfficeRepository.soft_delete(db, code)
+    except StaleDataError as e:
+        raise HTTPException(
+            status_code=409, detail="Office was modified by another request. Reload and retry."
+        ) from e
     if not office:
         raise HTTPException(status_code=404, detail="Office not found.")
     return office.to_dict()
@@ -139,6 +401,58 @@ async def delete_office_permanent(db: AsyncSession, code: str) -> dict:
         raise HTTPException(status_code=404, detail="Office not found.")
     return {"detail": "Office deleted permanently."}
 
+async def purge_deleted_offices(db: AsyncSession, before: datetime, batch_size: int = 500) -> dict:
+    """
+    Permanently delete offices that were soft-deleted before a cutoff.
+
+    Args:
+        db (AsyncSession): The database session.
+        before (datetime): Offices soft-deleted before this timestamp are purged.
+        batch_size (int): The maximum number of offices removed per batch.
+
+    Returns:
+        dict: The number of offices purged and the number of batches executed.
+    """
+    return await OfficeRepository.purge_soft_deleted(db, before, batch_size)
+
+async def get_office_tile(db: AsyncSession, z: int, x: int, y: int) -> dict:
+    """
+    Retrieve the pre-aggregated office clusters of a map tile.
+
+    Args:
+        db (AsyncSession): The database session.
+        z (int): The zoom level.
+        x (int): The tile column.
+        y (int): The tile row.
+
+    Returns:
+        dict: The tile coordinates and its clusters (count, centroid and sample codes).
+
+    Raises:
+        HTTPException: If the tile coordinates are out of range.
+    """
+    if not 0 <= z <= settings.office_tile_max_zoom:
+        raise HTTPException(
+            status_code=400, detail=f"Zoom level must be between 0 and {settings.office_tile_max_zoom}."
+        )
+    if not (0 <= x < (1 << z) and 0 <= y < (1 << z)):
+        raise HTTPException(status_code=400, detail="Tile coordinates are out of range.")
+    clusters = await OfficeTileRepository.get_tile(db, z, x, y)
+    return {"z": z, "x": x, "y": y, "clusters": [cluster.to_dict() for cluster in clusters]}
+
+async def rebuild_office_tiles(db: AsyncSession) -> dict:
+    """
+    Recompute all map tile clusters from the offices table.
+
+    Args:
+        db (AsyncSession): The database session.
+
+    Returns:
+        dict: The number of clusters written.
+    """
+    count = await OfficeTileRepository.rebuild(db)
+    return {"clusters": count}
+
 async def export_offices_to_xlsx(db: AsyncSession) -> FileResponse:
     """
     Export all offices to an XLSX file.
@@ -166,16 +480,39 @@ async def import_offices_from_xlsx(file: UploadFile, db: AsyncSession) -> dict:
     """
     Import office data from an XLSX file.
 
+    Rows identical to the stored office (by content hash) are skipped without a write;
+    rows without a code are created with a generated one.
+
     Args:
         file (UploadFile): The uploaded XLSX file.
         db (AsyncSession): The database session.
 
     Returns:
-        dict: A success message.
+        dict: A summary with the inserted, updated and unchanged counts and any row errors.
+
+    Raises:
+        HTTPException: If the file is not a valid workbook, repeats a code, no valid code
+            can be generated for a row, or the import conflicts with a concurrent write.
     """
     if not file.filename.endswith(".xlsx"):
         raise HTTPException(status_code=400, detail="Invalid file format. Please upload an XLSX file.")
-    
+
     file_content = await file.read()
-    result = await OfficeRepository.import_from_xlsx(io.BytesIO(file_content), db)
-    return {"detail": f"{result} records imported successfully."}
+    offices, errors = _read_offices_xlsx(file_content)
+    try:
+        offices = await _assign_codes(offices)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    try:
+        result = await OfficeRepository.import_many(db, offices)
+    except IntegrityError as e:
+        # A concurrent insert of one of the new codes
+        await db.rollback()
+        raise HTTPException(
+            status_code=409, detail="Offices were modified by another request. Retry the import."
+        ) from e
+    return {
+        "detail": f"{len(offices)} records imported successfully.",
+        **result,
+        "errors": errors,
+    }
@@ -0,0 +1,95 @@
+from sqlalchemy import Column, String, Boolean, DateTime, BigInteger, ForeignKey, JSON
+from src.models.base import Base
+from datetime import datetime
+
+
+class ApiKey(Base):
+    """
+    Represents an API key used by a machine client instead of a user login.
+
+    Only the SHA-256 digest of the key is stored. A key grants exactly the privileges
+    listed on it, independently of any role.
+    """
+    __tablename__ = "api_keys"
+
+    # Columns
+    id = Column(
+        BigInteger,
+        primary_key=True,
+        autoincrement=True,
+        doc="Unique identifier for the API key."
+    )
+    name = Column(
+        String(48),
+        nullable=False,
+        doc="Name of the client or integration using the key."
+    )
+    key_prefix = Column(
+        String(12),
+        nullable=False,
+        doc="First characters of the key, to help identify it without revealing it."
+    )
+    key_digest = Column(
+        String(64),
+        unique=True,
+        nullable=False,
+        doc="Hex-encoded SHA-256 digest of the key; keys are authenticated by looking it up."
+    )
+    privileges = Column(
+        JSON,
+        nullable=False,
+        doc="Privileges granted to the key."
+    )
+    active = Column(
+        Boolean,
+        default=True,
+        nullable=False,
+        doc="Indicates if the key is usable; false once revoked."
+    )
+    expires_at = Column(
+        DateTime,
+        nullable=True,
+        doc="Timestamp after which the key is rejected; null if it does not expire."
+    )
+    created_by = Column(
+        BigInteger,
+        ForeignKey("users.id", ondelete="SET NULL"),
+        nullable=True,
+        doc="ID of the user who created the key."
+    )
+    created_at = Column(
+        DateTime,
+        default=datetime.utcnow,
+        nullable=False,
+        doc="Timestamp of when the key was created."
+    )
+    revoked_at = Column(
+        DateTime,
+        nullable=True,
+        doc="Timestamp of when the key was revoked."
+    )
+
+    def __repr__(self):
+        """
+        Provides a string representation of the object for debugging and logging.
+        """
+        return f"<ApiKey(id={self.id!r}, name={self.name!r}, active={self.active!r})>"
+
+    def to_dict(self):
+        """
+        Converts the object to a dictionary for JSON serialization or API responses.
+
+        Returns:
+            dict: A dictionary representation of the ApiKey instance, without the digest.
+        """
+        return {
+            "id": self.id,
+            "name": self.name,
+            "key_prefix": self.key_prefix,
+            "privileges": self.privileges,
+            "active": self.active,
+            "expires_at": self.expires_at.isoformat() if self.expires_at else None,
+            "created_by": self.created_by,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "revoked_at": self.revoked_at.isoformat() if self.revoked_at else None,
+        }
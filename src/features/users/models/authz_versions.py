@@ -0,0 +1,70 @@
+from sqlalchemy import Column, Integer, BigInteger, DateTime, update
+from src.models.base import Base
+from datetime import datetime
+
+# Primary key of the single version row
+AUTHZ_VERSION_ID = 1
+
+
+class AuthzVersion(Base):
+    """
+    Represents the version of the authorization data (roles, privileges and grants).
+
+    The single row is bumped in the same transaction as every change to that data, so
+    workers holding authorization state in memory can poll one row and reload only
+    when it moved.
+    """
+    __tablename__ = "authz_versions"
+
+    # Columns
+    id = Column(
+        Integer,
+        primary_key=True,
+        autoincrement=False,
+        doc="Identifier of the version row; always 1."
+    )
+    version = Column(
+        BigInteger,
+        default=0,
+        nullable=False,
+        doc="Incremented on every change to roles, privileges or grants."
+    )
+    updated_at = Column(
+        DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        nullable=False,
+        doc="Timestamp of the last change."
+    )
+
+    def __repr__(self):
+        """
+        Provides a string representation of the object for debugging and logging.
+        """
+        return f"<AuthzVersion(version={self.version!r})>"
+
+    def to_dict(self):
+        """
+        Converts the object to a dictionary for JSON serialization or API responses.
+
+        Returns:
+            dict: A dictionary representation of the AuthzVersion instance.
+        """
+        return {
+            "version": self.version,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+
+def bump_authz_version_statement():
+    """
+    Returns the UPDATE that increments the authorization version.
+
+    Execute it in the transaction that changes roles, privileges or grants.
+    """
+    table = AuthzVersion.__table__
+    return (
+        update(table)
+        .where(table.c.id == AUTHZ_VERSION_ID)
+        .values(version=table.c.version + 1, updated_at=datetime.utcnow())
+    )
@@ -0,0 +1,146 @@
+from sqlalchemy import Column, String, DateTime, BigInteger
+from sqlalchemy.dialects.mysql import insert
+from src.models.base import Base
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+# Stored in place of a missing office or role, so it can be part of the primary key
+NO_VALUE = ""
+# Stored in place of an office or role to count users of any office or role
+ANY = "*"
+
+
+class OrgHeadcount(Base):
+    """
+    Represents the number of users of one office and role.
+
+    Besides each (office, role) pair, rows keyed with ANY hold the totals per office,
+    per role and overall, so every headcount is a primary-key lookup. Soft-deleted users
+    are not counted. Counts are maintained incrementally by the User write listeners and
+    by the bulk statements that bypass them, and corrected by a periodic reconcile.
+    """
+    __tablename__ = "org_headcounts"
+
+    # Columns
+    office = Column(
+        String(16),
+        primary_key=True,
+        nullable=False,
+        doc="Office code; empty for users without an office, '*' for any office."
+    )
+    role = Column(
+        String(24),
+        primary_key=True,
+        nullable=False,
+        doc="Role; empty for users without a role, '*' for any role."
+    )
+    total = Column(
+        BigInteger,
+        default=0,
+        nullable=False,
+        doc="Number of users that are not soft-deleted."
+    )
+    active = Column(
+        BigInteger,
+        default=0,
+        nullable=False,
+        doc="Number of active users that are not soft-deleted."
+    )
+    updated_at = Column(
+        DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        nullable=False,
+        doc="Timestamp of when the counts were last adjusted."
+    )
+
+    def __repr__(self):
+        """
+        Provides a string representation of the object for debugging and logging.
+        """
+        return (
+            f"<OrgHeadcount(office={self.office!r}, role={self.role!r}, "
+            f"total={self.total!r}, active={self.active!r})>"
+        )
+
+    def to_dict(self):
+        """
+        Converts the object to a dictionary for JSON serialization or API responses.
+
+        Returns:
+            dict: A dictionary representation of the OrgHeadcount instance.
+        """
+        return {
+            "office": self.office,
+            "role": self.role,
+            "total": self.total,
+            "active": self.active,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+
+def headcount_keys(office: Optional[str], role: Optional[str]) -> List[Tuple[str, str]]:
+    """
+    Returns the headcount keys a user of the given office and role contributes to.
+
+    Args:
+        office (Optional[str]): The office code of the user.
+        role (Optional[str]): The role of the user.
+
+    Returns:
+        List[Tuple[str, str]]: The (office, role) keys whose counts include the user.
+    """
+    office, role = office or NO_VALUE, role or NO_VALUE
+    return [(office, role), (office, ANY), (ANY, role), (ANY, ANY)]
+
+
+def add_headcount_deltas(
+    deltas: Dict[Tuple[str, str], List[int]],
+    office: Optional[str],
+    role: Optional[str],
+    active: bool,
+    sign: int = 1,
+    count: int = 1,
+) -> None:
+    """
+    Adds users of one office, role and status to a set of pending headcount deltas.
+
+    Args:
+        deltas (Dict[Tuple[str, str], List[int]]): Pending [total, active] deltas per key.
+        office (Optional[str]): The office code of the users.
+        role (Optional[str]): The role of the users.
+        active (bool): Whether the users are active.
+        sign (int): 1 to add the users, -1 to remove them.
+        count (int): The number of users.
+    """
+    for key in headcount_keys(office, role):
+        delta = deltas.setdefault(key, [0, 0])
+        delta[0] += sign * count
+        delta[1] += sign * count * int(bool(active))
+
+
+def adjust_org_headcounts(connection, deltas: Dict[Tuple[str, str], List[int]]) -> None:
+    """
+    Applies headcount deltas within the current transaction, creating missing rows.
+
+    Args:
+        connection: The connection of the transaction performing the user writes.
+        deltas (Dict[Tuple[str, str], List[int]]): [total, active] deltas per (office, role) key.
+    """
+    now = datetime.utcnow()
+    values = [
+        {"office": office, "role": role, "total": total, "active": active, "updated_at": now}
+        for (office, role), (total, active) in sorted(deltas.items())  # Sorted to lock rows in a stable order
+        if total or active
+    ]
+    if not values:
+        return
+    table = OrgHeadcount.__table__
+    statement = insert(table).values(values)
+    connection.execute(
+        statement.on_duplicate_key_update(
+            total=table.c.total + statement.inserted.total,
+            active=table.c.active + statement.inserted.active,
+            updated_at=statement.inserted.updated_at,
+        )
+    )
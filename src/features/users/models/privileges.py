@@ -49,8 +49,10 @@ class Privilege(Base):
     # Relationships
     role_privileges = relationship(
         "RolePrivilege",
-        back_populates="privilege",
+        back_populates="privilege_relationship",
         cascade="all, delete-orphan",  # Automatically delete related RolePrivilege entries
+        passive_deletes=True,  # Grants are removed by ON DELETE CASCADE
+        lazy="raise",
         doc="Defines the relationship with RolePrivilege model entries associated with this privilege."
     )
 
@@ -54,6 +54,7 @@ class RefreshToken(Base):
     user = relationship(
         "User",
         back_populates="refresh_tokens",
+        lazy="raise",
         doc="Defines the relationship with the User model."
     )
 
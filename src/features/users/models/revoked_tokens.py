@@ -0,0 +1,67 @@
+from sqlalchemy import Column, String, DateTime, BigInteger, ForeignKey
+from src.models.base import Base
+from datetime import datetime
+
+
+class RevokedToken(Base):
+    """
+    Represents a revoked JWT.
+
+    Tokens are identified by their `jti` claim and kept until they expire; after that
+    the signature check rejects them anyway and the row can be purged. Rows are only
+    appended, so workers sync new revocations incrementally by id.
+    """
+    __tablename__ = "revoked_tokens"
+
+    # Columns
+    id = Column(
+        BigInteger,
+        primary_key=True,
+        autoincrement=True,
+        doc="Unique identifier for the revocation record; increases with every revocation."
+    )
+    jti = Column(
+        String(32),
+        unique=True,
+        nullable=False,
+        doc="The `jti` (token ID) claim of the revoked token."
+    )
+    user_id = Column(
+        BigInteger,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=True,
+        doc="References the user the token was issued to."
+    )
+    expires_at = Column(
+        DateTime,
+        nullable=False,
+        index=True,
+        doc="Expiry of the revoked token; the record can be purged after this time."
+    )
+    revoked_at = Column(
+        DateTime,
+        default=datetime.utcnow,
+        nullable=False,
+        doc="Timestamp of when the token was revoked."
+    )
+
+    def __repr__(self):
+        """
+        Provides a string representation of the object for debugging and logging.
+        """
+        return f"<RevokedToken(jti={self.jti!r}, expires_at={self.expires_at!r})>"
+
+    def to_dict(self):
+        """
+        Converts the object to a dictionary for JSON serialization or API responses.
+
+        Returns:
+            dict: A dictionary representation of the RevokedToken instance.
+        """
+        return {
+            "id": self.id,
+            "jti": self.jti,
+            "user_id": self.user_id,
+            "expires_at": self.expires_at.isoformat() if self.expires_at else None,
+            "revoked_at": self.revoked_at.isoformat() if self.revoked_at else None,
+        }
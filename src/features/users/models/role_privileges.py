@@ -2,6 +2,7 @@ from sqlalchemy import Column, String, DateTime, ForeignKey, PrimaryKeyConstrain
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from src.models.base import Base
+from src.features.users.models.privileges import Privilege
 
 
 class RolePrivilege(Base):
@@ -51,11 +52,13 @@ class RolePrivilege(Base):
     role_relationship = relationship(
         "Role",
         back_populates="role_privileges",
+        lazy="raise",
         doc="Relationship to the Role model."
     )
     privilege_relationship = relationship(
         "Privilege",
         back_populates="role_privileges",
+        lazy="raise",
         doc="Relationship to the Privilege model."
     )
 
@@ -1,6 +1,7 @@
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, String, DateTime, ForeignKey
 from sqlalchemy.orm import relationship
 from src.models.base import Base
+from src.features.users.models.role_privileges import RolePrivilege
 from datetime import datetime
 
 
@@ -9,7 +10,8 @@ class Role(Base):
     Represents a role in the system.
 
     Roles define a user's level of access and permissions within the system,
-    typically linked to one or more privileges.
+    typically linked to one or more privileges. A role may have a parent role whose
+    effective privileges it inherits in addition to its own grants.
     """
     __tablename__ = "roles"
 
@@ -25,6 +27,13 @@ class Role(Base):
         nullable=True,
         doc="A brief description of the role's purpose or permissions."
     )
+    parent_role = Column(
+        String(24),
+        ForeignKey("roles.role", ondelete="SET NULL", name="fk_roles_parent_role"),
+        nullable=True,
+        index=True,
+        doc="Role whose privileges this role inherits; the hierarchy must not contain cycles."
+    )
     created_at = Column(
         DateTime,
         default=datetime.utcnow,
@@ -42,14 +51,17 @@ class Role(Base):
     # Relationships
     role_privileges = relationship(
         "RolePrivilege",
-        back_populates="role",
+        back_populates="role_relationship",
         cascade="all, delete-orphan",  # Automatically delete related RolePrivilege entries
+        passive_deletes=True,  # Grants are removed by ON DELETE CASCADE
+        lazy="raise",
         doc="Defines the relationship with RolePrivilege model entries associated with this role."
     )
     users = relationship(
         "User",
-        back_populates="role",
+        back_populates="role_relationship",
         passive_deletes=True,  # Set foreign key to NULL on delete
+        lazy="raise",
         doc="Defines the relationship with User model entries associated with this role."
     )
 
@@ -69,6 +81,7 @@ class Role(Base):
         return {
             "role": self.role,
             "description": self.description,
+            "parent_role": self.parent_role,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
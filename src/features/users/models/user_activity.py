@@ -1,8 +1,19 @@
-from sqlalchemy import Column, String, DateTime, BigInteger, ForeignKey
+from sqlalchemy import Column, DateTime, BigInteger, Integer, Index
 from sqlalchemy.orm import relationship
 from src.models.base import Base
+from src.models.types import CodedString, IPAddress
+from src.features.users.models.user_agents import UserAgent
 from datetime import datetime
 
+# Stored code of each activity action; append new actions, never renumber
+ACTIVITY_ACTIONS = {
+    "OTHER": 0,  # Legacy actions outside this vocabulary
+    "LOGIN": 1,
+    "LOGOUT": 2,
+    "FAILED_LOGIN": 3,
+    "PASSWORD_CHANGE": 4,
+}
+
 
 class UserActivity(Base):
     """
@@ -10,6 +21,14 @@ class UserActivity(Base):
 
     This table tracks various actions performed by users, including their metadata such as
     IP address and user agent.
+
+    The table is range-partitioned by month of `action_time` (see the migration), so old
+    activity is removed by dropping whole partitions and time-bounded queries only touch
+    the partitions they need. Partitioned tables cannot have foreign keys, so `user_id`
+    is not enforced by the database.
+
+    Rows are stored compactly: the action as a one-byte code, the IP address in binary
+    and the user agent as a reference into `user_agents`.
     """
     __tablename__ = "user_activity"
 
@@ -22,29 +41,30 @@ class UserActivity(Base):
     )
     user_id = Column(
         BigInteger,
-        ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        doc="References the user who performed the action."
+        doc="References the user who performed the action (not enforced; see class docstring)."
     )
     action = Column(
-        String(32),
+        CodedString(ACTIVITY_ACTIONS),
         nullable=False,
-        doc="Specifies the type of action (e.g., LOGIN, LOGOUT, FAILED_LOGIN, PASSWORD_CHANGE)."
+        doc="Specifies the type of action (e.g., LOGIN, LOGOUT, FAILED_LOGIN, PASSWORD_CHANGE); "
+            "stored as its code from ACTIVITY_ACTIONS."
     )
     action_time = Column(
         DateTime,
+        primary_key=True,
         nullable=False,
-        doc="Timestamp of when the action was performed."
+        doc="Timestamp of when the action was performed; the partitioning key."
     )
     ip_address = Column(
-        String(48),
+        IPAddress,
         nullable=True,
-        doc="Tracks the IP address of the user; supports both IPv4 and IPv6."
+        doc="Tracks the IP address of the user; supports both IPv4 and IPv6, stored in binary."
     )
-    user_agent = Column(
-        String(255),
+    user_agent_id = Column(
+        Integer,
         nullable=True,
-        doc="Stores the user agent string of the device used to perform the action."
+        doc="References the user agent of the device used to perform the action (not enforced)."
     )
     created_at = Column(
         DateTime,
@@ -60,13 +80,29 @@ class UserActivity(Base):
         doc="Timestamp of when the user activity record was last updated."
     )
 
+    # Indexes
+    __table_args__ = (
+        Index("ix_user_activity_user_id_action_time", "user_id", "action_time"),  # Per-user timeline
+    )
+
     # Relationships
     user = relationship(
         "User",
         back_populates="user_activity",
+        primaryjoin="foreign(UserActivity.user_id) == User.id",
+        viewonly=True,
+        lazy="raise",
         doc="Defines the relationship with the User model."
     )
 
+    agent = relationship(
+        "UserAgent",
+        primaryjoin="foreign(UserActivity.user_agent_id) == UserAgent.id",
+        viewonly=True,
+        lazy="raise",
+        doc="The interned user agent string; load with selectinload."
+    )
+
     def __repr__(self):
         """
         Provides a string representation of the object for debugging and logging.
@@ -77,6 +113,8 @@ class UserActivity(Base):
         """
         Converts the object to a dictionary for JSON serialization or API responses.
 
+        The user agent is resolved through the `agent` relationship, which must be loaded.
+
         Returns:
             dict: A dictionary representation of the UserActivity instance.
         """
@@ -86,7 +124,7 @@ class UserActivity(Base):
             "action": self.action,
             "action_time": self.action_time.isoformat() if self.action_time else None,
             "ip_address": self.ip_address,
-            "user_agent": self.user_agent,
+            "user_agent": self.agent.user_agent if self.user_agent_id is not None and self.agent else None,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
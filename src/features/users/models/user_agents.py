@@ -0,0 +1,52 @@
+from sqlalchemy import Column, String, DateTime, Integer
+from src.models.base import Base
+from datetime import datetime
+
+
+class UserAgent(Base):
+    """
+    Represents a distinct user agent string.
+
+    User agents repeat heavily across activity records, so each distinct string is
+    stored once here and activity rows reference it by id.
+    """
+    __tablename__ = "user_agents"
+
+    # Columns
+    id = Column(
+        Integer,
+        primary_key=True,
+        autoincrement=True,
+        doc="Unique identifier for the user agent."
+    )
+    user_agent = Column(
+        String(255),
+        unique=True,
+        nullable=False,
+        doc="The user agent string, truncated to 255 characters."
+    )
+    created_at = Column(
+        DateTime,
+        default=datetime.utcnow,
+        nullable=False,
+        doc="Timestamp of when the user agent was first seen."
+    )
+
+    def __repr__(self):
+        """
+        Provides a string representation of the object for debugging and logging.
+        """
+        return f"<UserAgent(id={self.id!r}, user_agent={self.user_agent!r})>"
+
+    def to_dict(self):
+        """
+        Converts the object to a dictionary for JSON serialization or API responses.
+
+        Returns:
+            dict: A dictionary representation of the UserAgent instance.
+        """
+        return {
+            "id": self.id,
+            "user_agent": self.user_agent,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+        }
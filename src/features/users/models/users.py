@@ -1,9 +1,12 @@
-from sqlalchemy import Column, String, Boolean, DateTime, BigInteger, Integer, ForeignKey, event
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Boolean, DateTime, BigInteger, Integer, ForeignKey, Index, event, func, select
+from sqlalchemy.orm import attributes, relationship
 from src.models.base import Base
 from src.features.users.models.refresh_tokens import RefreshToken
 from src.features.users.models.user_activity import UserActivity
+from src.features.users.models.roles import Role
+from src.features.users.models.org_headcounts import add_headcount_deltas, adjust_org_headcounts
 from datetime import datetime
+from typing import Iterable
 
 
 class User(Base):
@@ -56,13 +59,19 @@ class User(Base):
     otp = Column(
         String(255),
         nullable=True,
-        doc="Hashed OTP for mobile verification."
+        doc="HMAC digest of the OTP for mobile verification."
     )
     otp_gen_at = Column(
         DateTime,
         nullable=True,
         doc="Date and time when the OTP was generated; restricts OTP generation to every 2 minutes."
     )
+    otp_attempts = Column(
+        Integer,
+        default=0,
+        nullable=False,
+        doc="Number of verification attempts made against the current mobile OTP."
+    )
     name = Column(
         String(48),
         nullable=False,
@@ -125,13 +134,19 @@ class User(Base):
     email_verification_otp = Column(
         String(255),
         nullable=True,
-        doc="Hashed OTP for email verification purposes."
+        doc="HMAC digest of the OTP for email verification purposes."
     )
     email_otp_gen_at = Column(
         DateTime,
         nullable=True,
         doc="Date and time when the email OTP was generated; restricts generation to every 2 minutes."
     )
+    email_otp_attempts = Column(
+        Integer,
+        default=0,
+        nullable=False,
+        doc="Number of verification attempts made against the current email OTP."
+    )
     jwtoken = Column(
         String(255),
         nullable=True,
@@ -207,31 +222,56 @@ class User(Base):
         back_populates="user",
         cascade="all, delete-orphan",
         passive_deletes=True,
+        lazy="raise",
         doc="Defines the relationship with RefreshToken model entries associated with this user."
     )
 
     user_activity = relationship(
         "UserActivity",
         back_populates="user",
-        cascade="all, delete-orphan",
-        passive_deletes=True,
+        primaryjoin="User.id == foreign(UserActivity.user_id)",
+        viewonly=True,  # Activity is an append-only log, removed by partition retention
+        lazy="raise",
         doc="Defines the relationship with UserActivity model entries associated with this user."
     )
 
+    role_relationship = relationship(
+        "Role",
+        back_populates="users",
+        lazy="raise",
+        doc="Defines the relationship with the Role model assigned to this user."
+    )
+
+    office_relationship = relationship(
+        "Office",
+        back_populates="users",
+        lazy="raise",
+        doc="Defines the relationship with the Office model this user belongs to."
+    )
+
+    # Indexes
+    __table_args__ = (
+        Index("ix_users_office_active", "office", "active"),  # Directory filter by office
+        Index("ix_users_role_active", "role", "active"),  # Directory filter by role
+    )
+
     def __repr__(self):
         """
         Provides a string representation of the object for debugging and logging.
         """
         return f"<User(id={self.id!r}, loginid={self.loginid!r}, active={self.active!r})>"
 
-    def to_dict(self):
+    def to_dict(self, include=()):
         """
         Converts the object to a dictionary for JSON serialization or API responses.
 
+        Args:
+            include (Iterable[str]): Eagerly loaded relationships to embed ("office", "role").
+
         Returns:
             dict: A dictionary representation of the User instance.
         """
-        return {
+        data = {
             "id": self.id,
             "loginid": self.loginid,
             "mobile": self.mobile,
@@ -264,3 +304,93 @@ class User(Base):
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
+        if "office" in include:
+            office = self.office_relationship
+            data["office_detail"] = (
+                {"code": office.code, "name": office.name, "o_type": office.o_type} if office else None
+            )
+        if "role" in include:
+            role = self.role_relationship
+            data["role_detail"] = (
+                {"role": role.role, "description": role.description} if role else None
+            )
+        return data
+
+
+# Columns that decide which headcounts a user is part of
+HEADCOUNT_FIELDS = ("office", "role", "active", "deleted_at")
+
+
+def _previous_value(target, key):
+    """
+    Returns the value an attribute had before the pending flush.
+    """
+    history = attributes.get_history(target, key)
+    if history.deleted:
+        return history.deleted[0]
+    if history.added:
+        return None
+    return getattr(target, key)
+
+
+@event.listens_for(User, "after_insert")
+def after_insert_headcounts(mapper, connection, target):
+    """
+    Counts a newly inserted user in the headcounts of its office and role.
+    """
+    if target.deleted_at is None:
+        deltas = {}
+        add_headcount_deltas(deltas, target.office, target.role, target.active)
+        adjust_org_headcounts(connection, deltas)
+
+
+@event.listens_for(User, "after_update")
+def after_update_headcounts(mapper, connection, target):
+    """
+    Moves a user between headcounts when it changes office or role, is (de)activated,
+    or is soft-deleted or restored.
+    """
+    if not any(attributes.get_history(target, key).has_changes() for key in HEADCOUNT_FIELDS):
+        return
+    office, role, active, deleted_at = (_previous_value(target, key) for key in HEADCOUNT_FIELDS)
+    deltas = {}
+    if deleted_at is None:
+        add_headcount_deltas(deltas, office, role, active, sign=-1)
+    if target.deleted_at is None:
+        add_headcount_deltas(deltas, target.office, target.role, target.active)
+    adjust_org_headcounts(connection, deltas)
+
+
+@event.listens_for(User, "after_delete")
+def after_delete_headcounts(mapper, connection, target):
+    """
+    Removes a deleted user from the headcounts.
+    """
+    if target.deleted_at is None:
+        deltas = {}
+        add_headcount_deltas(deltas, target.office, target.role, target.active, sign=-1)
+        adjust_org_headcounts(connection, deltas)
+
+
+def detach_office_headcounts(connection, codes: Iterable[str]) -> None:
+    """
+    Moves the users of offices that are about to be deleted to the headcounts without an office.
+
+    Must run before the users' office is cleared with a set-based UPDATE, which bypasses
+    the User listeners.
+
+    Args:
+        connection: The connection of the transaction deleting the offices.
+        codes (Iterable[str]): The codes of the offices being deleted.
+    """
+    users = User.__table__
+    rows = connection.execute(
+        select(users.c.office, users.c.role, users.c.active, func.count())
+        .where(users.c.office.in_(list(codes)), users.c.deleted_at.is_(None))
+        .group_by(users.c.office, users.c.role, users.c.active)
+    ).all()
+    deltas = {}
+    for office, role, active, count in rows:
+        add_headcount_deltas(deltas, office, role, active, sign=-1, count=count)
+        add_headcount_deltas(deltas, None, role, active, count=count)
+    adjust_org_headcounts(connection, deltas)
@@ -0,0 +1,95 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from src.features.users.models.api_keys import ApiKey
+from datetime import datetime
+from typing import List, Optional
+
+
+class ApiKeyRepository:
+    """
+    Repository class for performing database operations on ApiKey entities.
+    """
+
+    @staticmethod
+    async def get_by_digest(db: AsyncSession, key_digest: str) -> Optional[ApiKey]:
+        """
+        Fetch an API key by the digest of its value, using the unique index.
+
+        Args:
+            db (AsyncSession): The database session.
+            key_digest (str): The SHA-256 digest of the key.
+
+        Returns:
+            Optional[ApiKey]: The ApiKey instance if found, otherwise None.
+        """
+        result = await db.execute(select(ApiKey).where(ApiKey.key_digest == key_digest))
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def get_by_id(db: AsyncSession, api_key_id: int) -> Optional[ApiKey]:
+        """
+        Fetch an API key by id.
+
+        Args:
+            db (AsyncSession): The database session.
+            api_key_id (int): The unique identifier of the key.
+
+        Returns:
+            Optional[ApiKey]: The ApiKey instance if found, otherwise None.
+        """
+        return await db.get(ApiKey, api_key_id)
+
+    @staticmethod
+    async def get_all(db: AsyncSession, active: Optional[bool] = None) -> List[ApiKey]:
+        """
+        Fetch all API keys, newest first.
+
+        Args:
+            db (AsyncSession): The database session.
+            active (Optional[bool]): Filter by active status.
+
+        Returns:
+            List[ApiKey]: The API keys.
+        """
+        query = select(ApiKey).order_by(ApiKey.id.desc())
+        if active is not None:
+            query = query.where(ApiKey.active == active)
+        result = await db.execute(query)
+        return result.scalars().all()
+
+    @staticmethod
+    async def create(db: AsyncSession, values: dict) -> ApiKey:
+        """
+        Create a new API key.
+
+        Args:
+            db (AsyncSession): The database session.
+            values (dict): Column values of the key, including its digest.
+
+        Returns:
+            ApiKey: The created ApiKey instance.
+        """
+        api_key = ApiKey(**values)
+        db.add(api_key)
+        await db.commit()
+        await db.refresh(api_key)
+        return api_key
+
+    @staticmethod
+    async def revoke(db: AsyncSession, api_key: ApiKey) -> ApiKey:
+        """
+        Deactivate an API key.
+
+        Args:
+            db (AsyncSession): The database session.
+            api_key (ApiKey): The key to revoke.
+
+        Returns:
+            ApiKey: The revoked ApiKey instance.
+        """
+        if api_key.active:
+            api_key.active = False
+            api_key.revoked_at = datetime.utcnow()
+            await db.commit()
+            await db.refresh(api_key)
+        return api_key
@@ -0,0 +1,90 @@
+from sqlalchemy import delete, func, select, tuple_
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from src.features.users.models.org_headcounts import OrgHeadcount, ANY, add_headcount_deltas
+from src.features.users.models.users import User
+from datetime import datetime
+from typing import Dict, Iterable, List, Tuple
+
+
+class OrgHeadcountRepository:
+    """
+    Repository class for reading and reconciling the per-office and per-role headcounts.
+    """
+
+    @staticmethod
+    async def get_office_counts(db: AsyncSession, codes: Iterable[str]) -> Dict[str, int]:
+        """
+        Fetch the number of users of each office with one primary-key lookup per office.
+
+        Args:
+            db (AsyncSession): The database session.
+            codes (Iterable[str]): The office codes.
+
+        Returns:
+            Dict[str, int]: The number of users (not soft-deleted) per office code; offices
+                without users are omitted.
+        """
+        codes = list(codes)
+        if not codes:
+            return {}
+        result = await db.execute(
+            select(OrgHeadcount.office, OrgHeadcount.total)
+            .where(tuple_(OrgHeadcount.office, OrgHeadcount.role).in_([(code, ANY) for code in codes]))
+        )
+        return dict(result.all())
+
+    @staticmethod
+    async def reconcile(conn: AsyncConnection) -> List[Tuple[str, str]]:
+        """
+        Recompute the headcounts from the users table and correct any that drifted.
+
+        The headcount rows are locked first, so user writes that adjust them wait until the
+        recount commits; since the recount then reads a snapshot taken after the lock, each
+        write is reflected either in the snapshot or in its own later adjustment, never both.
+
+        Args:
+            conn (AsyncConnection): A connection holding the reconcile lock.
+
+        Rows that have dropped to zero are removed as well, but not reported as drift.
+
+        Returns:
+            List[Tuple[str, str]]: The (office, role) keys that were corrected.
+        """
+        async with conn.begin():
+            result = await conn.execute(
+                select(OrgHeadcount.office, OrgHeadcount.role, OrgHeadcount.total, OrgHeadcount.active)
+                .with_for_update()
+            )
+            stored = {(office, role): [total, active] for office, role, total, active in result.all()}
+
+            users = User.__table__
+            result = await conn.execute(
+                select(users.c.office, users.c.role, users.c.active, func.count())
+                .where(users.c.deleted_at.is_(None))
+                .group_by(users.c.office, users.c.role, users.c.active)
+            )
+            expected = {(ANY, ANY): [0, 0]}
+            for office, role, active, count in result.all():
+                add_headcount_deltas(expected, office, role, active, count=count)
+
+            now = datetime.utcnow()
+            drifted = [key for key, counts in expected.items() if stored.get(key) != counts]
+            stale = [key for key in stored if key not in expected]
+            table = OrgHeadcount.__table__
+            if drifted:
+                statement = insert(table).values([
+                    {"office": office, "role": role, "total": expected[office, role][0],
+                     "active": expected[office, role][1], "updated_at": now}
+                    for office, role in drifted
+                ])
+                await conn.execute(
+                    statement.on_duplicate_key_update(
+                        total=statement.inserted.total,
+                        active=statement.inserted.active,
+                        updated_at=statement.inserted.updated_at,
+                    )
+                )
+            if stale:
+                await conn.execute(delete(table).where(tuple_(table.c.office, table.c.role).in_(stale)))
+        return drifted + [key for key in stale if stored[key] != [0, 0]]
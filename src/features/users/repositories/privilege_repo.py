@@ -0,0 +1,79 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from src.features.users.models.privileges import Privilege
+from src.features.users.schemas.privilege_schemas import PrivilegeCreate
+from typing import Iterable, List, Optional, Set
+
+
+class PrivilegeRepository:
+    """
+    Repository class for performing CRUD operations on Privilege entities.
+    """
+
+    @staticmethod
+    async def get_all(db: AsyncSession) -> List[Privilege]:
+        """
+        Fetch all privileges ordered by name.
+
+        Args:
+            db (AsyncSession): The database session.
+
+        Returns:
+            List[Privilege]: The privileges.
+        """
+        result = await db.execute(select(Privilege).order_by(Privilege.privilege))
+        return result.scalars().all()
+
+    @staticmethod
+    async def get_by_privilege(db: AsyncSession, privilege: str) -> Optional[Privilege]:
+        """
+        Fetch a privilege by its identifier.
+
+        Args:
+            db (AsyncSession): The database session.
+            privilege (str): The unique identifier of the privilege.
+
+        Returns:
+            Optional[Privilege]: The Privilege instance if found, otherwise None.
+        """
+        result = await db.execute(select(Privilege).where(Privilege.privilege == privilege))
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def get_existing(db: AsyncSession, privileges: Iterable[str]) -> Set[str]:
+        """
+        Find which of the given privileges exist, in one query.
+
+        Args:
+            db (AsyncSession): The database session.
+            privileges (Iterable[str]): The privileges to check.
+
+        Returns:
+            Set[str]: The privileges that exist.
+        """
+        privileges = set(privileges)
+        if not privileges:
+            return set()
+        result = await db.execute(select(Privilege.privilege).where(Privilege.privilege.in_(privileges)))
+        return set(result.scalars().all())
+
+    @staticmethod
+    async def create(db: AsyncSession, data: PrivilegeCreate) -> Privilege:
+        """
+        Create a new privilege.
+
+        A privilege nobody is granted yet changes no role's effective privileges, so the
+        authorization version is not bumped.
+
+        Args:
+            db (AsyncSession): The database session.
+            data (PrivilegeCreate): The data for the new privilege.
+
+        Returns:
+            Privilege: The created privilege.
+        """
+        privilege = Privilege(**data.dict())
+        db.add(privilege)
+        await db.commit()
+        await db.refresh(privilege)
+        return privilege
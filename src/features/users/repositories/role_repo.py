@@ -0,0 +1,170 @@
+from sqlalchemy import insert, delete
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from src.features.users.models.roles import Role
+from src.features.users.models.role_privileges import RolePrivilege
+from src.features.users.models.authz_versions import AuthzVersion, AUTHZ_VERSION_ID, bump_authz_version_statement
+from src.features.users.schemas.role_schemas import RoleCreate, RoleUpdate
+from datetime import datetime
+from typing import Iterable, List, Optional, Set, Tuple
+
+
+async def bump_authz_version(db: AsyncSession) -> int:
+    """
+    Increment the authorization version within the current transaction.
+
+    The UPDATE locks the version row until commit, so authorization changes are applied
+    one at a time and versions follow commit order.
+
+    Returns:
+        int: The new version.
+    """
+    await db.execute(bump_authz_version_statement())
+    result = await db.execute(select(AuthzVersion.version).where(AuthzVersion.id == AUTHZ_VERSION_ID))
+    return result.scalar_one()
+
+
+class RoleRepository:
+    """
+    Repository class for performing CRUD operations on Role entities and their grants.
+    """
+
+    @staticmethod
+    async def get_all(db: AsyncSession) -> List[Role]:
+        """
+        Fetch all roles ordered by name.
+
+        Args:
+            db (AsyncSession): The database session.
+
+        Returns:
+            List[Role]: The roles.
+        """
+        result = await db.execute(select(Role).order_by(Role.role))
+        return result.scalars().all()
+
+    @staticmethod
+    async def get_by_role(db: AsyncSession, role: str) -> Optional[Role]:
+        """
+        Fetch a role by its identifier.
+
+        Args:
+            db (AsyncSession): The database session.
+            role (str): The unique identifier of the role.
+
+        Returns:
+            Optional[Role]: The Role instance if found, otherwise None.
+        """
+        result = await db.execute(select(Role).where(Role.role == role))
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def create(db: AsyncSession, data: RoleCreate) -> Tuple[Role, int]:
+        """
+        Create a new role.
+
+        Args:
+            db (AsyncSession): The database session.
+            data (RoleCreate): The data for the new role.
+
+        Returns:
+            Tuple[Role, int]: The created role and the new authorization version.
+        """
+        version = await bump_authz_version(db)
+        role = Role(**data.dict())
+        db.add(role)
+        try:
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            raise
+        await db.refresh(role)
+        return role, version
+
+    @staticmethod
+    async def update(db: AsyncSession, role: Role, data: RoleUpdate) -> Tuple[Role, int]:
+        """
+        Update the description and parent of a role.
+
+        Args:
+            db (AsyncSession): The database session.
+            role (Role): The role to update.
+            data (RoleUpdate): The new values.
+
+        Returns:
+            Tuple[Role, int]: The updated role and the new authorization version.
+        """
+        version = await bump_authz_version(db)
+        for key, value in data.dict().items():
+            setattr(role, key, value)
+        try:
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            raise
+        await db.refresh(role)
+        return role, version
+
+    @staticmethod
+    async def get_privileges(db: AsyncSession, role: str) -> Set[str]:
+        """
+        Fetch the privileges granted directly to a role.
+
+        Args:
+            db (AsyncSession): The database session.
+            role (str): The unique identifier of the role.
+
+        Returns:
+            Set[str]: The privileges.
+        """
+        result = await db.execute(select(RolePrivilege.privilege).where(RolePrivilege.role == role))
+        return set(result.scalars().all())
+
+    @staticmethod
+    async def replace_privileges(
+        db: AsyncSession, role: str, privileges: Iterable[str]
+    ) -> Tuple[List[str], List[str], Optional[int]]:
+        """
+        Replace the privileges granted directly to a role with a new set.
+
+        Only the difference is written: one multi-row INSERT for new grants and one DELETE
+        for revoked ones, committed together with the version bump. If the grants already
+        match, nothing is written and the version is not bumped.
+
+        Args:
+            db (AsyncSession): The database session.
+            role (str): The unique identifier of the role.
+            privileges (Iterable[str]): The complete set of privileges to grant.
+
+        Returns:
+            Tuple[List[str], List[str], Optional[int]]: The added and removed privileges and
+            the new authorization version, or None if nothing changed.
+        """
+        privileges = set(privileges)
+        if await RoleRepository.get_privileges(db, role) == privileges:
+            return [], [], None
+        try:
+            # Re-read under the version row lock, in case a concurrent change committed meanwhile
+            version = await bump_authz_version(db)
+            current = await RoleRepository.get_privileges(db, role)
+            added, removed = sorted(privileges - current), sorted(current - privileges)
+            now = datetime.utcnow()
+            if added:
+                await db.execute(
+                    insert(RolePrivilege.__table__).values(
+                        [{"role": role, "privilege": privilege, "created_at": now, "updated_at": now} for privilege in added]
+                    )
+                )
+            if removed:
+                await db.execute(
+                    delete(RolePrivilege.__table__).where(
+                        RolePrivilege.__table__.c.role == role,
+                        RolePrivilege.__table__.c.privilege.in_(removed),
+                    )
+                )
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+        return added, removed, version
@@ -0,0 +1,68 @@
+from sqlalchemy import and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.orm import selectinload
+from src.features.users.models.user_activity import UserActivity
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+
+class UserActivityRepository:
+    """
+    Repository class for reading UserActivity entries.
+    """
+
+    @staticmethod
+    async def get_page(
+        db: AsyncSession,
+        user_id: int,
+        before: Optional[Tuple[datetime, int]] = None,
+        limit: int = 50,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Tuple[List[UserActivity], Optional[Tuple[datetime, int]]]:
+        """
+        Fetch a user's activity, newest first, using seek pagination.
+
+        The (user_id, action_time) index, which carries the primary key, serves both the
+        filter and the (action_time, id) ordering, so every page is a short index range scan.
+        `since`/`until` additionally prune the monthly partitions that are read.
+
+        Args:
+            db (AsyncSession): The database session.
+            user_id (int): The unique identifier of the user.
+            before (Optional[Tuple[datetime, int]]): Return entries older than this
+                (action_time, id) position.
+            limit (int): The maximum number of entries to return.
+            since (Optional[datetime]): Only entries at or after this time.
+            until (Optional[datetime]): Only entries before this time.
+
+        Returns:
+            Tuple[List[UserActivity], Optional[Tuple[datetime, int]]]: The entries and the
+            position to pass as `before` for the next page, or None on the last page.
+        """
+        query = (
+            select(UserActivity)
+            .where(UserActivity.user_id == user_id)
+            .order_by(UserActivity.action_time.desc(), UserActivity.id.desc())
+            .limit(limit + 1)
+            .options(selectinload(UserActivity.agent))
+        )
+        if before is not None:
+            action_time, activity_id = before
+            query = query.where(
+                or_(
+                    UserActivity.action_time < action_time,
+                    and_(UserActivity.action_time == action_time, UserActivity.id < activity_id),
+                )
+            )
+        if since is not None:
+            query = query.where(UserActivity.action_time >= since)
+        if until is not None:
+            query = query.where(UserActivity.action_time < until)
+        result = await db.execute(query)
+        entries = result.scalars().all()
+        if len(entries) > limit:
+            last = entries[limit - 1]
+            return entries[:limit], (last.action_time, last.id)
+        return entries, None
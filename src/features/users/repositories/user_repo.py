@@ -0,0 +1,178 @@
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.orm import selectinload
+from src.features.users.models.users import User
+from src.features.users.models.org_headcounts import add_headcount_deltas, adjust_org_headcounts
+from src.features.users.models.roles import Role
+from src.features.offices.models.offices import Office
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+class UserRepository:
+    """
+    Repository class for performing database operations on User entities.
+    """
+
+    # Related entities resolved for every directory response
+    DETAILS = ("office", "role")
+
+    @staticmethod
+    def load_options() -> list:
+        """
+        Loader options resolving the office and role of a whole page of users
+        with one SELECT ... IN query each, instead of one query per user.
+        """
+        return [selectinload(User.office_relationship), selectinload(User.role_relationship)]
+
+    @staticmethod
+    async def get_by_id(db: AsyncSession, user_id: int) -> Optional[User]:
+        """
+        Fetch a user by id, with office and role details.
+
+        Args:
+            db (AsyncSession): The database session.
+            user_id (int): The unique identifier of the user.
+
+        Returns:
+            Optional[User]: The User instance if found and not deleted, otherwise None.
+        """
+        query = (
+            select(User)
+            .where(User.id == user_id, User.deleted_at.is_(None))
+            .options(*UserRepository.load_options())
+        )
+        result = await db.execute(query)
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def get_page(
+        db: AsyncSession,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        office: Optional[str] = None,
+        role: Optional[str] = None,
+        active: Optional[bool] = None,
+        locked: Optional[bool] = None,
+    ) -> Tuple[List[User], Optional[int]]:
+        """
+        Fetch a page of users ordered by id using keyset pagination.
+
+        Seeking past `after_id` costs the same on every page, unlike OFFSET. With an office
+        or role filter the (office, active) / (role, active) indexes serve the filter; they
+        carry the primary key, so they also serve the id ordering when `active` is given
+        too. Without it the matching rows are sorted by id.
+
+        Args:
+            db (AsyncSession): The database session.
+            after_id (Optional[int]): Return users with an id greater than this.
+            limit (int): The maximum number of users to return.
+            office (Optional[str]): Filter by office code.
+            role (Optional[str]): Filter by role.
+            active (Optional[bool]): Filter by active status.
+            locked (Optional[bool]): Filter by locked status.
+
+        Returns:
+            Tuple[List[User], Optional[int]]: The users and the `after_id` of the next page,
+            or None if this is the last page.
+        """
+        query = (
+            select(User)
+            .where(User.deleted_at.is_(None))
+            .order_by(User.id)
+            .limit(limit + 1)
+            .options(*UserRepository.load_options())
+        )
+        if after_id is not None:
+            query = query.where(User.id > after_id)
+        if office is not None:
+            query = query.where(User.office == office)
+        if role is not None:
+            query = query.where(User.role == role)
+        if active is not None:
+            query = query.where(User.active == active)
+        if locked is not None:
+            query = query.where(User.is_locked == locked)
+        result = await db.execute(query)
+        users = result.scalars().all()
+        if len(users) > limit:
+            return users[:limit], users[limit - 1].id
+        return users, None
+
+    @staticmethod
+    async def get_existing_loginids(db: AsyncSession, loginids: Iterable[str]) -> Set[str]:
+        """
+        Find which of the given login IDs are already taken, in one query.
+
+        Args:
+            db (AsyncSession): The database session.
+            loginids (Iterable[str]): The login IDs to check.
+
+        Returns:
+            Set[str]: The login IDs that already exist.
+        """
+        loginids = set(loginids)
+        if not loginids:
+            return set()
+        result = await db.execute(select(User.loginid).where(User.loginid.in_(loginids)))
+        return set(result.scalars().all())
+
+    @staticmethod
+    async def get_missing_references(
+        db: AsyncSession, roles: Iterable[str], offices: Iterable[str]
+    ) -> Tuple[Set[str], Set[str]]:
+        """
+        Find which of the given roles and office codes do not exist, with one query each.
+
+        Args:
+            db (AsyncSession): The database session.
+            roles (Iterable[str]): The roles referenced by new users.
+            offices (Iterable[str]): The office codes referenced by new users.
+
+        Returns:
+            Tuple[Set[str], Set[str]]: The unknown roles and the unknown office codes.
+        """
+        roles, offices = set(roles), set(offices)
+        if roles:
+            result = await db.execute(select(Role.role).where(Role.role.in_(roles)))
+            roles -= set(result.scalars().all())
+        if offices:
+            result = await db.execute(
+                select(Office.code).where(Office.code.in_(offices), Office.deleted_at.is_(None))
+            )
+            offices -= set(result.scalars().all())
+        return roles, offices
+
+    @staticmethod
+    async def insert_many(db: AsyncSession, users: List[dict]) -> Dict[str, int]:
+        """
+        Insert many users with a single multi-row INSERT and commit.
+
+        Args:
+            db (AsyncSession): The database session.
+            users (List[dict]): Column values of the users, with passwords already hashed.
+
+        Returns:
+            Dict[str, int]: The id of each inserted user, keyed by login ID.
+
+        Raises:
+            IntegrityError: If a row conflicts with a concurrent write; nothing is inserted.
+        """
+        if not users:
+            return {}
+        # The multi-row INSERT bypasses the User listeners, so adjust the headcounts here
+        deltas = {}
+        for user in users:
+            if user.get("deleted_at") is None:
+                add_headcount_deltas(deltas, user.get("office"), user.get("role"), user.get("active", False))
+        try:
+            await db.execute(insert(User.__table__).values(users))
+            await db.run_sync(lambda session: adjust_org_headcounts(session.connection(), deltas))
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+        result = await db.execute(
+            select(User.loginid, User.id).where(User.loginid.in_([user["loginid"] for user in users]))
+        )
+        return {loginid: user_id for loginid, user_id in result.all()}
@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends
+from typing import List, Optional
+from src.features.auth.services.api_key_service import get_all_api_keys, create_api_key, revoke_api_key
+from src.features.users.schemas.api_key_schemas import ApiKeyCreate, ApiKeyResponse, ApiKeyCreated
+from src.features.auth.dependencies import require_privilege
+from src.core.db import get_db
+
+router = APIRouter()
+
+@router.get("", response_model=List[ApiKeyResponse], dependencies=[Depends(require_privilege("APIKEY_R"))])
+async def read_api_keys(active: Optional[bool] = None, db=Depends(get_db)):
+    """
+    Retrieve all API keys.
+    """
+    return await get_all_api_keys(db, active)
+
+@router.post("", response_model=ApiKeyCreated, status_code=201)
+async def create_api_key_endpoint(
+    data: ApiKeyCreate, db=Depends(get_db), claims: dict = Depends(require_privilege("APIKEY_W"))
+):
+    """
+    Create an API key; its value is returned only in this response.
+    """
+    return await create_api_key(db, data, claims)
+
+@router.delete("/{api_key_id}", response_model=ApiKeyResponse, dependencies=[Depends(require_privilege("APIKEY_W"))])
+async def revoke_api_key_endpoint(api_key_id: int, db=Depends(get_db)):
+    """
+    Revoke an API key.
+    """
+    return await revoke_api_key(db, api_key_id)
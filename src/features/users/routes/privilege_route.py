@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends
+from typing import List
+from src.features.users.services.privilege_service import get_all_privileges, create_privilege
+from src.features.users.schemas.privilege_schemas import PrivilegeCreate, PrivilegeResponse
+from src.features.auth.dependencies import require_privilege
+from src.core.db import get_db
+
+router = APIRouter()
+
+@router.get("", response_model=List[PrivilegeResponse], dependencies=[Depends(require_privilege("ROLE_R"))])
+async def read_privileges(db=Depends(get_db)):
+    """
+    Retrieve all privileges.
+    """
+    return await get_all_privileges(db)
+
+@router.post(
+    "",
+    response_model=PrivilegeResponse,
+    status_code=201,
+    dependencies=[Depends(require_privilege("ROLE_W"))],
+)
+async def create_privilege_endpoint(data: PrivilegeCreate, db=Depends(get_db)):
+    """
+    Create a new privilege.
+    """
+    return await create_privilege(db, data)
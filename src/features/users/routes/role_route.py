@@ -0,0 +1,63 @@
+from fastapi import APIRouter, Depends
+from typing import List
+from src.features.users.services.role_service import (
+    get_all_roles,
+    create_role,
+    update_role,
+    get_role_privileges,
+    replace_role_privileges,
+)
+from src.features.users.schemas.role_schemas import (
+    RoleCreate,
+    RoleUpdate,
+    RoleResponse,
+    RolePrivilegesUpdate,
+    RolePrivilegesResponse,
+)
+from src.features.auth.dependencies import require_privilege
+from src.core.db import get_db
+
+router = APIRouter()
+
+@router.get("", response_model=List[RoleResponse], dependencies=[Depends(require_privilege("ROLE_R"))])
+async def read_roles(db=Depends(get_db)):
+    """
+    Retrieve all roles with their effective privileges.
+    """
+    return await get_all_roles(db)
+
+@router.post("", response_model=RoleResponse, status_code=201, dependencies=[Depends(require_privilege("ROLE_W"))])
+async def create_role_endpoint(data: RoleCreate, db=Depends(get_db)):
+    """
+    Create a new role.
+    """
+    return await create_role(db, data)
+
+@router.put("/{role}", response_model=RoleResponse, dependencies=[Depends(require_privilege("ROLE_W"))])
+async def update_role_endpoint(role: str, data: RoleUpdate, db=Depends(get_db)):
+    """
+    Update the description and parent of a role.
+    """
+    return await update_role(db, role, data)
+
+@router.get(
+    "/{role}/privileges",
+    response_model=RolePrivilegesResponse,
+    dependencies=[Depends(require_privilege("ROLE_R"))],
+)
+async def read_role_privileges(role: str, db=Depends(get_db)):
+    """
+    Retrieve the direct and effective privileges of a role.
+    """
+    return await get_role_privileges(db, role)
+
+@router.put(
+    "/{role}/privileges",
+    response_model=RolePrivilegesResponse,
+    dependencies=[Depends(require_privilege("ROLE_W"))],
+)
+async def replace_role_privileges_endpoint(role: str, data: RolePrivilegesUpdate, db=Depends(get_db)):
+    """
+    Replace the set of privileges granted directly to a role.
+    """
+    return await replace_role_privileges(db, role, data.privileges)
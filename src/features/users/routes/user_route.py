@@ -0,0 +1,81 @@
+from fastapi import APIRouter, Depends, Query, UploadFile, File
+from typing import List, Optional
+from datetime import datetime
+from src.features.users.services.user_service import (
+    get_user_by_id,
+    get_users_page,
+    get_user_activity,
+    create_users_bulk,
+    import_users_from_file,
+)
+from src.features.users.schemas.user_schemas import (
+    UserCreate,
+    UserResponse,
+    UserPage,
+    UserImportReport,
+    UserActivityPage,
+)
+from src.core.db import get_db
+from src.features.auth.dependencies import require_privilege, require_self_or_privilege
+
+router = APIRouter()
+
+@router.post("/bulk", response_model=UserImportReport)
+async def create_users_bulk_endpoint(
+    data: List[UserCreate], db=Depends(get_db), claims: dict = Depends(require_privilege("USER_W"))
+):
+    """
+    Create several users at once and report the outcome of every row.
+    """
+    return await create_users_bulk(db, data, claims)
+
+@router.post("/import", response_model=UserImportReport)
+async def import_users_endpoint(
+    file: UploadFile = File(...), db=Depends(get_db), claims: dict = Depends(require_privilege("USER_W"))
+):
+    """
+    Create users from a CSV or XLSX file and report the outcome of every row.
+    """
+    return await import_users_from_file(file, db, claims)
+
+@router.get("", response_model=UserPage, dependencies=[Depends(require_privilege("USER_R"))])
+async def read_users(
+    db=Depends(get_db),
+    after_id: Optional[int] = None,
+    limit: int = Query(50, ge=1, le=500),
+    office: Optional[str] = None,
+    role: Optional[str] = None,
+    active: Optional[bool] = None,
+    locked: Optional[bool] = None,
+):
+    """
+    Retrieve a page of users with optional filtering; pass `next_after_id` to continue.
+    """
+    return await get_users_page(db, after_id, limit, office, role, active, locked)
+
+@router.get("/{user_id}", response_model=UserResponse, dependencies=[Depends(require_privilege("USER_R"))])
+async def read_user(user_id: int, db=Depends(get_db)):
+    """
+    Retrieve a user by id.
+    """
+    return await get_user_by_id(db, user_id)
+
+@router.get(
+    "/{user_id}/activity",
+    response_model=UserActivityPage,
+    dependencies=[Depends(require_self_or_privilege("USER_R"))],
+)
+async def read_user_activity(
+    user_id: int,
+    db=Depends(get_db),
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+):
+    """
+    Retrieve a user's activity, newest first; pass `next_cursor` to continue.
+
+    Users may read their own activity; other users' activity requires USER_R.
+    """
+    return await get_user_activity(db, user_id, cursor, limit, since, until)
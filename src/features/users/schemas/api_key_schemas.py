@@ -0,0 +1,37 @@
+from pydantic import BaseModel, Field
+from typing import Optional, List
+from datetime import datetime
+
+
+class ApiKeyCreate(BaseModel):
+    """
+    Schema for creating an API key.
+    """
+    name: str = Field(..., min_length=1, max_length=48, description="Name of the client or integration")
+    privileges: List[str] = Field(..., description="Privileges granted to the key")
+    expires_at: Optional[datetime] = Field(None, description="When the key stops working; never if omitted")
+
+
+class ApiKeyResponse(BaseModel):
+    """
+    Schema for an API key; the key itself is never returned after creation.
+    """
+    id: int = Field(..., description="Unique identifier for the API key")
+    name: str = Field(..., description="Name of the client or integration")
+    key_prefix: str = Field(..., description="First characters of the key, for identification")
+    privileges: List[str] = Field(..., description="Privileges granted to the key")
+    active: bool = Field(..., description="False once the key is revoked")
+    expires_at: Optional[datetime] = Field(None, description="When the key stops working")
+    created_by: Optional[int] = Field(None, description="ID of the user who created the key")
+    created_at: datetime = Field(..., description="Creation timestamp")
+    revoked_at: Optional[datetime] = Field(None, description="Revocation timestamp")
+
+    class Config:
+        orm_mode = True
+
+
+class ApiKeyCreated(ApiKeyResponse):
+    """
+    Schema for a newly created API key, including its value.
+    """
+    key: str = Field(..., description="The API key; send it in the X-API-Key header. It is shown only once")
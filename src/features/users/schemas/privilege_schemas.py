@@ -0,0 +1,26 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+from datetime import datetime
+
+
+class PrivilegeBase(BaseModel):
+    privilege: str = Field(..., min_length=1, max_length=24, description="Unique identifier for the privilege")
+    tag: Optional[str] = Field(None, max_length=24, description="Grouping tag (e.g., 'USER_MANAGEMENT')")
+    description: Optional[str] = Field(None, max_length=64, description="What the privilege allows")
+
+
+class PrivilegeCreate(PrivilegeBase):
+    """
+    Schema for creating a new privilege.
+    """
+
+
+class PrivilegeResponse(PrivilegeBase):
+    """
+    Schema for a privilege.
+    """
+    created_at: datetime = Field(..., description="Creation timestamp")
+    updated_at: datetime = Field(..., description="Last update timestamp")
+
+    class Config:
+        orm_mode = True
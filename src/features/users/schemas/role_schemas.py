@@ -0,0 +1,52 @@
+from pydantic import BaseModel, Field
+from typing import Optional, List
+from datetime import datetime
+
+
+class RoleBase(BaseModel):
+    description: Optional[str] = Field(None, max_length=64, description="Description of the role")
+    parent_role: Optional[str] = Field(None, max_length=24, description="Role whose privileges are inherited")
+
+
+class RoleCreate(RoleBase):
+    """
+    Schema for creating a new role.
+    """
+    role: str = Field(..., min_length=1, max_length=24, description="Unique identifier for the role")
+
+
+class RoleUpdate(RoleBase):
+    """
+    Schema for updating a role; the parent is replaced as given (null detaches it).
+    """
+
+
+class RoleResponse(RoleBase):
+    """
+    Schema for a role, with the privileges it grants directly or through inheritance.
+    """
+    role: str = Field(..., description="Unique identifier for the role")
+    effective_privileges: List[str] = Field(..., description="Privileges granted directly or inherited")
+    created_at: datetime = Field(..., description="Creation timestamp")
+    updated_at: datetime = Field(..., description="Last update timestamp")
+
+    class Config:
+        orm_mode = True
+
+
+class RolePrivilegesUpdate(BaseModel):
+    """
+    Schema for replacing the complete set of privileges granted directly to a role.
+    """
+    privileges: List[str] = Field(..., description="Privileges the role should grant directly")
+
+
+class RolePrivilegesResponse(BaseModel):
+    """
+    Schema for the privileges of a role and, after a replacement, what changed.
+    """
+    role: str = Field(..., description="Unique identifier for the role")
+    privileges: List[str] = Field(..., description="Privileges granted directly")
+    effective_privileges: List[str] = Field(..., description="Privileges granted directly or inherited")
+    added: List[str] = Field([], description="Privileges granted by this request")
+    removed: List[str] = Field([], description="Privileges revoked by this request")
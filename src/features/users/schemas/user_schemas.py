@@ -0,0 +1,118 @@
+from pydantic import BaseModel, Field, EmailStr
+from typing import Optional, Literal, List
+from datetime import datetime
+
+
+class UserOfficeDetail(BaseModel):
+    """
+    Schema for the office details embedded in a user response.
+    """
+    code: str = Field(..., description="Unique identifier for the office")
+    name: str = Field(..., description="Name of the office")
+    o_type: str = Field(..., description="Type of office")
+
+
+class UserRoleDetail(BaseModel):
+    """
+    Schema for the role details embedded in a user response.
+    """
+    role: str = Field(..., description="Unique identifier for the role")
+    description: Optional[str] = Field(None, description="Description of the role")
+
+
+class UserResponse(BaseModel):
+    """
+    Schema for a user returned by the directory API.
+    Credentials, OTPs and tokens are never exposed.
+    """
+    id: int = Field(..., description="Unique identifier for the user")
+    loginid: str = Field(..., description="Login ID of the user")
+    name: str = Field(..., description="Full name of the user")
+    mobile: Optional[str] = Field(None, description="Registered mobile number")
+    email: Optional[str] = Field(None, description="Registered email address")
+    gender: Optional[str] = Field(None, description="Gender of the user")
+    profile_pic_url: Optional[str] = Field(None, description="URL to the profile picture")
+    lang_pref: Optional[str] = Field(None, description="Preferred language")
+    tzone: Optional[str] = Field(None, description="Preferred timezone")
+    role: Optional[str] = Field(None, description="Role assigned to the user")
+    office: Optional[str] = Field(None, description="Office code of the user")
+    job_title: Optional[str] = Field(None, description="Job title of the user")
+    mobile_verified: bool = Field(..., description="Whether the mobile number is verified")
+    email_verified: bool = Field(..., description="Whether the email address is verified")
+    last_login_at: Optional[datetime] = Field(None, description="Last successful login")
+    is_locked: bool = Field(..., description="Whether the account is locked")
+    active: bool = Field(..., description="Whether the account is active")
+    created_at: datetime = Field(..., description="Creation timestamp")
+    updated_at: datetime = Field(..., description="Last update timestamp")
+    office_detail: Optional[UserOfficeDetail] = Field(None, description="Details of the user's office")
+    role_detail: Optional[UserRoleDetail] = Field(None, description="Details of the user's role")
+
+    class Config:
+        orm_mode = True
+
+
+class UserPage(BaseModel):
+    """
+    Schema for one page of the user directory.
+    """
+    items: List[UserResponse] = Field(..., description="Users on this page, ordered by id")
+    next_after_id: Optional[int] = Field(None, description="Pass as `after_id` to fetch the next page")
+
+
+class UserCreate(BaseModel):
+    """
+    Schema for provisioning a new user.
+    """
+    loginid: str = Field(..., min_length=1, max_length=16, description="Login ID of the user")
+    name: str = Field(..., min_length=1, max_length=48, description="Full name of the user")
+    password: str = Field(..., min_length=8, max_length=72, description="Initial plaintext password")
+    mobile: Optional[str] = Field(None, max_length=16, description="Registered mobile number")
+    email: Optional[EmailStr] = Field(None, description="Registered email address")
+    gender: Optional[Literal['MALE', 'FEMALE', 'TRANSGENDER']] = Field(None, description="Gender of the user")
+    lang_pref: Optional[str] = Field(None, max_length=16, description="Preferred language")
+    tzone: Optional[str] = Field(None, max_length=64, description="Preferred timezone")
+    role: Optional[str] = Field(None, max_length=24, description="Role assigned to the user")
+    office: Optional[str] = Field(None, max_length=16, description="Office code of the user")
+    job_title: Optional[str] = Field(None, max_length=24, description="Job title of the user")
+
+
+class UserImportRow(BaseModel):
+    """
+    Schema for the outcome of one row of a bulk user provisioning request.
+    """
+    row: int = Field(..., description="Position of the row in the request or file (1-based)")
+    loginid: Optional[str] = Field(None, description="Login ID of the row, when it could be read")
+    status: Literal['created', 'error'] = Field(..., description="Whether the user was created")
+    id: Optional[int] = Field(None, description="Identifier of the created user")
+    detail: Optional[str] = Field(None, description="Reason the row was rejected")
+
+
+class UserImportReport(BaseModel):
+    """
+    Schema for the per-row report of a bulk user provisioning request.
+    """
+    created: int = Field(..., description="Number of users created")
+    failed: int = Field(..., description="Number of rows rejected")
+    rows: List[UserImportRow] = Field(..., description="Outcome of every row, in input order")
+
+
+class UserActivityEntry(BaseModel):
+    """
+    Schema for one entry of a user's activity.
+    """
+    id: int = Field(..., description="Unique identifier for the activity record")
+    action: str = Field(..., description="Type of action (e.g., LOGIN, FAILED_LOGIN)")
+    action_time: datetime = Field(..., description="When the action was performed")
+    ip_address: Optional[str] = Field(None, description="IP address the action came from")
+    user_agent: Optional[str] = Field(None, description="User agent of the device used")
+
+    class Config:
+        orm_mode = True
+
+
+class UserActivityPage(BaseModel):
+    """
+    Schema for one page of a user's activity, newest first.
+    """
+    items: List[UserActivityEntry] = Field(..., description="Activity entries on this page")
+    next_cursor: Optional[str] = Field(None, description="Pass as `cursor` to fetch older entries")
@@ -0,0 +1,144 @@
+"""
+Partition maintenance for the monthly-partitioned `user_activity` table.
+
+Keeps a few empty monthly partitions ahead of the current month (split off the MAXVALUE
+catch-all) and enforces retention by dropping whole partitions that lie entirely before
+the cutoff, which is a metadata operation instead of a DELETE over millions of rows.
+
+Runs periodically as an app background job, or once from the command line:
+
+    python -m src.features.users.services.activity_partition_service
+"""
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+from src.core.config import settings
+from src.core.db import engine
+from datetime import datetime
+from typing import List, Optional, Tuple
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+TABLE = "user_activity"
+CATCH_ALL = "p_future"
+# Named lock ensuring only one worker changes partitions at a time
+LOCK_NAME = "user_activity_partitions"
+
+
+def _month_start(moment: datetime) -> datetime:
+    """
+    Truncate a timestamp to the first instant of its month.
+    """
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _add_months(month: datetime, count: int) -> datetime:
+    """
+    Shift a month start by a number of months (negative to go back).
+    """
+    index = month.year * 12 + month.month - 1 + count
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+async def get_partitions(conn: AsyncConnection) -> List[Tuple[str, Optional[datetime]]]:
+    """
+    List the partitions of the activity table with their exclusive upper bounds.
+
+    Args:
+        conn (AsyncConnection): The database connection.
+
+    Returns:
+        List[Tuple[str, Optional[datetime]]]: Partition names in order with their upper
+        bound, or None for the MAXVALUE partition.
+    """
+    result = await conn.execute(
+        text(
+            "SELECT PARTITION_NAME, PARTITION_DESCRIPTION FROM information_schema.PARTITIONS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND PARTITION_NAME IS NOT NULL "
+            "ORDER BY PARTITION_ORDINAL_POSITION"
+        ),
+        {"table": TABLE},
+    )
+    partitions = []
+    for name, description in result.all():
+        bound = None if description == "MAXVALUE" else datetime.fromisoformat(description.strip("'"))
+        partitions.append((name, bound))
+    return partitions
+
+
+async def add_future_partitions(conn: AsyncConnection, months_ahead: int) -> List[str]:
+    """
+    Split monthly partitions off the catch-all so that `months_ahead` future months exist.
+
+    The catch-all partition is normally empty, so reorganizing it moves no rows.
+
+    Args:
+        conn (AsyncConnection): The database connection.
+        months_ahead (int): Number of months after the current one to provision.
+
+    Returns:
+        List[str]: The names of the partitions created.
+    """
+    bounds = [bound for _, bound in await get_partitions(conn) if bound is not None]
+    target = _add_months(_month_start(datetime.utcnow()), months_ahead + 1)
+    start = max(bounds) if bounds else _month_start(datetime.utcnow())
+
+    created, definitions = [], []
+    while start < target:
+        end = _add_months(start, 1)
+        name = f"p{start:%Y%m}"
+        created.append(name)
+        definitions.append(f"PARTITION `{name}` VALUES LESS THAN ('{end:%Y-%m-%d}')")
+        start = end
+    if definitions:
+        definitions.append(f"PARTITION `{CATCH_ALL}` VALUES LESS THAN (MAXVALUE)")
+        await conn.execute(
+            text(
+                f"ALTER TABLE `{TABLE}` REORGANIZE PARTITION `{CATCH_ALL}` INTO ({', '.join(definitions)})"
+            )
+        )
+    return created
+
+
+async def drop_expired_partitions(conn: AsyncConnection, retention_months: int) -> List[str]:
+    """
+    Drop the partitions holding only activity older than the retention period.
+
+    Args:
+        conn (AsyncConnection): The database connection.
+        retention_months (int): Number of whole months of activity to keep before the
+            current month.
+
+    Returns:
+        List[str]: The names of the partitions dropped.
+    """
+    cutoff = _add_months(_month_start(datetime.utcnow()), -retention_months)
+    expired = [name for name, bound in await get_partitions(conn) if bound is not None and bound <= cutoff]
+    if expired:
+        await conn.execute(
+            text(f"ALTER TABLE `{TABLE}` DROP PARTITION {', '.join(f'`{name}`' for name in expired)}")
+        )
+    return expired
+
+
+async def manage_activity_partitions() -> None:
+    """
+    Provision upcoming partitions and drop expired ones, unless another worker is already
+    doing so.
+    """
+    async with engine.connect() as conn:
+        acquired = (await conn.execute(text("SELECT GET_LOCK(:name, 0)"), {"name": LOCK_NAME})).scalar()
+        if not acquired:
+            return
+        try:
+            created = await add_future_partitions(conn, settings.activity_partitions_ahead)
+            dropped = await drop_expired_partitions(conn, settings.activity_retention_months)
+        finally:
+            await conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": LOCK_NAME})
+        if created or dropped:
+            logger.info("user_activity partitions created: %s; dropped: %s", created, dropped)
+
+
+if __name__ == "__main__":
+    asyncio.run(manage_activity_partitions())
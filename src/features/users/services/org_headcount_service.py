@@ -0,0 +1,44 @@
+"""
+Reconciliation of the `org_headcounts` summary against the users table.
+
+The headcounts are maintained incrementally on every user write; the reconcile corrects
+any drift from writes that bypassed the ORM (e.g., manual SQL or foreign key actions).
+
+Runs periodically as an app background job, or once from the command line:
+
+    python -m src.features.users.services.org_headcount_service
+"""
+from sqlalchemy import text
+from src.core.db import engine
+from src.features.users.repositories.org_headcount_repo import OrgHeadcountRepository
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Named lock ensuring only one worker reconciles at a time
+LOCK_NAME = "org_headcounts"
+
+
+async def reconcile_org_headcounts() -> None:
+    """
+    Correct headcounts that drifted from the users table, unless another worker is
+    already doing so.
+    """
+    async with engine.connect() as conn:
+        acquired = (await conn.execute(text("SELECT GET_LOCK(:name, 0)"), {"name": LOCK_NAME})).scalar()
+        # The lock belongs to the connection and outlives this transaction
+        await conn.commit()
+        if not acquired:
+            return
+        try:
+            corrected = await OrgHeadcountRepository.reconcile(conn)
+        finally:
+            await conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": LOCK_NAME})
+            await conn.commit()
+        if corrected:
+            logger.warning("org_headcounts drifted and were corrected for: %s", corrected)
+
+
+if __name__ == "__main__":
+    asyncio.run(reconcile_org_headcounts())
@@ -0,0 +1,38 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException
+from src.features.users.repositories.privilege_repo import PrivilegeRepository
+from src.features.users.schemas.privilege_schemas import PrivilegeCreate
+from typing import List
+
+
+async def get_all_privileges(db: AsyncSession) -> List[dict]:
+    """
+    Retrieve all privileges.
+
+    Args:
+        db (AsyncSession): The database session.
+
+    Returns:
+        List[dict]: The privileges as dictionaries.
+    """
+    privileges = await PrivilegeRepository.get_all(db)
+    return [privilege.to_dict() for privilege in privileges]
+
+async def create_privilege(db: AsyncSession, data: PrivilegeCreate) -> dict:
+    """
+    Create a new privilege.
+
+    Args:
+        db (AsyncSession): The database session.
+        data (PrivilegeCreate): The data for the new privilege.
+
+    Returns:
+        dict: The created privilege as a dictionary.
+
+    Raises:
+        HTTPException: If the privilege already exists.
+    """
+    if await PrivilegeRepository.get_by_privilege(db, data.privilege):
+        raise HTTPException(status_code=400, detail="Privilege already exists.")
+    privilege = await PrivilegeRepository.create(db, data)
+    return privilege.to_dict()
@@ -0,0 +1,166 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+from fastapi import HTTPException
+from src.features.users.models.roles import Role
+from src.features.users.repositories.role_repo import RoleRepository
+from src.features.users.repositories.privilege_repo import PrivilegeRepository
+from src.features.users.schemas.role_schemas import RoleCreate, RoleUpdate
+from src.features.auth.services.authz_service import privilege_resolver
+from typing import List
+
+
+def _role_dict(role: Role) -> dict:
+    """
+    Serialize a role with its effective privileges from the in-memory closure.
+    """
+    return {
+        **role.to_dict(),
+        "effective_privileges": sorted(privilege_resolver.privileges_for(role.role)),
+    }
+
+
+async def _check_parent(role: str, parent: str) -> None:
+    """
+    Validate a parent assignment against the latest committed hierarchy.
+
+    Raises:
+        HTTPException: If the parent does not exist or would create a cycle.
+    """
+    await privilege_resolver.ensure_loaded()
+    await privilege_resolver.sync()
+    try:
+        privilege_resolver.check_parent(role, parent)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+async def get_all_roles(db: AsyncSession) -> List[dict]:
+    """
+    Retrieve all roles with their effective privileges.
+
+    Args:
+        db (AsyncSession): The database session.
+
+    Returns:
+        List[dict]: The roles as dictionaries.
+    """
+    await privilege_resolver.ensure_loaded()
+    roles = await RoleRepository.get_all(db)
+    return [_role_dict(role) for role in roles]
+
+async def create_role(db: AsyncSession, data: RoleCreate) -> dict:
+    """
+    Create a new role, optionally inheriting from a parent role.
+
+    Args:
+        db (AsyncSession): The database session.
+        data (RoleCreate): The data for the new role.
+
+    Returns:
+        dict: The created role as a dictionary.
+
+    Raises:
+        HTTPException: If the role exists, the parent is invalid, or a concurrent change
+            conflicts with the write.
+    """
+    if await RoleRepository.get_by_role(db, data.role):
+        raise HTTPException(status_code=400, detail="Role already exists.")
+    await _check_parent(data.role, data.parent_role)
+    try:
+        role, version = await RoleRepository.create(db, data)
+    except IntegrityError as e:
+        # A concurrent create of the same role, or the parent was deleted meanwhile
+        raise HTTPException(
+            status_code=409, detail="Role already exists, or its parent role was deleted."
+        ) from e
+    privilege_resolver.set_role(role.role, role.parent_role)
+    privilege_resolver.applied(version)
+    return _role_dict(role)
+
+async def update_role(db: AsyncSession, role: str, data: RoleUpdate) -> dict:
+    """
+    Update the description and parent of a role.
+
+    Args:
+        db (AsyncSession): The database session.
+        role (str): The unique identifier of the role.
+        data (RoleUpdate): The new values.
+
+    Returns:
+        dict: The updated role as a dictionary.
+
+    Raises:
+        HTTPException: If the role does not exist, the parent is invalid, or a concurrent
+            change conflicts with the write.
+    """
+    existing = await RoleRepository.get_by_role(db, role)
+    if not existing:
+        raise HTTPException(status_code=404, detail="Role not found.")
+    await _check_parent(role, data.parent_role)
+    try:
+        updated, version = await RoleRepository.update(db, existing, data)
+    except IntegrityError as e:
+        # The parent was deleted meanwhile
+        raise HTTPException(status_code=409, detail="Parent role was deleted by another request.") from e
+    privilege_resolver.set_role(updated.role, updated.parent_role)
+    privilege_resolver.applied(version)
+    return _role_dict(updated)
+
+async def get_role_privileges(db: AsyncSession, role: str) -> dict:
+    """
+    Retrieve the direct and effective privileges of a role.
+
+    Args:
+        db (AsyncSession): The database session.
+        role (str): The unique identifier of the role.
+
+    Returns:
+        dict: The role with its direct and effective privileges.
+
+    Raises:
+        HTTPException: If the role does not exist.
+    """
+    if not await RoleRepository.get_by_role(db, role):
+        raise HTTPException(status_code=404, detail="Role not found.")
+    await privilege_resolver.ensure_loaded()
+    privileges = await RoleRepository.get_privileges(db, role)
+    return {
+        "role": role,
+        "privileges": sorted(privileges),
+        "effective_privileges": sorted(privilege_resolver.privileges_for(role)),
+    }
+
+async def replace_role_privileges(db: AsyncSession, role: str, privileges: List[str]) -> dict:
+    """
+    Replace the set of privileges granted directly to a role.
+
+    Args:
+        db (AsyncSession): The database session.
+        role (str): The unique identifier of the role.
+        privileges (List[str]): The complete set of privileges to grant.
+
+    Returns:
+        dict: The role with its new privileges and the added and removed grants.
+
+    Raises:
+        HTTPException: If the role or any of the privileges does not exist.
+    """
+    if not await RoleRepository.get_by_role(db, role):
+        raise HTTPException(status_code=404, detail="Role not found.")
+    requested = set(privileges)
+    unknown = requested - await PrivilegeRepository.get_existing(db, requested)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown privileges: {', '.join(sorted(unknown))}.")
+
+    await privilege_resolver.ensure_loaded()
+    added, removed, version = await RoleRepository.replace_privileges(db, role, requested)
+    privilege_resolver.set_grants(role, requested)
+    if version is not None:
+        privilege_resolver.applied(version)
+    return {
+        "role": role,
+        "privileges": sorted(requested),
+        "effective_privileges": sorted(privilege_resolver.privileges_for(role)),
+        "added": added,
+        "removed": removed,
+    }
@@ -0,0 +1,116 @@
+from sqlalchemy import func, insert
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.features.users.models.user_activity import UserActivity
+from src.features.users.models.user_agents import UserAgent
+from src.core.config import settings
+from datetime import datetime
+from typing import Dict, Optional
+import ipaddress
+
+
+class UserAgentCache:
+    """
+    Per-worker cache of interned user agent ids.
+
+    A few hundred user agents cover nearly all traffic, so after warm-up interning a user
+    agent is a dict lookup; a new agent costs one upsert that returns the id either way.
+    Ids are only cached through `remember` once the interning transaction has committed,
+    so a rolled-back insert cannot leave a dangling id behind.
+    """
+
+    def __init__(self, max_size: int):
+        """
+        Initializes an empty cache.
+
+        Args:
+            max_size (int): Maximum number of user agents cached; further ones are still
+                interned, just not cached.
+        """
+        self.max_size = max_size
+        self._ids: Dict[str, int] = {}
+
+    async def get_id(self, db: AsyncSession, user_agent: Optional[str]) -> Optional[int]:
+        """
+        Return the id of a user agent, interning it if it is new.
+
+        A newly interned id is not cached; pass it to `remember` after the commit.
+
+        Args:
+            db (AsyncSession): The database session; the insert joins its transaction.
+            user_agent (Optional[str]): The user agent string.
+
+        Returns:
+            Optional[int]: The user agent id, or None if no user agent was given.
+        """
+        if not user_agent:
+            return None
+        user_agent = user_agent[:255]
+        agent_id = self._ids.get(user_agent)
+        if agent_id is not None:
+            return agent_id
+
+        table = UserAgent.__table__
+        # LAST_INSERT_ID(id) makes the existing id the statement's lastrowid on a duplicate
+        result = await db.execute(
+            mysql_insert(table)
+            .values(user_agent=user_agent, created_at=datetime.utcnow())
+            .on_duplicate_key_update(id=func.last_insert_id(table.c.id))
+        )
+        return result.lastrowid
+
+    def remember(self, user_agent: Optional[str], agent_id: Optional[int]) -> None:
+        """
+        Cache the id of a user agent once the transaction that interned it has committed.
+
+        Args:
+            user_agent (Optional[str]): The user agent string, as passed to `get_id`.
+            agent_id (Optional[int]): The id returned by `get_id`.
+        """
+        if not user_agent or agent_id is None:
+            return
+        user_agent = user_agent[:255]
+        if user_agent not in self._ids and len(self._ids) < self.max_size:
+            self._ids[user_agent] = agent_id
+
+
+# Shared user agent cache for this worker
+user_agent_cache = UserAgentCache(settings.user_agent_cache_size)
+
+
+async def record_user_activity(
+    db: AsyncSession,
+    user_id: int,
+    action: str,
+    ip_address: Optional[str] = None,
+    user_agent: Optional[str] = None,
+) -> None:
+    """
+    Append an entry to a user's activity and commit.
+
+    Args:
+        db (AsyncSession): The database session.
+        user_id (int): The unique identifier of the user.
+        action (str): The action, one of ACTIVITY_ACTIONS (e.g., "LOGIN").
+        ip_address (str, optional): The client IP address; ignored if not a valid address.
+        user_agent (str, optional): The client user agent.
+    """
+    try:
+        ip_address = str(ipaddress.ip_address(ip_address)) if ip_address else None
+    except ValueError:
+        ip_address = None
+    now = datetime.utcnow()
+    agent_id = await user_agent_cache.get_id(db, user_agent)
+    await db.execute(
+        insert(UserActivity.__table__).values(
+            user_id=user_id,
+            action=action,
+            action_time=now,
+            ip_address=ip_address,
+            user_agent_id=agent_id,
+            created_at=now,
+            updated_at=now,
+        )
+    )
+    await db.commit()
+    user_agent_cache.remember(user_agent, agent_id)
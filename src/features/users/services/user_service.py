@@ -0,0 +1,288 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+from fastapi import HTTPException, UploadFile
+from src.features.users.repositories.user_repo import UserRepository
+from src.features.users.repositories.user_activity_repo import UserActivityRepository
+from src.features.users.schemas.user_schemas import UserCreate
+from src.core.config import settings
+from src.features.auth.services.authz_service import privilege_resolver, principal_privileges
+from src.core.security import get_hashes
+from typing import Iterator, List, Optional, Tuple
+from pydantic import ValidationError
+from openpyxl.utils.exceptions import InvalidFileException
+from datetime import datetime
+import base64
+import csv
+import io
+import openpyxl
+import zipfile
+
+
+def _error_row(row: int, loginid: Optional[str], detail: str) -> dict:
+    """
+    Build the report entry of a rejected row.
+    """
+    return {"row": row, "loginid": loginid, "status": "error", "id": None, "detail": detail}
+
+
+def _encode_activity_cursor(action_time: datetime, activity_id: int) -> str:
+    """
+    Encode an activity page position as an opaque URL-safe cursor.
+    """
+    raw = f"{action_time.isoformat()}|{activity_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_activity_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor produced by `_encode_activity_cursor` back into a page position.
+
+    Raises:
+        HTTPException: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        action_time, activity_id = raw.split("|", 1)
+        return datetime.fromisoformat(action_time), int(activity_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor.") from e
+
+
+def _iter_file_rows(filename: str, content: bytes) -> Iterator[Tuple[int, dict]]:
+    """
+    Yield the non-empty data rows of a CSV or XLSX user file as (row number, values).
+
+    The first row holds the column names, matching the UserCreate fields.
+
+    Raises:
+        HTTPException: If the file is neither UTF-8 CSV nor a valid XLSX workbook.
+    """
+    if filename.endswith(".csv"):
+        try:
+            text = content.decode("utf-8-sig")
+        except UnicodeDecodeError as e:
+            raise HTTPException(status_code=400, detail="The CSV file must be UTF-8 encoded.") from e
+        rows, workbook = iter(csv.reader(io.StringIO(text))), None
+    elif filename.endswith(".xlsx"):
+        try:
+            workbook = openpyxl.load_workbook(io.BytesIO(content), read_only=True, data_only=True)
+        except (InvalidFileException, zipfile.BadZipFile, KeyError) as e:
+            raise HTTPException(status_code=400, detail="The uploaded file is not a valid XLSX workbook.") from e
+        rows = workbook.active.iter_rows(values_only=True)
+    else:
+        raise HTTPException(status_code=400, detail="Invalid file format. Please upload a CSV or XLSX file.")
+
+    header = [str(name).strip().lower() if name is not None else None for name in next(rows, ())]
+    for row_number, row in enumerate(rows, start=2):
+        values = {
+            name: str(value).strip()
+            for name, value in zip(header, row)
+            if name in UserCreate.__fields__ and value is not None and str(value).strip() != ""
+        }
+        if values:
+            yield row_number, values
+    if workbook is not None:
+        workbook.close()
+
+
+def _read_users_file(filename: str, content: bytes) -> Tuple[List[Tuple[int, UserCreate]], List[dict]]:
+    """
+    Parse and validate the rows of a user import file.
+
+    Returns:
+        Tuple[List[Tuple[int, UserCreate]], List[dict]]: The valid users with their row
+        numbers and the report entries of the rows that failed validation.
+    """
+    users, errors = [], []
+    for row_number, values in _iter_file_rows(filename, content):
+        try:
+            users.append((row_number, UserCreate(**values)))
+        except ValidationError as e:
+            detail = "; ".join(
+                f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}" for error in e.errors()
+            )
+            errors.append(_error_row(row_number, values.get("loginid"), detail))
+    return users, errors
+
+
+async def _provision_users(
+    db: AsyncSession, users: List[Tuple[int, UserCreate]], report: List[dict], claims: dict
+) -> dict:
+    """
+    Validate, hash and insert numbered users chunk by chunk, appending to the report.
+
+    Each chunk costs one query for taken login IDs, one each for unknown roles and
+    offices, and one multi-row INSERT; passwords are hashed across the process pool.
+    Login IDs are compared case-insensitively, like the column's collation, and only
+    roles granting no privilege beyond the caller's own can be assigned.
+    """
+    await privilege_resolver.ensure_loaded()
+    held = principal_privileges(claims)
+    seen = set()
+    chunk_size = settings.user_import_chunk_size
+    for start in range(0, len(users), chunk_size):
+        chunk = users[start:start + chunk_size]
+        existing = {
+            loginid.casefold()
+            for loginid in await UserRepository.get_existing_loginids(db, (data.loginid for _, data in chunk))
+        }
+        missing_roles, missing_offices = await UserRepository.get_missing_references(
+            db,
+            (data.role for _, data in chunk if data.role),
+            (data.office for _, data in chunk if data.office),
+        )
+
+        valid = []
+        for row, data in chunk:
+            loginid = data.loginid.casefold()
+            if loginid in seen:
+                report.append(_error_row(row, data.loginid, "Duplicate login ID in this request."))
+            elif loginid in existing:
+                report.append(_error_row(row, data.loginid, "Login ID already exists."))
+            elif data.role in missing_roles:
+                report.append(_error_row(row, data.loginid, f"Role '{data.role}' does not exist."))
+            elif data.role and not privilege_resolver.privileges_for(data.role) <= held:
+                report.append(
+                    _error_row(row, data.loginid, f"Cannot assign role '{data.role}' with privileges you do not hold.")
+                )
+            elif data.office in missing_offices:
+                report.append(_error_row(row, data.loginid, f"Office '{data.office}' does not exist."))
+            else:
+                valid.append((row, data))
+            seen.add(loginid)
+
+        hashes = await get_hashes([data.password for _, data in valid])
+        now = datetime.utcnow()
+        values = [
+            {**data.dict(exclude={"password"}), "password": hashed, "last_passwd_change": now}
+            for (_, data), hashed in zip(valid, hashes)
+        ]
+        try:
+            ids = await UserRepository.insert_many(db, values)
+        except IntegrityError:
+            for row, data in valid:
+                report.append(_error_row(row, data.loginid, "Conflicted with a concurrent write; please retry."))
+            continue
+        for row, data in valid:
+            report.append(
+                {"row": row, "loginid": data.loginid, "status": "created", "id": ids.get(data.loginid), "detail": None}
+            )
+
+    report.sort(key=lambda entry: entry["row"])
+    created = sum(1 for entry in report if entry["status"] == "created")
+    return {"created": created, "failed": len(report) - created, "rows": report}
+
+async def get_user_by_id(db: AsyncSession, user_id: int) -> dict:
+    """
+    Retrieve a user by id, with office and role details.
+
+    Args:
+        db (AsyncSession): The database session.
+        user_id (int): The unique identifier of the user.
+
+    Returns:
+        dict: The user as a dictionary.
+
+    Raises:
+        HTTPException: If the user does not exist.
+    """
+    user = await UserRepository.get_by_id(db, user_id)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found.")
+    return user.to_dict(UserRepository.DETAILS)
+
+async def get_users_page(
+    db: AsyncSession,
+    after_id: Optional[int] = None,
+    limit: int = 50,
+    office: Optional[str] = None,
+    role: Optional[str] = None,
+    active: Optional[bool] = None,
+    locked: Optional[bool] = None,
+) -> dict:
+    """
+    Retrieve a page of the user directory.
+
+    Args:
+        db (AsyncSession): The database session.
+        after_id (int, optional): Return users with an id greater than this.
+        limit (int): The maximum number of users to return.
+        office (str, optional): Filter by office code.
+        role (str, optional): Filter by role.
+        active (bool, optional): Filter by active status.
+        locked (bool, optional): Filter by locked status.
+
+    Returns:
+        dict: The users on the page and the `after_id` of the next page.
+    """
+    users, next_after_id = await UserRepository.get_page(
+        db, after_id, limit, office, role, active, locked
+    )
+    return {
+        "items": [user.to_dict(UserRepository.DETAILS) for user in users],
+        "next_after_id": next_after_id,
+    }
+
+async def get_user_activity(
+    db: AsyncSession,
+    user_id: int,
+    cursor: Optional[str] = None,
+    limit: int = 50,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> dict:
+    """
+    Retrieve a page of a user's activity, newest first.
+
+    Args:
+        db (AsyncSession): The database session.
+        user_id (int): The unique identifier of the user.
+        cursor (str, optional): The `next_cursor` of the previous page.
+        limit (int): The maximum number of entries to return.
+        since (datetime, optional): Only entries at or after this time.
+        until (datetime, optional): Only entries before this time.
+
+    Returns:
+        dict: The entries on the page and the cursor of the next page.
+    """
+    before = _decode_activity_cursor(cursor) if cursor else None
+    entries, next_position = await UserActivityRepository.get_page(db, user_id, before, limit, since, until)
+    return {
+        "items": [entry.to_dict() for entry in entries],
+        "next_cursor": _encode_activity_cursor(*next_position) if next_position else None,
+    }
+
+async def create_users_bulk(db: AsyncSession, users: List[UserCreate], claims: dict) -> dict:
+    """
+    Provision many users at once.
+
+    Rows are processed independently: a rejected row is reported and does not stop the others.
+
+    Args:
+        db (AsyncSession): The database session.
+        users (List[UserCreate]): The users to create.
+        claims (dict): The authenticated principal creating the users.
+
+    Returns:
+        dict: The created and failed counts and the outcome of every row.
+    """
+    return await _provision_users(db, list(enumerate(users, start=1)), [], claims)
+
+async def import_users_from_file(file: UploadFile, db: AsyncSession, claims: dict) -> dict:
+    """
+    Provision users from a CSV or XLSX file.
+
+    Args:
+        file (UploadFile): The uploaded file; the first row holds the column names.
+        db (AsyncSession): The database session.
+        claims (dict): The authenticated principal importing the users.
+
+    Returns:
+        dict: The created and failed counts and the outcome of every row.
+
+    Raises:
+        HTTPException: If the file is not a UTF-8 CSV or a valid XLSX workbook.
+    """
+    file_content = await file.read()
+    users, errors = _read_users_file(file.filename, file_content)
+    return await _provision_users(db, users, errors, claims)
@@ -1,11 +1,52 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI, Query, Response
 from src.core.logging import setup_logging
 from src.core.constants import PROJECT_ROOT
+from src.core.config import settings
+from src.core.db import get_pool_status, query_stats
+from src.core.query_stats import QueryStatsMiddleware
+from src.core.metrics import MetricsMiddleware, mark_worker_dead, render_metrics
+from src.core.periodic import run_periodically
+from src.core.read_routing import ReadRoutingMiddleware
+from src.features.auth.services.revocation_service import token_revocation_list
+from src.features.auth.services.authz_service import privilege_resolver
+from src.features.auth.dependencies import require_privilege
+from src.features.users.services.activity_partition_service import manage_activity_partitions
+from src.features.analytics.services.activity_rollup_service import run_activity_rollups
+from src.features.users.services.org_headcount_service import reconcile_org_headcounts
 from src.routes import router as app_router
+import asyncio
 
 # Initialize logging
 setup_logging()
 
+# Background jobs run by every worker: (interval in seconds, coroutine function, name)
+BACKGROUND_JOBS = [
+    (settings.token_revocation_sync_seconds, token_revocation_list.sync, "token revocation sync"),
+    (settings.authz_sync_seconds, privilege_resolver.sync, "authorization sync"),
+    (settings.activity_partition_check_hours * 3600, manage_activity_partitions, "activity partition maintenance"),
+    (settings.activity_rollup_seconds, run_activity_rollups, "activity rollups"),
+    (settings.org_headcount_reconcile_minutes * 60, reconcile_org_headcounts, "headcount reconcile"),
+]
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Starts the background jobs when the app starts and cancels them on shutdown.
+
+    On shutdown the worker also withdraws its live metrics in multi-process mode.
+    """
+    tasks = [
+        asyncio.create_task(run_periodically(interval, job, name))
+        for interval, job, name in BACKGROUND_JOBS
+    ]
+    yield
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    mark_worker_dead()
+
 # Create the FastAPI app instance
 app = FastAPI(
     title="Trilp API",
@@ -16,9 +57,21 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
-    openapi_url="/openapi.json"
+    openapi_url="/openapi.json",
+    lifespan=lifespan,
 )
 
+# Send eligible reads to the read replica, if one is configured
+if settings.read_database_url:
+    app.add_middleware(ReadRoutingMiddleware, window_seconds=settings.read_your_writes_seconds)
+
+# Count the queries and database time of every request
+app.add_middleware(QueryStatsMiddleware, debug_headers=settings.sql_debug_headers)
+
+# Record request metrics; added last so the timing covers the other middleware
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
 # Include the central router from routes.py
 app.include_router(app_router)
 
@@ -37,6 +90,37 @@ async def root():
     """
     return {"message": f"Welcome to {app.title}!"}
 
+@app.get("/health/pool", tags=["Root"], dependencies=[Depends(require_privilege("SYS_ALL"))])
+async def pool_status():
+    """
+    Connection pool state and checkout statistics of the worker serving the request.
+
+    A growing `timeouts` count or a histogram shifting to long waits means requests are
+    starved of connections: raise DB_POOL_SIZE / DB_MAX_OVERFLOW or reduce concurrency.
+    Requires the SYS_ALL privilege.
+    """
+    return get_pool_status()
+
+@app.get("/health/queries", tags=["Root"], dependencies=[Depends(require_privilege("SYS_ALL"))])
+async def top_queries(
+    limit: int = Query(20, ge=1, le=500),
+    order_by: str = Query("total_ms", pattern="^(total_ms|count|mean_ms|max_ms)$"),
+):
+    """
+    The statement fingerprints of this worker with the highest total time (or count, mean, max).
+    Requires the SYS_ALL privilege.
+    """
+    return query_stats.top(limit, order_by)
+
+if settings.metrics_enabled:
+    @app.get("/metrics", tags=["Root"], include_in_schema=False)
+    async def metrics():
+        """
+        Request metrics in the Prometheus text format, aggregated across workers in multi-process mode.
+        """
+        content, media_type = render_metrics()
+        return Response(content=content, media_type=media_type)
+
 if __name__ == "__main__":
     import uvicorn
     # Optionally read environment variables for host and port, or use defaults
@@ -0,0 +1,97 @@
+from sqlalchemy import SmallInteger, LargeBinary
+from sqlalchemy.dialects.mysql import TINYINT, VARBINARY
+from sqlalchemy.types import TypeDecorator
+from typing import Dict
+import ipaddress
+
+
+class IPAddress(TypeDecorator):
+    """
+    Stores an IPv4 or IPv6 address as its packed binary form in a VARBINARY(16) column.
+
+    Python values are address strings (e.g., '203.0.113.7', '2001:db8::1'); IPv4 takes
+    4 bytes and IPv6 16 bytes instead of up to 48 characters.
+    """
+    impl = LargeBinary(16)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        """
+        Use VARBINARY(16) on MySQL.
+        """
+        if dialect.name == "mysql":
+            return dialect.type_descriptor(VARBINARY(16))
+        return dialect.type_descriptor(LargeBinary(16))
+
+    def process_bind_param(self, value, dialect):
+        """
+        Pack an address string into bytes.
+
+        Raises:
+            ValueError: If the value is not a valid IP address.
+        """
+        if value is None:
+            return None
+        return ipaddress.ip_address(value).packed
+
+    def process_result_value(self, value, dialect):
+        """
+        Unpack stored bytes into an address string.
+        """
+        if value is None:
+            return None
+        return str(ipaddress.ip_address(bytes(value)))
+
+
+class CodedString(TypeDecorator):
+    """
+    Stores a string from a fixed vocabulary as a small integer code.
+
+    Python values stay strings; the mapping is part of the schema, so codes must never
+    be reused or renumbered, only appended.
+    """
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, codes: Dict[str, int]):
+        """
+        Initializes the type with its vocabulary.
+
+        Args:
+            codes (Dict[str, int]): Code of each allowed string (0-255).
+        """
+        super().__init__()
+        # Kept hashable: SQLAlchemy builds statement cache keys from the constructor arguments
+        self.codes = tuple(sorted(codes.items(), key=lambda item: item[1]))
+        self._code_of = dict(self.codes)
+        self._name_of = {code: name for name, code in self.codes}
+
+    def load_dialect_impl(self, dialect):
+        """
+        Use an unsigned TINYINT on MySQL.
+        """
+        if dialect.name == "mysql":
+            return dialect.type_descriptor(TINYINT(unsigned=True))
+        return dialect.type_descriptor(SmallInteger())
+
+    def process_bind_param(self, value, dialect):
+        """
+        Translate a string into its code.
+
+        Raises:
+            ValueError: If the string is not part of the vocabulary.
+        """
+        if value is None:
+            return None
+        try:
+            return self._code_of[value]
+        except KeyError:
+            raise ValueError(f"Unknown value {value!r}; expected one of {sorted(self._code_of)}") from None
+
+    def process_result_value(self, value, dialect):
+        """
+        Translate a stored code back into its string.
+        """
+        if value is None:
+            return None
+        return self._name_of.get(value, f"UNKNOWN_{value}")
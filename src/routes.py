@@ -1,6 +1,11 @@
 from fastapi import APIRouter
 from src.features.auth.routes.auth_route import router as auth_router
 from src.features.offices.routes.office_route import router as office_router
+from src.features.users.routes.user_route import router as user_router
+from src.features.users.routes.role_route import router as role_router
+from src.features.users.routes.privilege_route import router as privilege_router
+from src.features.users.routes.api_key_route import router as api_key_router
+from src.features.analytics.routes.analytics_route import router as analytics_router
 # Add imports for other feature-specific routers here
 
 # Create the main router
@@ -9,4 +14,9 @@ router = APIRouter()
 # Include feature-specific routers
 router.include_router(auth_router, prefix="/api/v1/auth", tags=["Authentication"])
 router.include_router(office_router, prefix="/api/v1/offices", tags=["Offices"])
+router.include_router(user_router, prefix="/api/v1/users", tags=["Users"])
+router.include_router(role_router, prefix="/api/v1/roles", tags=["Roles"])
+router.include_router(privilege_router, prefix="/api/v1/privileges", tags=["Privileges"])
+router.include_router(api_key_router, prefix="/api/v1/api-keys", tags=["API Keys"])
+router.include_router(analytics_router, prefix="/api/v1/analytics", tags=["Analytics"])
 # Add more routers here as needed
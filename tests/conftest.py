@@ -0,0 +1,10 @@
+import os
+import tempfile
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+# The app reads its settings on import, so point it at a throwaway SQLite database first
+_database = os.path.join(tempfile.mkdtemp(prefix="trilpapi-tests-"), "test.db")
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{_database}")
+os.environ.setdefault("JWT_SECRET", "test-secret")
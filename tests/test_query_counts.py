@@ -0,0 +1,56 @@
+"""
+Pins the number of SQL statements issued by list endpoints, so an N+1 regression fails here.
+
+Tables are created from the models and seeded with Core inserts, which bypass the ORM
+listeners and their MySQL-only upserts; the endpoints under test only read.
+"""
+from datetime import datetime
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+from src.main import app
+from src.core.db import engine
+from src.core.testing import assert_query_count
+from src.models.base import Base
+from src.features.offices.models.offices import Office
+from src.features.offices.models.office_counts import OfficeCount
+from src.features.users.models.roles import Role
+from src.features.users.models.users import User
+import asyncio
+import pytest
+
+TABLES = [Role.__table__, Office.__table__, OfficeCount.__table__, User.__table__]
+
+
+async def _seed(offices: int, users_per_office: int) -> None:
+    now = datetime.utcnow()
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: Base.metadata.drop_all(sync_conn, tables=TABLES))
+        await conn.run_sync(lambda sync_conn: Base.metadata.create_all(sync_conn, tables=TABLES))
+        await conn.execute(insert(Office.__table__), [
+            {"code": f"HQ{index:06d}", "name": f"Office {index}", "o_type": "HQ", "version": 1, "created_at": now, "updated_at": now}
+            for index in range(offices)
+        ])
+        await conn.execute(insert(User.__table__), [
+            {
+                "id": index * users_per_office + number + 1,
+                "loginid": f"user{index}.{number}",
+                "name": f"User {index}.{number}",
+                "office": f"HQ{index:06d}",
+                "created_at": now,
+                "updated_at": now,
+            }
+            for index in range(offices)
+            for number in range(users_per_office)
+        ])
+
+
+@pytest.mark.parametrize("offices", [1, 10])
+def test_office_listing_with_users_is_constant(offices):
+    # One query for the page of offices and one for all of their users
+    asyncio.run(_seed(offices, users_per_office=3))
+    client = TestClient(app)
+    with assert_query_count(engine, 2):
+        response = client.get("/api/v1/offices", params={"limit": 50, "include": "users"})
+    assert response.status_code == 200
+    assert len(response.json()) == offices
+    assert all(len(office["users"]) == 3 for office in response.json())